@@ -11,12 +11,35 @@ Usage:
     result = interpolate_section_aero("NACA-2412", Re=300000, Mach=0.05)
     # result: {"cl_alpha_per_rad": ..., "cm_ac": ..., "cl_max": ...,
     #          "cd_min": ..., "cl_at_cd_min": ...}
+
+    # Span sweep: arrays in, arrays out
+    sweep = interpolate_section_aero_batch("NACA-2412", Re=re_array, Mach=0.05)
 """
 
+import functools
 import json
 import math
 import pathlib
 
+import numpy as np
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional -- stdlib json parses the same bytes
+    _json_loads = json.loads
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:  # SciPy is optional -- fall back to the brute-force scan
+    cKDTree = None
+
+try:
+    import numba
+except ImportError:  # Numba is optional -- fall back to the NumPy scan
+    numba = None
+
 # --------------------------------------------------------------------------
 # Module-level cache: stem -> full JSON document + processed grid arrays
 # --------------------------------------------------------------------------
@@ -65,6 +88,9 @@ AIRFOIL_NAME_MAP: dict[str, str] = {
     "AG 25": "ag25",
 }
 
+# Case-insensitive fallback for _stem_for_name
+_AIRFOIL_NAME_MAP_LOWER: dict[str, str] = {k.lower(): v for k, v in AIRFOIL_NAME_MAP.items()}
+
 # Keys to interpolate from each condition record
 _INTERPOLATED_KEYS = ("cl_alpha_per_rad", "cm_ac", "cl_max", "cd_min", "cl_at_cd_min")
 
@@ -74,16 +100,21 @@ _DATCOM_DIR = pathlib.Path(__file__).parent.parent / "datcom"
 # Number of nearest neighbors for IDW interpolation
 _K_NEIGHBORS = 4
 
+# Build a KD-tree for neighbor lookup only above this many conditions.  The
+# shipped tables have ~400 points, where a vectorized scan beats tree queries.
+_KDTREE_MIN_POINTS = 2048
+
+# (log Re, Mach) node counts of the precomputed table used by fast lookups
+_GRID_SHAPE = (64, 32)
+
 
 def _stem_for_name(airfoil_name: str) -> str:
     """Resolve airfoil display/hyphenated name to JSON file stem."""
     stem = AIRFOIL_NAME_MAP.get(airfoil_name)
     if stem is None:
         # Try case-insensitive lookup
-        lower = airfoil_name.lower()
-        for k, v in AIRFOIL_NAME_MAP.items():
-            if k.lower() == lower:
-                return v
+        stem = _AIRFOIL_NAME_MAP_LOWER.get(airfoil_name.lower())
+    if stem is None:
         raise KeyError(
             f"Unknown airfoil name '{airfoil_name}'. "
             f"Known names: {sorted(AIRFOIL_NAME_MAP.keys())}"
@@ -105,48 +136,88 @@ def load_airfoil_constants(airfoil_name: str) -> dict:
         KeyError: if airfoil_name is not in AIRFOIL_NAME_MAP.
         FileNotFoundError: if the JSON file does not exist in datcom/.
     """
-    stem = _stem_for_name(airfoil_name)
-    if stem not in _AIRFOIL_CACHE:
+    return _load_by_stem(_stem_for_name(airfoil_name))
+
+
+def _load_by_stem(stem: str) -> dict:
+    """Load and cache the constants JSON for an already-resolved file stem."""
+    doc = _AIRFOIL_CACHE.get(stem)
+    if doc is None:
         json_path = _DATCOM_DIR / f"{stem}.constants.json"
-        with open(json_path, "r", encoding="utf-8") as fh:
-            _AIRFOIL_CACHE[stem] = json.load(fh)
-    return _AIRFOIL_CACHE[stem]
+        doc = _AIRFOIL_CACHE[stem] = _json_loads(json_path.read_bytes())
+    return doc
+
+
+def preload_airfoils() -> None:
+    """Load and process every known airfoil so first queries skip disk I/O.
+
+    Safe to run in a background thread: concurrent loads of the same stem
+    simply overwrite the cache entry with an identical document.
+    """
+    for stem in set(AIRFOIL_NAME_MAP.values()):
+        _get_processed(stem)
+    if _idw_kernel is not None:
+        # Trigger JIT compilation (or on-disk cache load) off the request path
+        proc = next(iter(_PROCESSED_CACHE.values()))
+        _idw_kernel(
+            proc["log_re_arr"], proc["mach_arr"], proc["values"],
+            proc["min_log_re"], proc["mach_range"][0], proc["mach_scale"], _K_NEIGHBORS,
+        )
 
 
 def get_available_airfoils() -> list[str]:
-    """Return list of canonical JSON stems available in datcom/."""
-    return sorted(
+    """Return list of canonical JSON stems available in datcom/.
+
+    The directory is scanned once; call _available_stems.cache_clear() if
+    files are added at runtime.
+    """
+    return list(_available_stems())
+
+
+@functools.cache
+def _available_stems() -> tuple[str, ...]:
+    return tuple(sorted(
         p.name.replace(".constants.json", "")
         for p in _DATCOM_DIR.glob("*.constants.json")
-    )
+    ))
 
 
 def _get_processed(stem: str) -> dict:
     """Build and cache the processed point arrays for a given stem.
 
     Returns dict with:
-        log_re_arr: list[float]   — log(Re) for each condition
-        mach_arr: list[float]     — Mach for each condition
-        values: dict[str, list[float]]  — interpolated key values per condition
+        log_re_arr: np.ndarray     — log(Re) for each condition
+        mach_arr: np.ndarray       — Mach for each condition
+        values: np.ndarray              — (n, len(_INTERPOLATED_KEYS)) float64
+                                          matrix, columns in _INTERPOLATED_KEYS order
         re_range: tuple[float, float]   — (min_re, max_re)
         mach_range: tuple[float, float] — (min_mach, max_mach)
         mach_scale: float               — scale factor to normalize mach to log-Re units
+        tree: cKDTree | None            — KD-tree over (log_re, mach * mach_scale),
+                                          built only for large tables with SciPy
+
+    The fast-lookup grid ("grid") is added lazily by _get_grid().
     """
     if stem in _PROCESSED_CACHE:
         return _PROCESSED_CACHE[stem]
 
-    doc = _AIRFOIL_CACHE[stem]
-    conditions = doc["conditions"]
+    conditions = _load_by_stem(stem)["conditions"]
 
-    log_re_arr = [math.log(c["Re"]) for c in conditions]
-    mach_arr = [c["Mach"] for c in conditions]
+    # Single pass over the records: columns are Re, Mach, then _INTERPOLATED_KEYS
+    fields = ("Re", "Mach", *_INTERPOLATED_KEYS)
+    table = np.array([[c[f] for f in fields] for c in conditions], dtype=np.float64)
+    table = table.reshape(len(conditions), len(fields))
+    re_np = table[:, 0]
+    mach_np = np.ascontiguousarray(table[:, 1])
+    values = np.ascontiguousarray(table[:, 2:])
+    log_re_np = np.log(re_np)
 
     # Compute scale factor: normalize Mach range to log-Re range so both axes
     # contribute equally to the distance metric.
-    min_log_re = min(log_re_arr)
-    max_log_re = max(log_re_arr)
-    min_mach = min(mach_arr)
-    max_mach = max(mach_arr)
+    min_log_re = float(log_re_np.min())
+    max_log_re = float(log_re_np.max())
+    min_mach = float(mach_np.min())
+    max_mach = float(mach_np.max())
 
     log_re_span = max_log_re - min_log_re
     mach_span = max_mach - min_mach
@@ -154,34 +225,31 @@ def _get_processed(stem: str) -> dict:
     # mach_scale converts mach to equivalent log-re units
     mach_scale = log_re_span / mach_span if mach_span > 0 else 1.0
 
-    values: dict[str, list[float]] = {k: [] for k in _INTERPOLATED_KEYS}
-    for c in conditions:
-        for k in _INTERPOLATED_KEYS:
-            values[k].append(c[k])
+    tree = None
+    if cKDTree is not None and len(conditions) >= _KDTREE_MIN_POINTS:
+        tree = cKDTree(np.column_stack([log_re_np, mach_np * mach_scale]))
 
     processed = {
-        "log_re_arr": log_re_arr,
-        "mach_arr": mach_arr,
+        "log_re_arr": log_re_np,
+        "mach_arr": mach_np,
         "values": values,
-        "re_range": (min(c["Re"] for c in conditions), max(c["Re"] for c in conditions)),
+        "re_range": (float(re_np.min()), float(re_np.max())),
         "mach_range": (min_mach, max_mach),
         "mach_scale": mach_scale,
         "min_log_re": min_log_re,
         "max_log_re": max_log_re,
+        "tree": tree,
     }
     _PROCESSED_CACHE[stem] = processed
     return processed
 
 
-def _clamp(value: float, lo: float, hi: float) -> float:
-    """Clamp value to [lo, hi]."""
-    return max(lo, min(hi, value))
-
-
 def interpolate_section_aero(
     airfoil_name: str,
     Re: float,
     Mach: float,
+    *,
+    fast: bool = False,
 ) -> dict[str, float]:
     """Interpolate section aerodynamic constants at (Re, Mach).
 
@@ -192,61 +260,230 @@ def interpolate_section_aero(
     If Re/Mach is outside the grid bounds, clamps to the nearest boundary
     (returns boundary values — no exception, no NaN).
 
+    Results are memoized per (airfoil, clamped Re, clamped Mach); see
+    clear_interpolation_cache().
+
     Args:
         airfoil_name: CHENG airfoil name (e.g. "NACA-2412", "Clark-Y").
         Re: Reynolds number (e.g. 300000). Must be > 0.
         Mach: Mach number (e.g. 0.05). Must be > 0.
+        fast: If True, bilinearly interpolate a precomputed grid of IDW results
+              instead of running IDW.  Intended for solver loops issuing many
+              queries; IDW is not smooth, so results can differ from the exact
+              path by several percent between grid nodes.
 
     Returns:
         dict with keys: cl_alpha_per_rad, cm_ac, cl_max, cd_min, cl_at_cd_min.
         All values are finite floats.
     """
-    doc = load_airfoil_constants(airfoil_name)
+    stem = _stem_for_name(airfoil_name)
+    proc = _get_processed(stem)  # loads the JSON on first use
+
+    # Clamp query to grid bounds
+    min_re, max_re = proc["re_range"]
+    min_mach, max_mach = proc["mach_range"]
+    re_clamped = max(min_re, min(max_re, Re))
+    mach_clamped = max(min_mach, min(max_mach, Mach))
+
+    if fast:
+        return dict(zip(_INTERPOLATED_KEYS, _grid_lookup(stem, proc, re_clamped, mach_clamped)))
+    return dict(zip(_INTERPOLATED_KEYS, _interpolate_cached(stem, re_clamped, mach_clamped)))
+
+
+def interpolate_section_aero_batch(
+    airfoil_name: str,
+    Re: np.ndarray,
+    Mach: np.ndarray,
+) -> dict[str, np.ndarray]:
+    """Vectorized interpolate_section_aero over many (Re, Mach) queries.
+
+    Intended for span-station sweeps: one (Q, n) distance matrix and one
+    argpartition replace Q scalar calls.  Uses the same IDW and clamping
+    rules as the scalar function (results agree to rounding).
+
+    Args:
+        airfoil_name: CHENG airfoil name (e.g. "NACA-2412", "Clark-Y").
+        Re: Reynolds numbers; broadcast against Mach.
+        Mach: Mach numbers; broadcast against Re.
+
+    Returns:
+        dict mapping each of _INTERPOLATED_KEYS to a float64 array with the
+        broadcast shape of Re and Mach.
+    """
     stem = _stem_for_name(airfoil_name)
     proc = _get_processed(stem)
 
+    re_q, mach_q = np.broadcast_arrays(
+        np.asarray(Re, dtype=np.float64), np.asarray(Mach, dtype=np.float64),
+    )
+    shape = re_q.shape
+    log_re_q = np.log(np.clip(re_q.ravel(), *proc["re_range"]))[:, None]
+    mach_q = np.clip(mach_q.ravel(), *proc["mach_range"])[:, None]
+
+    values = proc["values"]
+    n = values.shape[0]
+    k = min(_K_NEIGHBORS, n)
+
+    d_lr = log_re_q - proc["log_re_arr"][None, :]
+    d_m = (mach_q - proc["mach_arr"][None, :]) * proc["mach_scale"]
+    dist2 = d_lr * d_lr + d_m * d_m  # (Q, n)
+
+    if k < n:
+        nearest = np.argpartition(dist2, k - 1, axis=1)[:, :k]
+    else:
+        nearest = np.broadcast_to(np.arange(n), dist2.shape)
+    nearest_d2 = np.take_along_axis(dist2, nearest, axis=1)  # (Q, k)
+
+    weights = 1.0 / np.maximum(nearest_d2, 1e-30)
+    out = np.einsum("qk,qkc->qc", weights, values[nearest]) / weights.sum(axis=1)[:, None]
+
+    # Exact grid hits return the stored record, as in the scalar path
+    j = np.argmin(nearest_d2, axis=1)
+    rows = np.arange(nearest.shape[0])
+    exact = nearest_d2[rows, j] < 1e-14
+    if exact.any():
+        out[exact] = values[nearest[rows, j][exact]]
+
+    return {key: out[:, c].reshape(shape) for c, key in enumerate(_INTERPOLATED_KEYS)}
+
+
+def clear_interpolation_cache() -> None:
+    """Clear the memoized interpolate_section_aero results (useful for testing)."""
+    _interpolate_cached.cache_clear()
+
+
+@functools.lru_cache(maxsize=4096)
+def _interpolate_cached(stem: str, re_clamped: float, mach_clamped: float) -> tuple[float, ...]:
+    """IDW interpolation at an already-clamped (Re, Mach) point.
+
+    Returns values in _INTERPOLATED_KEYS order.
+    """
+    proc = _get_processed(stem)
+
     log_re_arr = proc["log_re_arr"]
     mach_arr = proc["mach_arr"]
     values = proc["values"]
     mach_scale = proc["mach_scale"]
 
-    # Clamp query to grid bounds
-    min_re, max_re = proc["re_range"]
-    min_mach, max_mach = proc["mach_range"]
-    re_clamped = _clamp(Re, min_re, max_re)
-    mach_clamped = _clamp(Mach, min_mach, max_mach)
-
     log_re_q = math.log(re_clamped)
     mach_q = mach_clamped
 
-    n = len(log_re_arr)
+    n = log_re_arr.shape[0]
     k = min(_K_NEIGHBORS, n)
 
-    # Compute squared distances in normalized (log_re, scaled_mach) space
-    dists: list[tuple[float, int]] = []
-    for i in range(n):
-        d_lr = log_re_q - log_re_arr[i]
-        d_m = (mach_q - mach_arr[i]) * mach_scale
+    tree = proc["tree"]
+    if tree is not None:
+        # O(log n) lookup for large tables
+        dist, nearest = tree.query((log_re_q, mach_q * mach_scale), k=k)
+        nearest = np.atleast_1d(nearest)
+        nearest_d2 = np.atleast_1d(dist) ** 2
+    elif _idw_kernel is not None:
+        return tuple(
+            _idw_kernel(log_re_arr, mach_arr, values, log_re_q, mach_q, mach_scale, k).tolist()
+        )
+    else:
+        # Squared distances in normalized (log_re, scaled_mach) space
+        d_lr = log_re_arr - log_re_q
+        d_m = (mach_arr - mach_q) * mach_scale
         dist2 = d_lr * d_lr + d_m * d_m
-        dists.append((dist2, i))
 
-    # Sort by distance, take k nearest
-    dists.sort(key=lambda x: x[0])
-    nearest = dists[:k]
+        # k nearest without a full sort
+        nearest = np.argpartition(dist2, k - 1)[:k] if k < n else np.arange(n)
+        nearest_d2 = dist2[nearest]
 
     # Check for exact match
-    if nearest[0][0] < 1e-14:
-        idx = nearest[0][1]
-        return {key: values[key][idx] for key in _INTERPOLATED_KEYS}
+    j = int(np.argmin(nearest_d2))
+    if nearest_d2[j] < 1e-14:
+        return tuple(values[nearest[j]].tolist())
 
     # Inverse-distance-weighted interpolation
-    weights = [1.0 / max(d2, 1e-30) for d2, _ in nearest]
-    total_weight = sum(weights)
-
-    result: dict[str, float] = {}
-    for key in _INTERPOLATED_KEYS:
-        val_arr = values[key]
-        weighted_sum = sum(weights[j] * val_arr[nearest[j][1]] for j in range(k))
-        result[key] = weighted_sum / total_weight
-
-    return result
+    weights = 1.0 / np.maximum(nearest_d2, 1e-30)
+    return tuple((weights @ values[nearest] / weights.sum()).tolist())
+
+
+if numba is not None:
+
+    @numba.njit(cache=True)
+    def _idw_kernel(log_re, mach, values, log_re_q, mach_q, mach_scale, k):
+        """Compiled IDW: single scan keeping the k nearest by insertion.
+
+        Same math as the NumPy path in _interpolate_cached (no fastmath, so
+        results agree to rounding).
+        """
+        best_d = np.full(k, np.inf)
+        best_i = np.zeros(k, dtype=np.int64)
+        for i in range(log_re.shape[0]):
+            d_lr = log_re[i] - log_re_q
+            d_m = (mach[i] - mach_q) * mach_scale
+            d = d_lr * d_lr + d_m * d_m
+            if d < best_d[k - 1]:
+                j = k - 1
+                while j > 0 and best_d[j - 1] > d:
+                    best_d[j] = best_d[j - 1]
+                    best_i[j] = best_i[j - 1]
+                    j -= 1
+                best_d[j] = d
+                best_i[j] = i
+
+        n_keys = values.shape[1]
+        out = np.zeros(n_keys)
+        if best_d[0] < 1e-14:
+            for c in range(n_keys):
+                out[c] = values[best_i[0], c]
+            return out
+
+        total_weight = 0.0
+        for a in range(k):
+            w = 1.0 / max(best_d[a], 1e-30)
+            total_weight += w
+            for c in range(n_keys):
+                out[c] += w * values[best_i[a], c]
+        for c in range(n_keys):
+            out[c] /= total_weight
+        return out
+
+else:
+    _idw_kernel = None
+
+
+def _get_grid(stem: str, proc: dict) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Build (once) the (log_re_axis, mach_axis, table) grid of IDW results.
+
+    table has shape (*_GRID_SHAPE, len(_INTERPOLATED_KEYS)).  Stored on the
+    processed entry so it is dropped together with it.
+    """
+    grid = proc.get("grid")
+    if grid is None:
+        n_lr, n_m = _GRID_SHAPE
+        lr_axis = np.linspace(proc["min_log_re"], proc["max_log_re"], n_lr)
+        m_axis = np.linspace(*proc["mach_range"], n_m)
+        # Bypass the LRU so grid construction doesn't evict real queries
+        idw = _interpolate_cached.__wrapped__
+        table = np.array(
+            [[idw(stem, math.exp(lr), m) for m in m_axis] for lr in lr_axis],
+            dtype=np.float64,
+        )
+        grid = proc["grid"] = (lr_axis, m_axis, table)
+    return grid
+
+
+def _grid_lookup(stem: str, proc: dict, re_clamped: float, mach_clamped: float) -> list[float]:
+    """Bilinear interpolation in the precomputed IDW grid."""
+    lr_axis, m_axis, table = _get_grid(stem, proc)
+
+    def cell(axis: np.ndarray, q: float) -> tuple[int, float]:
+        i = int(np.searchsorted(axis, q, side="right")) - 1
+        i = min(max(i, 0), axis.shape[0] - 2)
+        span = axis[i + 1] - axis[i]
+        t = (q - axis[i]) / span if span > 0 else 0.0
+        return i, min(max(t, 0.0), 1.0)
+
+    i, u = cell(lr_axis, math.log(re_clamped))
+    j, v = cell(m_axis, mach_clamped)
+    out = (
+        (1 - u) * (1 - v) * table[i, j]
+        + u * (1 - v) * table[i + 1, j]
+        + (1 - u) * v * table[i, j + 1]
+        + u * v * table[i + 1, j + 1]
+    )
+    return out.tolist()
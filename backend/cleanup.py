@@ -1,20 +1,95 @@
 """Orphaned temp file cleanup for /data/tmp/.
 
 Provides startup cleanup (delete files older than 1 hour) and a periodic
-background task (every 30 minutes) for long-running servers.
+background thread (every 30 minutes) for long-running servers.
+
+Only files written by the export module are managed: scratch files named
+"export-*" and finished archives named "cheng_*" (see _MANAGED_PREFIXES).
+The optional subdirectory sweep likewise only enters top-level directories
+with those prefixes.  Anything else in the directory (e.g. tesscache/) is
+never stat'ed or deleted.
 """
 
 from __future__ import annotations
 
 import logging
+import os
+import re
+import stat
+import sys
+import threading
 import time
-from pathlib import Path
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 
 logger = logging.getLogger("cheng.cleanup")
 
 # Authoritative temp directory — imported from the export module so that
 # cleanup and export always reference the same path (#262, #276).
 from backend.export.package import EXPORT_TMP_DIR as DEFAULT_TMP_DIR  # noqa: E402
+from backend.export.package import TMP_FILE_PREFIX, ZIP_FILE_PREFIX  # noqa: E402
+
+# Top-level names cleanup may delete.  Checked before any stat(), so foreign
+# files dropped into the directory cost one string compare and are preserved.
+_MANAGED_PREFIXES = (TMP_FILE_PREFIX, ZIP_FILE_PREFIX)
+
+# Export scratch files embed their creation epoch (see package.TMP_FILE_PREFIX).
+# A file cannot be modified before it was created, so a fresh name timestamp
+# proves the file is fresh without a stat() call.
+_NAME_TS_RE = re.compile(r"export-(\d+)-")
+
+# Per-directory memo of the last clean scan: (dir st_mtime_ns, max_age, rescan_at_ns).
+# Adding or removing entries bumps the directory mtime, so while it is unchanged
+# nothing can expire before rescan_at (oldest surviving file + max_age) and the
+# scan is skipped.  Only touched while holding _cleanup_lock.
+_scan_state: dict[str, tuple[int, float, int]] = {}
+
+# At most one cleanup runs at a time (startup, cleanup thread, or a manual call
+# from another worker thread); overlapping callers return immediately.
+_cleanup_lock = threading.Lock()
+
+# fd-relative scandir/unlink is POSIX-only; elsewhere fall back to paths.
+_USE_DIR_FD = (
+    hasattr(os, "O_DIRECTORY")
+    and os.scandir in os.supports_fd
+    and os.unlink in os.supports_dir_fd
+)
+
+# Deletion bursts larger than this are spread over a small thread pool.
+_PARALLEL_UNLINK_THRESHOLD = 64
+_MAX_UNLINK_WORKERS = 8
+
+# Periodic cleanup interval adaptation: idle runs back off up to
+# CLEANUP_INTERVAL_SECONDS * _MAX_INTERVAL_FACTOR, bursts above
+# _BUSY_DELETE_COUNT deletions speed up to no faster than _MIN_INTERVAL_SECONDS.
+_MAX_INTERVAL_FACTOR = 8
+_BUSY_DELETE_COUNT = 100
+_MIN_INTERVAL_SECONDS = 60.0
+
+# Niceness added to the periodic cleanup thread (see _lower_thread_priority).
+_CLEANUP_NICE_INCREMENT = 5
+
+# Periodic cleanup thread (see start_cleanup_thread); _STOP wakes it for shutdown.
+_STOP = threading.Event()
+_cleanup_thread: threading.Thread | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class CleanupStats:
+    """Result of one cleanup_tmp_files run.
+
+    Attributes:
+        deleted:     Number of files removed.
+        bytes_freed: Sum of st_size over the removed files, taken from the
+                     same stat() that supplied the mtime (no extra syscalls).
+    """
+
+    deleted: int = 0
+    bytes_freed: int = 0
+
+
+_NOTHING_DONE = CleanupStats()
 
 # Files older than this (seconds) are considered orphaned.
 MAX_AGE_SECONDS = 3600  # 1 hour
@@ -24,54 +99,349 @@ CLEANUP_INTERVAL_SECONDS = 1800  # 30 minutes
 
 
 def cleanup_tmp_files(
-    tmp_dir: Path = DEFAULT_TMP_DIR,
+    tmp_dir: str | os.PathLike[str] = DEFAULT_TMP_DIR,
     max_age_seconds: float = MAX_AGE_SECONDS,
-) -> int:
-    """Delete files in tmp_dir older than max_age_seconds.
+    *,
+    cleanup_subdirs: bool = False,
+) -> CleanupStats:
+    """Delete export-managed files in tmp_dir older than max_age_seconds.
 
-    Returns the number of files deleted.  Skips directories and files
+    Returns a CleanupStats with the number of files deleted and the bytes
+    they occupied.  Skips directories and files
     that cannot be deleted (e.g. permission errors).
+
+    With cleanup_subdirs=True, export-managed subdirectories (top-level
+    names with a _MANAGED_PREFIXES prefix, e.g. left by interrupted export
+    builds) are swept too: their aged files are deleted and aged directories
+    that end up empty are removed.  Non-empty ones are retried on the next
+    run.  Other subdirectories are never entered.
+
+    Accepts a Path or str; everything past the entry point works on plain
+    strings and os.* calls (no per-file pathlib objects).
+
+    If another cleanup is already running, returns an all-zero result
+    without scanning.
     """
-    if not tmp_dir.is_dir():
-        return 0
+    if not _cleanup_lock.acquire(blocking=False):
+        logger.debug("Temp cleanup already in progress; skipping")
+        return _NOTHING_DONE
+    try:
+        return _cleanup_locked(tmp_dir, max_age_seconds, cleanup_subdirs)
+    finally:
+        _cleanup_lock.release()
 
-    now = time.time()
-    deleted = 0
 
-    for p in tmp_dir.iterdir():
-        if not p.is_file():
+def _cleanup_locked(
+    tmp_dir: str | os.PathLike[str],
+    max_age_seconds: float,
+    cleanup_subdirs: bool,
+) -> CleanupStats:
+    """Body of cleanup_tmp_files; caller holds _cleanup_lock."""
+    # Integer nanoseconds throughout: exact comparisons against st_mtime_ns
+    now_ns = time.time_ns()
+    max_age_ns = int(max_age_seconds * 1_000_000_000)
+    key = os.fspath(tmp_dir)
+
+    # One stat of the directory can replace the whole scan on idle intervals
+    try:
+        dir_mtime_ns = os.stat(key).st_mtime_ns
+    except OSError:
+        return _NOTHING_DONE
+    state = _scan_state.get(key)
+    # The memo only sees top-level changes, so subdirectory sweeps always scan
+    if (
+        not cleanup_subdirs
+        and state is not None
+        and state[:2] == (dir_mtime_ns, max_age_seconds)
+        and now_ns < state[2]
+    ):
+        return _NOTHING_DONE
+
+    # os.scandir carries the file type in each DirEntry, so the only
+    # per-file syscall left is the stat() for mtime.  Where supported, scan
+    # and unlink relative to an open directory fd (fstatat/unlinkat): no
+    # per-file path walk, and immune to the directory being swapped mid-scan.
+    dir_fd: int | None = None
+    try:
+        if _USE_DIR_FD:
+            dir_fd = os.open(key, os.O_RDONLY | os.O_DIRECTORY)
+            it = os.scandir(dir_fd)
+        else:
+            it = os.scandir(key)
+    except (FileNotFoundError, NotADirectoryError):
+        if dir_fd is not None:
+            os.close(dir_fd)
+        return _NOTHING_DONE
+
+    try:
+        with it:
+            deleted, freed, oldest_kept_ns, had_error = _scan_and_delete(
+                it, dir_fd, now_ns, max_age_ns,
+            )
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
+
+    if cleanup_subdirs:
+        sub_deleted, sub_freed, sub_error = _sweep_subdirs(key, now_ns - max_age_ns)
+        deleted += sub_deleted
+        freed += sub_freed
+        had_error = had_error or sub_error
+
+    # Our own unlinks bump the directory mtime, and failed files must be
+    # retried, so only a scan that changed nothing is memoized.
+    if deleted or had_error or cleanup_subdirs:
+        _scan_state.pop(key, None)
+    else:
+        _scan_state[key] = (dir_mtime_ns, max_age_seconds, oldest_kept_ns + max_age_ns)
+
+    if deleted:
+        logger.info(
+            "Cleaned up %d orphaned temp file(s) (%d bytes) from %s", deleted, freed, tmp_dir,
+        )
+
+    return CleanupStats(deleted, freed)
+
+
+def _scan_and_delete(
+    it: Iterator[os.DirEntry[str]],
+    dir_fd: int | None,
+    now_ns: int,
+    max_age_ns: int,
+) -> tuple[int, int, int, bool]:
+    """Delete expired files from an open scandir iterator (closed by the caller).
+
+    Returns (deleted, bytes freed, oldest surviving timestamp in ns,
+    whether any entry failed).
+    """
+    debug = logger.isEnabledFor(logging.DEBUG)  # once, not per file
+    victims: list[tuple[str, str, float, int]] = []  # (unlink path, name, age s, size)
+    cutoff_ns = now_ns - max_age_ns
+    oldest_kept_ns = now_ns
+    had_error = False
+    # Hoisted bound methods: LOAD_FAST instead of attribute lookups per entry
+    match_name = _NAME_TS_RE.match
+    add_victim = victims.append
+    for entry in it:
+        name = entry.name
+        if not name.startswith(_MANAGED_PREFIXES):
             continue
         try:
-            age = now - p.stat().st_mtime
-            if age > max_age_seconds:
-                p.unlink()
-                deleted += 1
-                logger.debug("Deleted orphaned temp file: %s (age=%.0fs)", p.name, age)
+            if not entry.is_file(follow_symlinks=False):
+                continue
+            m = match_name(name)
+            if m is not None:
+                name_ns = int(m.group(1)) * 1_000_000_000
+                if name_ns >= cutoff_ns:
+                    # fresh by name -- no stat() needed
+                    oldest_kept_ns = min(oldest_kept_ns, name_ns)
+                    continue
+            st = entry.stat(follow_symlinks=False)
+            mtime_ns = st.st_mtime_ns
+            if mtime_ns < cutoff_ns:
+                # entry.path is the bare name when scanning a dir fd
+                age = (now_ns - mtime_ns) / 1_000_000_000
+                add_victim((entry.path, name, age, st.st_size))
+            else:
+                oldest_kept_ns = min(oldest_kept_ns, mtime_ns)
         except OSError as exc:
-            logger.debug("Could not delete temp file %s: %s", p.name, exc)
+            had_error = True
+            if debug:
+                logger.debug("Could not stat temp file %s: %s", name, exc)
 
-    if deleted:
-        logger.info("Cleaned up %d orphaned temp file(s) from %s", deleted, tmp_dir)
+    deleted = 0
+    freed = 0
+    failures: list[tuple[str, OSError]] = []
+    for (_path, name, age, size), exc in zip(victims, _unlink_all(victims, dir_fd)):
+        if exc is None:
+            deleted += 1
+            freed += size
+            if debug:
+                logger.debug("Deleted orphaned temp file: %s (age=%.0fs)", name, age)
+        else:
+            failures.append((name, exc))
 
-    return deleted
+    if failures:
+        # One aggregated line instead of per-file noise; full list at debug
+        logger.info(
+            "Could not delete %d orphaned temp file(s), e.g. %s",
+            len(failures), ", ".join(f"{n} ({e.strerror})" for n, e in failures[:10]),
+        )
+        if debug:
+            for name, exc in failures:
+                logger.debug("Could not delete temp file %s: %s", name, exc)
 
+    return deleted, freed, oldest_kept_ns, had_error or bool(failures)
 
-async def periodic_cleanup(
-    tmp_dir: Path = DEFAULT_TMP_DIR,
+
+def _unlink_all(
+    victims: list[tuple[str, str, float, int]],
+    dir_fd: int | None,
+) -> list[OSError | None]:
+    """Unlink every victim, returning the error (or None) per file, in order.
+
+    unlink is latency-bound (journal commits), so large bursts -- e.g. after
+    a crash left many orphans -- are overlapped across a few threads.  The
+    pool is capped so it never starves anyio's default thread limiter.
+    """
+    unlink = os.unlink
+
+    def unlink_one(victim: tuple[str, str, float, int]) -> OSError | None:
+        try:
+            unlink(victim[0], dir_fd=dir_fd)
+        except OSError as exc:
+            return exc
+        return None
+
+    if len(victims) <= _PARALLEL_UNLINK_THRESHOLD:
+        return [unlink_one(v) for v in victims]
+
+    workers = min(_MAX_UNLINK_WORKERS, os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cleanup") as pool:
+        return list(pool.map(unlink_one, victims))
+
+
+def _sweep_subdirs(root: str, cutoff_ns: int) -> tuple[int, int, bool]:
+    """Delete aged files in root's managed subdirectories; rmdir aged empty ones.
+
+    Only top-level directories named with a _MANAGED_PREFIXES prefix are
+    entered; everything beneath one of those belongs to the export module.
+    Directory mtimes are sampled in one pre-order pass before anything is
+    deleted (our own unlinks/rmdirs would otherwise make parents look fresh),
+    then processed children-first.  Top-level files are left to the main
+    scan.  Returns (files deleted, bytes freed, had_error).
+    """
+    debug = logger.isEnabledFor(logging.DEBUG)
+    deleted = 0
+    freed = 0
+    had_error = False
+    try:
+        with os.scandir(root) as it:
+            managed = [
+                entry.path for entry in it
+                if entry.name.startswith(_MANAGED_PREFIXES) and entry.is_dir(follow_symlinks=False)
+            ]
+    except OSError:
+        return 0, 0, True
+    tree = [(d, files) for top in managed for d, _subdirs, files in os.walk(top)]
+    aged: dict[str, bool] = {}
+    for dirpath, _files in tree:
+        try:
+            aged[dirpath] = os.lstat(dirpath).st_mtime_ns < cutoff_ns
+        except OSError:
+            aged[dirpath] = False
+
+    for dirpath, filenames in reversed(tree):
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            try:
+                st = os.lstat(path)
+                if stat.S_ISREG(st.st_mode) and st.st_mtime_ns < cutoff_ns:
+                    os.unlink(path)
+                    deleted += 1
+                    freed += st.st_size
+                    if debug:
+                        logger.debug("Deleted orphaned temp file: %s", path)
+            except OSError as exc:
+                had_error = True
+                if debug:
+                    logger.debug("Could not delete temp file %s: %s", path, exc)
+        if aged[dirpath]:
+            try:
+                os.rmdir(dirpath)
+                if debug:
+                    logger.debug("Removed orphaned temp directory: %s", dirpath)
+            except OSError:
+                pass  # not empty (fresh content) -- retried next run
+    return deleted, freed, had_error
+
+
+def _lower_thread_priority() -> None:
+    """Best-effort: make the calling thread yield CPU to request handlers.
+
+    Only a modest nice() bump, not SCHED_IDLE: the cleanup thread takes the
+    GIL between syscalls, and an idle-class thread that gets descheduled
+    while holding it stalls every request thread behind it (priority
+    inversion).  A niceness of 5 still favours handlers, and the thread
+    releases the GIL for the unlink/stat syscalls that dominate its work.
+
+    Linux only: there nice() is per-thread, whereas on macOS and the BSDs it
+    renices the whole process, i.e. the server.  Unprivileged processes
+    cannot lower it back afterwards, so only call this from a thread
+    dedicated to cleanup, never from a shared pool worker.
+    """
+    if not sys.platform.startswith("linux"):
+        return
+    try:
+        os.nice(_CLEANUP_NICE_INCREMENT)
+    except OSError:
+        logger.debug("Could not lower cleanup thread priority", exc_info=True)
+
+
+def _next_interval(current: float, base: float, deleted: int) -> float:
+    """AIMD-style schedule for the cleanup thread.
+
+    Back off (x2, up to base * _MAX_INTERVAL_FACTOR) after a run that found
+    nothing; speed up (/2, down to _MIN_INTERVAL_SECONDS) after a big burst.
+    """
+    if deleted == 0:
+        return min(current * 2, base * _MAX_INTERVAL_FACTOR)
+    if deleted > _BUSY_DELETE_COUNT:
+        return max(current / 2, _MIN_INTERVAL_SECONDS)
+    return current
+
+
+def start_cleanup_thread(
+    tmp_dir: str | os.PathLike[str] = DEFAULT_TMP_DIR,
     interval: float = CLEANUP_INTERVAL_SECONDS,
     max_age_seconds: float = MAX_AGE_SECONDS,
-) -> None:
-    """Run cleanup_tmp_files periodically in a background task.
+) -> threading.Thread:
+    """Start the periodic cleanup loop in a dedicated daemon thread.
+
+    The thread owns the whole schedule: it never touches the event loop or
+    the shared worker pool, and lowers its own CPU priority once at start.
+    The sleep between runs adapts to the deletion rate, starting from
+    *interval* (see _next_interval).  Stop it with stop_cleanup_thread().
+    """
+    global _cleanup_thread
+    if _cleanup_thread is not None and _cleanup_thread.is_alive():
+        return _cleanup_thread
+    _STOP.clear()
+    _cleanup_thread = threading.Thread(
+        target=_cleanup_loop,
+        args=(tmp_dir, interval, max_age_seconds),
+        name="tmp-cleanup",
+        daemon=True,
+    )
+    _cleanup_thread.start()
+    return _cleanup_thread
+
 
-    This coroutine runs forever (until cancelled) and is intended to be
-    started during the application lifespan.
+def stop_cleanup_thread(timeout: float | None = 5.0) -> None:
+    """Signal the cleanup thread to exit and wait up to *timeout* seconds.
+
+    A run already in progress finishes first; the thread is a daemon, so a
+    timeout here never blocks interpreter shutdown.
     """
-    import anyio
+    global _cleanup_thread
+    _STOP.set()
+    if _cleanup_thread is not None:
+        _cleanup_thread.join(timeout)
+        _cleanup_thread = None
+
 
-    while True:
-        await anyio.sleep(interval)
+def _cleanup_loop(
+    tmp_dir: str | os.PathLike[str],
+    interval: float,
+    max_age_seconds: float,
+) -> None:
+    """Body of the cleanup thread: sleep, clean, adapt, until _STOP is set."""
+    _lower_thread_priority()
+    current = interval
+    while not _STOP.wait(current):
         try:
-            # Run blocking I/O in a worker thread to avoid blocking the event loop
-            await anyio.to_thread.run_sync(cleanup_tmp_files, tmp_dir, max_age_seconds)
+            stats = cleanup_tmp_files(tmp_dir, max_age_seconds)
         except Exception:
             logger.exception("Periodic temp cleanup failed")
+            continue
+        current = _next_interval(current, interval, stats.deleted)
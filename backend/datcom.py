@@ -23,13 +23,19 @@ References:
 from __future__ import annotations
 
 import dataclasses
+import functools
 import math
 import warnings
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Sequence
 
 import numpy as np
 
+try:
+    import numba
+except ImportError:  # Numba is optional -- the kernels run as plain Python
+    numba = None
+
 if TYPE_CHECKING:
     from backend.models import AircraftDesign
     from backend.mass_properties import MassProperties
@@ -45,11 +51,21 @@ _MU = 1.81e-5     # Air dynamic viscosity at sea level (Pa·s)
 _SPEED_OF_SOUND_SL = 340.3  # Speed of sound at sea level (m/s)
 
 
+def _jit(fn):
+    """Compile a scalar kernel with Numba when available, else return it as is.
+
+    No fastmath: compiled and interpreted results agree to rounding.
+    """
+    if numba is None:
+        return fn
+    return numba.njit(cache=True)(fn)
+
+
 # ---------------------------------------------------------------------------
 # Dataclasses
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class FlightCondition:
     """Trimmed flight condition derived from design parameters."""
 
@@ -71,8 +87,11 @@ class FlightCondition:
     alpha_trim_rad: float
     """Trim angle of attack (rad). Approximate."""
 
+    speed_of_sound: float
+    """ISA speed of sound at altitude (m/s)."""
 
-@dataclass
+
+@dataclass(slots=True)
 class StabilityDerivatives:
     """DATCOM stability derivatives (all per radian unless noted).
 
@@ -130,7 +149,13 @@ class StabilityDerivatives:
     """Yaw damping dCn/d(rb/2V) (per rad). Negative."""
 
 
-@dataclass
+# Column order of compute_stability_derivatives_batch results
+STABILITY_DERIVATIVE_FIELDS: tuple[str, ...] = tuple(
+    f.name for f in dataclasses.fields(StabilityDerivatives)
+)
+
+
+@dataclass(slots=True)
 class DynamicModes:
     """Dynamic stability mode characteristics.
 
@@ -202,9 +227,13 @@ class DynamicModes:
 # ISA atmosphere model
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=256)
 def _isa_atmosphere(altitude_m: float) -> tuple[float, float, float]:
     """ISA standard atmosphere up to 11 km (troposphere).
 
+    Memoized on the exact altitude: design sweeps re-run the pipeline at
+    the same flight altitude, so the pow/sqrt pair is paid once.
+
     Returns:
         (T_K, rho_kg_m3, speed_of_sound_m_s)
     """
@@ -219,6 +248,7 @@ def _isa_atmosphere(altitude_m: float) -> tuple[float, float, float]:
 # Finite-wing lift slope (DATCOM §4.1.3.2 — Polhamus)
 # ---------------------------------------------------------------------------
 
+@_jit
 def _finite_wing_cla(
     a_0: float,
     AR: float,
@@ -238,11 +268,15 @@ def _finite_wing_cla(
     # Lambda_c2 ≈ Lambda_LE for thin wings (conservative)
     sweep_c2 = sweep_le_rad  # approximate
 
-    beta = math.sqrt(max(1.0 - mach ** 2, 0.01))  # compressibility
+    # Floors written as conditional expressions rather than max(): once
+    # compiled they lower to a branchless maxsd instead of a call + branch.
+    beta_sq = 1.0 - mach ** 2
+    beta = math.sqrt(0.01 if beta_sq < 0.01 else beta_sq)  # compressibility
 
     # Polhamus formula (DATCOM eq. 4.1.3.2-a)
     discriminant = 4.0 + (AR ** 2) * (1.0 + math.tan(sweep_c2) ** 2 / beta ** 2) * (a_0 / math.pi) ** 2
-    a_w = (a_0 * AR) / (2.0 + math.sqrt(max(discriminant, 0.01)))
+    safe = 0.01 if discriminant < 0.01 else discriminant
+    a_w = (a_0 * AR) / (2.0 + math.sqrt(safe))
     return a_w
 
 
@@ -268,6 +302,116 @@ def _surface_re_mach(
     return max(Re, 1.0), max(Mach, 1e-4)
 
 
+# ---------------------------------------------------------------------------
+# Wing planform shared by the derivative and dynamic-mode passes
+# ---------------------------------------------------------------------------
+
+@dataclass(slots=True, frozen=True)
+class WingGeometry:
+    """Wing planform quantities in SI units (see wing_geometry)."""
+
+    b_m: float
+    root_chord_m: float
+    tip_chord_m: float
+    S_w_m2: float
+    c_bar_m: float  # mean aerodynamic chord
+    AR: float
+    lam: float  # taper ratio
+    sweep_le_rad: float
+
+
+def wing_geometry(design: "AircraftDesign") -> WingGeometry:
+    """Reference planform used by compute_stability_derivatives and
+    compute_dynamic_modes.
+
+    Callers running the whole pipeline compute this once and pass it to
+    both stages instead of letting each rebuild it from the design.
+    """
+    b_m = design.wing_span / 1000.0
+    root_chord_m = design.wing_chord / 1000.0
+    lam = design.wing_tip_root_ratio
+    tip_chord_m = root_chord_m * lam
+    S_w_m2 = 0.5 * (root_chord_m + tip_chord_m) * b_m
+    c_bar_m = 2.0 / 3.0 * root_chord_m * ((1.0 + lam + lam ** 2) / (1.0 + lam))
+    return WingGeometry(
+        b_m=b_m,
+        root_chord_m=root_chord_m,
+        tip_chord_m=tip_chord_m,
+        S_w_m2=S_w_m2,
+        c_bar_m=c_bar_m,
+        AR=b_m ** 2 / max(S_w_m2, 0.001),
+        lam=lam,
+        sweep_le_rad=math.radians(design.wing_sweep),
+    )
+
+
+@dataclass(slots=True, frozen=True)
+class _TailGeometry:
+    """Effective horizontal and vertical tail surfaces in SI units."""
+
+    S_h_eff: float
+    h_chord_m: float
+    h_span_m: float
+    sweep_h_rad: float
+    l_t_m: float
+    S_v_eff: float
+    v_chord_m: float
+    v_height_m: float
+    sweep_v_rad: float
+    l_v_m: float
+
+
+def _v_tail_geometry(design: "AircraftDesign") -> _TailGeometry:
+    """V-tail: project both surfaces to effective horizontal and vertical areas."""
+    dih = math.radians(design.v_tail_dihedral)
+    cos_dih = math.cos(dih)
+    sin_dih = math.sin(dih)
+    S_tail_per_surface = design.v_tail_chord * design.v_tail_span / 1e6  # m²
+    sweep_rad = math.radians(design.v_tail_sweep)
+    l_t_m = design.tail_arm / 1000.0
+    return _TailGeometry(
+        # Both surfaces
+        S_h_eff=2.0 * S_tail_per_surface * (cos_dih * cos_dih),
+        h_chord_m=design.v_tail_chord / 1000.0,
+        h_span_m=design.v_tail_span / 1000.0,
+        sweep_h_rad=sweep_rad,
+        l_t_m=l_t_m,
+        S_v_eff=2.0 * S_tail_per_surface * (sin_dih * sin_dih),
+        v_chord_m=design.v_tail_chord / 1000.0,
+        v_height_m=design.v_tail_span * sin_dih / 1000.0,
+        sweep_v_rad=sweep_rad,
+        l_v_m=l_t_m,
+    )
+
+
+def _conventional_tail_geometry(design: "AircraftDesign") -> _TailGeometry:
+    """Conventional / T-Tail / Cruciform: separate h-stab and fin."""
+    l_t_m = design.tail_arm / 1000.0
+    return _TailGeometry(
+        S_h_eff=design.h_stab_chord * design.h_stab_span / 1e6,  # m²
+        h_chord_m=design.h_stab_chord / 1000.0,
+        h_span_m=design.h_stab_span / 1000.0,
+        sweep_h_rad=0.0,  # h-stab usually unswept
+        l_t_m=l_t_m,
+        S_v_eff=0.5 * design.v_stab_root_chord * design.v_stab_height / 1e6,  # m² (triangle approx)
+        v_chord_m=design.v_stab_root_chord / 1000.0,
+        v_height_m=design.v_stab_height / 1000.0,
+        sweep_v_rad=0.0,
+        l_v_m=l_t_m,  # same arm for conventional tail
+    )
+
+
+# Tail-type dispatch; anything not listed uses separate h-stab and fin.
+_TAIL_VARIANTS = {"V-Tail": _v_tail_geometry}
+
+
+def _tail_geometry(design: "AircraftDesign") -> _TailGeometry | None:
+    """Tail surfaces for the design's tail type, or None for a flying wing / BWB."""
+    if design.fuselage_preset == "Blended-Wing-Body":
+        return None
+    return _TAIL_VARIANTS.get(design.tail_type, _conventional_tail_geometry)(design)
+
+
 # ---------------------------------------------------------------------------
 # Public function 1: compute_flight_condition
 # ---------------------------------------------------------------------------
@@ -285,12 +429,13 @@ def compute_flight_condition(
         mass_props: Resolved mass properties (from resolve_mass_properties).
 
     Returns:
-        FlightCondition with V, rho, q_bar, CL_trim, alpha_trim.
+        FlightCondition with V, rho, q_bar, CL_trim, alpha_trim and the
+        speed of sound (reused for Mach by compute_stability_derivatives).
     """
     V = design.flight_speed_ms
     h = design.flight_altitude_m
 
-    _, rho, _ = _isa_atmosphere(h)
+    _, rho, speed_of_sound = _isa_atmosphere(h)
     q_bar = 0.5 * rho * V ** 2
 
     # Wing reference area (m²)
@@ -317,6 +462,7 @@ def compute_flight_condition(
         q_bar=q_bar,
         CL_trim=CL_trim,
         alpha_trim_rad=alpha_trim_rad,
+        speed_of_sound=speed_of_sound,
     )
 
 
@@ -328,6 +474,8 @@ def compute_stability_derivatives(
     design: "AircraftDesign",
     mass_props: "MassProperties",
     flight_cond: FlightCondition,
+    *,
+    wing: WingGeometry | None = None,
 ) -> StabilityDerivatives:
     """Compute DATCOM stability derivatives using NeuralFoil section data.
 
@@ -338,96 +486,226 @@ def compute_stability_derivatives(
         design: Aircraft design parameters.
         mass_props: Resolved mass properties.
         flight_cond: Trimmed flight condition.
+        wing: Precomputed wing_geometry(design); computed here if omitted.
 
     Returns:
         StabilityDerivatives with all 16 derivatives.
     """
+    if wing is None:
+        wing = wing_geometry(design)
+    queries, geometry = _derivative_inputs(design, mass_props, flight_cond, wing)
+    aero = [interpolate_section_aero(name, Re=Re, Mach=Mach) for name, Re, Mach in queries]
+    a_0_w = aero[0]["cl_alpha_per_rad"]  # NeuralFoil section slope — NOT 2π
+    cd_min_w = aero[0]["cd_min"]
+    if len(aero) == 3:
+        a_0_t = aero[1]["cl_alpha_per_rad"]
+        a_0_v = aero[2]["cl_alpha_per_rad"]
+    else:
+        a_0_t = a_0_v = 0.0
+    return StabilityDerivatives(*_derivatives_kernel(a_0_w, cd_min_w, a_0_t, a_0_v, *geometry))
+
+
+def compute_stability_derivatives_batch(
+    designs: "Sequence[AircraftDesign]",
+    mass_props: "Sequence[MassProperties]",
+    flight_conds: Sequence[FlightCondition],
+) -> np.ndarray:
+    """Batched compute_stability_derivatives for design sweeps.
+
+    Per-design setup and the (memoized) NeuralFoil lookups stay in Python;
+    the derivative arithmetic runs as one compiled pass over all rows
+    instead of one kernel dispatch and dataclass per design.  Rows match
+    compute_stability_derivatives exactly.
+
+    Args:
+        designs: Candidate designs.
+        mass_props: Resolved mass properties, one per design.
+        flight_conds: Trimmed flight conditions, one per design.
+
+    Returns:
+        (N, 16) float64 array; columns follow STABILITY_DERIVATIVE_FIELDS.
+    """
+    if not len(designs) == len(mass_props) == len(flight_conds):
+        raise ValueError("designs, mass_props and flight_conds must have equal length")
+
+    inputs = np.zeros((len(designs), 4 + _N_GEOMETRY_INPUTS))
+    for row, (design, mp, fc) in enumerate(zip(designs, mass_props, flight_conds)):
+        queries, geometry = _derivative_inputs(design, mp, fc, wing_geometry(design))
+        inputs[row, 4:] = geometry
+        # Query order is wing, h-tail, v-tail -> cl_alpha columns 0, 2, 3
+        for col, (name, Re, Mach) in zip((0, 2, 3), queries):
+            aero = interpolate_section_aero(name, Re=Re, Mach=Mach)
+            inputs[row, col] = aero["cl_alpha_per_rad"]
+            if col == 0:
+                inputs[row, 1] = aero["cd_min"]
+
+    return _derivatives_kernel_batch(inputs)
+
+
+def preload_kernels() -> None:
+    """Compile the Numba kernels (or load them from the on-disk cache) up front.
+
+    Runs the default design through the scalar and batched derivative paths
+    so the first stability query skips JIT compilation.  No-op without Numba.
+    """
+    if numba is None:
+        return
+    # Deferred, like the TYPE_CHECKING imports: keep importing this module light
+    from backend.geometry.engine import compute_derived_values
+    from backend.mass_properties import resolve_mass_properties
+    from backend.models import AircraftDesign
+
+    design = AircraftDesign()
+    mass_props = resolve_mass_properties(design, compute_derived_values(design))
+    flight_cond = compute_flight_condition(design, mass_props)
+    compute_stability_derivatives_batch([design], [mass_props], [flight_cond])
+
+
+def _derivative_inputs(
+    design: "AircraftDesign",
+    mass_props: "MassProperties",
+    flight_cond: FlightCondition,
+    wing: WingGeometry,
+) -> tuple[list[tuple[str, float, float]], tuple]:
+    """Split one design into NeuralFoil queries and derivative-kernel inputs.
+
+    Returns:
+        (queries, geometry): queries are (airfoil, Re, Mach) for the wing and,
+        unless this is a flying wing, the horizontal and vertical tail;
+        geometry is the tail of the _derivatives_kernel argument list.
+    """
     V = flight_cond.speed_ms
     rho = flight_cond.rho
-    q_bar = flight_cond.q_bar
     CL_trim = flight_cond.CL_trim
-
-    _, _, speed_of_sound = _isa_atmosphere(flight_cond.altitude_m)
+    speed_of_sound = flight_cond.speed_of_sound
 
     # ── Geometry (SI) ───────────────────────────────────────────────────────
-    b_m = design.wing_span / 1000.0
-    root_chord_m = design.wing_chord / 1000.0
-    tip_chord_m = root_chord_m * design.wing_tip_root_ratio
-    S_w_m2 = 0.5 * (root_chord_m + tip_chord_m) * b_m
-    c_bar_m = 2.0 / 3.0 * root_chord_m * (
-        (1.0 + design.wing_tip_root_ratio + design.wing_tip_root_ratio ** 2)
-        / (1.0 + design.wing_tip_root_ratio)
-    )  # Mean aerodynamic chord
-    AR = b_m ** 2 / max(S_w_m2, 0.001)
-    lam = design.wing_tip_root_ratio  # taper ratio
+    b_m = wing.b_m
+    S_w_m2 = wing.S_w_m2
+    c_bar_m = wing.c_bar_m
+    AR = wing.AR
+    lam = wing.lam
+    sweep_le_rad = wing.sweep_le_rad
+
+    # ── Wing section conditions (NeuralFoil query) ─────────────────────────
+    Re_w, Mach_w = _surface_re_mach(V, c_bar_m, sweep_le_rad, rho, speed_of_sound)
+    queries = [(design.wing_airfoil, Re_w, Mach_w)]
 
-    sweep_le_rad = math.radians(design.wing_sweep)
+    # ── Tail geometry ─────────────────────────────────────────────────────
+    tail = _tail_geometry(design)
+    if tail is not None:
+        S_h_eff, h_span_m, sweep_h_rad, l_t_m = (
+            tail.S_h_eff, tail.h_span_m, tail.sweep_h_rad, tail.l_t_m,
+        )
+        S_v_eff, v_height_m, sweep_v_rad, l_v_m = (
+            tail.S_v_eff, tail.v_height_m, tail.sweep_v_rad, tail.l_v_m,
+        )
 
-    # Flying wing / BWB: no separate tail surfaces
-    is_flying_wing = design.fuselage_preset == "Blended-Wing-Body"
+        # Horizontal and vertical tail section conditions (NeuralFoil queries)
+        Re_h, Mach_h = _surface_re_mach(V, tail.h_chord_m, sweep_h_rad, rho, speed_of_sound)
+        Re_v, Mach_v = _surface_re_mach(V, tail.v_chord_m, sweep_v_rad, rho, speed_of_sound)
+        queries.append((design.tail_airfoil, Re_h, Mach_h))
+        queries.append((design.tail_airfoil, Re_v, Mach_v))
 
-    # ── Wing section aerodynamics (NeuralFoil) ─────────────────────────────
-    Re_w, Mach_w = _surface_re_mach(V, c_bar_m, sweep_le_rad, rho, speed_of_sound)
-    wing_aero = interpolate_section_aero(design.wing_airfoil, Re=Re_w, Mach=Mach_w)
+    else:
+        # Flying wing: no separate tail surfaces -- the kernel zeroes all
+        # tail contributions; only the moment arms are still used.
+        S_h_eff = S_v_eff = 0.0
+        h_span_m = v_height_m = 0.0
+        sweep_h_rad = sweep_v_rad = 0.0
+        Mach_h = Mach_v = 1e-4
+        l_t_m = design.fuselage_length * 0.3 / 1000.0  # approximate
+        l_v_m = l_t_m
+
+    # ── CG position (fraction of MAC) ─────────────────────────────────────
+    # We need x_cg_mac: CG position measured from wing LE as fraction of c_bar
+    # estimate wing leading edge position
+    wing_x_m = design.fuselage_length * 0.30 / 1000.0  # approx mount fraction
+    cg_x_m = mass_props.cg_x_mm / 1000.0
+    x_cg_mac = (cg_x_m - wing_x_m) / max(c_bar_m, 0.001)  # fraction of MAC
+
+    # Fuselage side area and length for the Cnβ body term
+    S_B_side_m2 = (design.fuselage_length * design.wing_chord * 0.35) / 1e6  # approx side area
+    l_fus_m = design.fuselage_length / 1000.0
+
+    # Plain floats only: the (optionally compiled) kernel is specialised on
+    # argument types, and design fields may hold ints after assignment.
+    geometry = (
+        float(CL_trim), float(b_m), float(S_w_m2), float(c_bar_m), float(AR),
+        float(lam), float(sweep_le_rad), math.radians(design.wing_dihedral),
+        float(Mach_w),
+        tail is not None,
+        float(S_h_eff), float(h_span_m), float(sweep_h_rad), float(Mach_h), float(l_t_m),
+        float(S_v_eff), float(v_height_m), float(sweep_v_rad), float(Mach_v), float(l_v_m),
+        float(x_cg_mac), float(S_B_side_m2), float(l_fus_m),
+    )
+    return queries, geometry
 
-    a_0_w = wing_aero["cl_alpha_per_rad"]  # NeuralFoil section slope — NOT 2π
-    cd_min_w = wing_aero["cd_min"]
-    cm_ac_w = wing_aero["cm_ac"]
+
+# ---------------------------------------------------------------------------
+# Derivative kernel (pure scalar arithmetic; compiled with Numba if present)
+# ---------------------------------------------------------------------------
+
+# Length of the geometry tuple returned by _derivative_inputs
+_N_GEOMETRY_INPUTS = 23
+
+
+@_jit
+def _derivatives_kernel(
+    a_0_w: float,
+    cd_min_w: float,
+    a_0_t: float,
+    a_0_v: float,
+    CL_trim: float,
+    b_m: float,
+    S_w_m2: float,
+    c_bar_m: float,
+    AR: float,
+    lam: float,
+    sweep_le_rad: float,
+    dihedral_rad: float,
+    Mach_w: float,
+    has_tail: bool,
+    S_h_eff: float,
+    h_span_m: float,
+    sweep_h_rad: float,
+    Mach_h: float,
+    l_t_m: float,
+    S_v_eff: float,
+    v_height_m: float,
+    sweep_v_rad: float,
+    Mach_v: float,
+    l_v_m: float,
+    x_cg_mac: float,
+    S_B_side_m2: float,
+    l_fus_m: float,
+) -> tuple[float, ...]:
+    """DATCOM derivative arithmetic on plain floats.
+
+    The first four arguments are the NeuralFoil section data (wing slope and
+    cd_min, tail and fin slopes); the rest come from _derivative_inputs.
+    Returns the 16 derivatives in StabilityDerivatives field order.
+    """
+    # Trig of the wing sweep, shared by the Clβ and Cnβ wing terms
+    tan_sweep_le = math.tan(sweep_le_rad)
+    # Taper factor shared by the Cnβ wing, Clp and Cnp terms
+    inv_1pl = 1.0 / (1.0 + lam)
 
     # ── Finite-wing lift slope (DATCOM §4.1.3.2) ───────────────────────────
     a_w = _finite_wing_cla(a_0_w, AR, sweep_le_rad, Mach_w)
 
-    # ── Downwash gradient at horizontal tail (DATCOM §5.1) ─────────────────
-    # Approximate formula for unswept/lightly swept wings:
-    # dε/dα ≈ 2 * a_w / (π * AR)
-    # # DATCOM §5.1.3.1
-    de_da = 2.0 * a_w / (math.pi * AR)
-    de_da = min(de_da, 0.9)  # physical limit
-
-    # ── Tail geometry ─────────────────────────────────────────────────────
-    if not is_flying_wing:
-        if design.tail_type == "V-Tail":
-            # V-tail: project to effective horizontal and vertical areas
-            dih = math.radians(design.v_tail_dihedral)
-            S_tail_per_surface = design.v_tail_chord * design.v_tail_span / 1e6  # m²
-            # Both surfaces
-            S_h_eff = 2.0 * S_tail_per_surface * math.cos(dih) ** 2
-            S_v_eff = 2.0 * S_tail_per_surface * math.sin(dih) ** 2
-            h_chord_m = design.v_tail_chord / 1000.0
-            v_chord_m = design.v_tail_chord / 1000.0
-            sweep_h_rad = math.radians(design.v_tail_sweep)
-            sweep_v_rad = sweep_h_rad
-            h_span_m = design.v_tail_span / 1000.0
-            v_height_m = design.v_tail_span * math.sin(dih) / 1000.0
-            l_t_m = design.tail_arm / 1000.0
-            l_v_m = l_t_m
-        else:
-            # Conventional / T-Tail / Cruciform
-            S_h_eff = design.h_stab_chord * design.h_stab_span / 1e6  # m²
-            S_v_eff = 0.5 * design.v_stab_root_chord * design.v_stab_height / 1e6  # m² (triangle approx)
-            h_chord_m = design.h_stab_chord / 1000.0
-            v_chord_m = design.v_stab_root_chord / 1000.0
-            sweep_h_rad = 0.0  # h-stab usually unswept
-            sweep_v_rad = 0.0
-            h_span_m = design.h_stab_span / 1000.0
-            v_height_m = design.v_stab_height / 1000.0
-            l_t_m = design.tail_arm / 1000.0
-            l_v_m = l_t_m  # same arm for conventional tail
-
-        # Horizontal tail section aerodynamics (NeuralFoil)
-        Re_h, Mach_h = _surface_re_mach(V, h_chord_m, sweep_h_rad, rho, speed_of_sound)
-        tail_aero = interpolate_section_aero(design.tail_airfoil, Re=Re_h, Mach=Mach_h)
-        a_0_t = tail_aero["cl_alpha_per_rad"]
+    if has_tail:
+        # ── Downwash gradient at horizontal tail (DATCOM §5.1) ─────────────
+        # Approximate formula for unswept/lightly swept wings:
+        # dε/dα ≈ 2 * a_w / (π * AR)
+        # # DATCOM §5.1.3.1
+        de_da = 2.0 * a_w / (math.pi * AR)
+        de_da = min(de_da, 0.9)  # physical limit
 
         # Horizontal tail aspect ratio and lift slope
         AR_h = h_span_m ** 2 / max(S_h_eff, 0.001)
         a_t = _finite_wing_cla(a_0_t, AR_h, sweep_h_rad, Mach_h)
 
-        # Vertical tail section aerodynamics
-        Re_v, Mach_v = _surface_re_mach(V, v_chord_m, sweep_v_rad, rho, speed_of_sound)
-        vtail_aero = interpolate_section_aero(design.tail_airfoil, Re=Re_v, Mach=Mach_v)
-        a_0_v = vtail_aero["cl_alpha_per_rad"]
-
         # Vertical fin effective aspect ratio
         AR_v = 2.0 * v_height_m ** 2 / max(S_v_eff, 0.001)  # factor 2 for endplate effect
         a_v = _finite_wing_cla(a_0_v, AR_v, sweep_v_rad, Mach_v)
@@ -436,150 +714,142 @@ def compute_stability_derivatives(
         eta_t = 0.90   # horizontal tail dynamic pressure ratio
         eta_v = 0.90   # vertical fin dynamic pressure ratio
 
-        # Volume ratios
-        V_h = a_t * eta_t * S_h_eff / S_w_m2  # horizontal tail volume-like ratio
-        V_v = a_v * eta_v * S_v_eff / S_w_m2  # vertical fin volume-like ratio
-
         # Vertical fin height above CG (approximate: half fin height)
         z_v_m = v_height_m / 2.0
-
     else:
-        # Flying wing: no separate tail surfaces
-        # Set all tail contributions to zero
+        # Flying wing: set all tail contributions to zero
+        de_da = 0.0  # no downwash without ht for flying wing
         a_t = 0.0
         a_v = 0.0
-        S_h_eff = 0.0
-        S_v_eff = 0.0
         eta_t = 0.0
         eta_v = 0.0
-        V_h = 0.0
-        V_v = 0.0
-        l_t_m = design.fuselage_length * 0.3 / 1000.0  # approximate
-        l_v_m = l_t_m
         z_v_m = 0.0
-        de_da = 0.0  # no downwash without ht for flying wing
 
-    # ── CG and AC positions (fraction of MAC) ─────────────────────────────
-    cg_x_mm = mass_props.cg_x_mm
-    # Wing mount position (approximate)
-    x_ac_w = 0.25  # aerodynamic center at 25% MAC for subsonic
+    # Wing aerodynamic center at 25% MAC for subsonic
+    x_ac_w = 0.25
 
-    # CG as fraction of MAC from nose of MAC
-    # We need x_cg_mac: CG position measured from wing LE as fraction of c_bar
-    # estimate wing leading edge position
-    wing_x_m = design.fuselage_length * 0.30 / 1000.0  # approx mount fraction
-    cg_x_m = cg_x_mm / 1000.0
-    x_ac_w_m = wing_x_m + x_ac_w * c_bar_m
-    x_cg_mac = (cg_x_m - wing_x_m) / max(c_bar_m, 0.001)  # fraction of MAC
+    # Shared tail volume terms: each ratio is divided out once here rather
+    # than in every derivative that uses it.
+    S_ratio_h = S_h_eff / S_w_m2
+    S_ratio_v = S_v_eff / S_w_m2
+    l_over_c = l_t_m / c_bar_m
+    l_over_c_sq = l_over_c * l_over_c
+    l_v_over_b = l_v_m / b_m
+    z_v_over_b = z_v_m / b_m
+    eta_t_S_h = a_t * eta_t * S_ratio_h  # tail lift per unit α at the tail
+    eta_v_S_v = a_v * eta_v * S_ratio_v  # fin side force per unit β at the fin
 
     # ── Longitudinal derivatives ─────────────────────────────────────────
 
     # CLα — total aircraft lift slope (DATCOM §4.1.3.2, §4.5)
     # # DATCOM §4.5 — wing + tail + fuselage body factor
     K_WB = 1.07  # Wing-Body interference factor (conventional layout)
-    CL_alpha = K_WB * a_w + a_t * eta_t * (S_h_eff / S_w_m2) * (1.0 - de_da)
+    CL_alpha = K_WB * a_w + eta_t_S_h * (1.0 - de_da)
 
     # CDα — drag slope (DATCOM §4.1.5)
     # # DATCOM §4.1.5 — induced drag contribution
     e_oswald = 0.80  # Oswald efficiency factor
-    CD0 = cd_min_w + CL_trim ** 2 / (math.pi * AR * e_oswald)
     CD_alpha = 2.0 * CL_trim / (math.pi * AR * e_oswald)
 
     # Cmα — pitch stiffness (DATCOM §4.5)
     # # DATCOM §4.5 — wing-body + tail contributions
     Cm_alpha = (
         a_w * K_WB * (x_cg_mac - x_ac_w)
-        - a_t * eta_t * (S_h_eff / S_w_m2) * (l_t_m / c_bar_m) * (1.0 - de_da)
+        - eta_t_S_h * l_over_c * (1.0 - de_da)
     )
 
     # CLq — lift due to pitch rate (DATCOM §7.1)
     # # DATCOM §7.1 — tail contribution dominates
-    CL_q = 2.0 * a_t * eta_t * (S_h_eff / S_w_m2) * (l_t_m / c_bar_m)
+    CL_q = 2.0 * eta_t_S_h * l_over_c
 
     # Cmq — pitch damping (DATCOM §7.1)
     # # DATCOM §7.1 — must be negative
-    Cm_q = -2.0 * a_t * eta_t * (S_h_eff / S_w_m2) * (l_t_m / c_bar_m) ** 2
+    Cm_q = -2.0 * eta_t_S_h * l_over_c_sq
 
     # CLalphadot, Cmalphadot — downwash-lag derivatives (DATCOM §7.1.2)
     # # DATCOM §7.1.2 — apparent mass terms
-    CL_alphadot = 2.0 * a_t * eta_t * (S_h_eff / S_w_m2) * (l_t_m / c_bar_m) * de_da
-    Cm_alphadot = -CL_alphadot * (l_t_m / c_bar_m)
+    CL_alphadot = 2.0 * eta_t_S_h * l_over_c * de_da
+    Cm_alphadot = -CL_alphadot * l_over_c
 
     # ── Lateral/directional derivatives ─────────────────────────────────
 
     # CYβ — side force due to sideslip (DATCOM §6.1.4)
     # # DATCOM §6.1.4 — vertical fin contribution
     dsigma_dbeta = 0.20  # sidewash gradient (typical conventional fuselage)
-    CY_beta = -a_v * eta_v * (S_v_eff / S_w_m2) * (1.0 + dsigma_dbeta)
+    CY_beta = -eta_v_S_v * (1.0 + dsigma_dbeta)
 
     # Clβ — dihedral effect (DATCOM §6.1.5)
     # # DATCOM §6.1.5 — dihedral + sweep + fin contributions
-    Gamma_eff_rad = math.radians(design.wing_dihedral)  # geometric dihedral
+    Gamma_eff_rad = dihedral_rad  # geometric dihedral
     Cl_beta_dihedral = -(a_0_w / (2.0 * math.pi)) * Gamma_eff_rad  # uses NeuralFoil slope
-    Cl_beta_sweep = -CL_trim * math.tan(sweep_le_rad) / (4.0 * AR) if AR > 0 else 0.0
-    Cl_beta_fin = -a_v * eta_v * (S_v_eff / S_w_m2) * (z_v_m / b_m)
+    Cl_beta_sweep = -CL_trim * tan_sweep_le / (4.0 * AR) if AR > 0 else 0.0
+    Cl_beta_fin = -eta_v_S_v * z_v_over_b
     Cl_beta = Cl_beta_dihedral + Cl_beta_sweep + Cl_beta_fin
 
     # Cnβ — directional stability (DATCOM §6.1.4)
     # # DATCOM §6.1.4 — fin + wing + fuselage contributions
-    Cn_beta_fin = a_v * eta_v * (S_v_eff / S_w_m2) * (l_v_m / b_m)
-    Cn_beta_wing = -CL_trim * (1.0 - 3.0 * lam) / (6.0 * (1.0 + lam)) * math.tan(sweep_le_rad)
+    Cn_beta_fin = eta_v_S_v * l_v_over_b
+    Cn_beta_wing = -CL_trim * (1.0 - 3.0 * lam) * (inv_1pl / 6.0) * tan_sweep_le
 
     # Fuselage contribution (destabilizing)
     # # DATCOM §6.1.4 — body contribution: k_n * k_rl * S_B_side * l_fus / (S_w * b)
     k_n = 0.01  # fuselage fineness correction (small for conventional fuselages)
     k_rl = 1.0  # Reynolds number correction (= 1.0 at Re > 1e5)
-    S_B_side_m2 = (design.fuselage_length * design.wing_chord * 0.35) / 1e6  # approx side area
-    l_fus_m = design.fuselage_length / 1000.0
     Cn_beta_fuselage = -k_n * k_rl * (S_B_side_m2 * l_fus_m) / (S_w_m2 * b_m)
 
     Cn_beta = Cn_beta_fin + Cn_beta_wing + Cn_beta_fuselage
 
     # Clp — roll damping (DATCOM §7.3)
     # # DATCOM §7.3 — wing roll damping, uses NeuralFoil section slope
-    Cl_p = -(a_0_w / 8.0) * (1.0 + 3.0 * lam) / (1.0 + lam)  # per rad
+    Cl_p = -(a_0_w / 8.0) * (1.0 + 3.0 * lam) * inv_1pl  # per rad
 
     # Cnr — yaw damping (DATCOM §7.4)
     # # DATCOM §7.4 — fin + wing contributions
-    Cn_r_fin = -a_v * eta_v * (S_v_eff / S_w_m2) * (l_v_m / b_m) ** 2
+    Cn_r_fin = -eta_v_S_v * (l_v_over_b * l_v_over_b)
     Cn_r_wing = -(CL_trim ** 2 / (math.pi * AR) + cd_min_w / 8.0)
     Cn_r = Cn_r_fin + Cn_r_wing
 
     # Clr — roll due to yaw rate (DATCOM §7.4)
     # # DATCOM §7.4 — coupling derivative
     Cl_r_wing = CL_trim / 4.0
-    Cl_r_fin = a_v * eta_v * (S_v_eff / S_w_m2) * (z_v_m / b_m) * (l_v_m / b_m)
+    Cl_r_fin = eta_v_S_v * z_v_over_b * l_v_over_b
     Cl_r = Cl_r_wing + Cl_r_fin
 
     # Cnp — yaw due to roll rate (DATCOM §7.5)
     # # DATCOM §7.5 — adverse yaw
-    Cn_p = -CL_trim / 8.0 * (1.0 - 3.0 * lam) / (1.0 + lam)
+    Cn_p = -CL_trim / 8.0 * (1.0 - 3.0 * lam) * inv_1pl
 
     # CYp, CYr — side force rate derivatives (DATCOM §7.5, §7.4)
     # # DATCOM §7.5/7.4 — secondary terms
-    CY_p = -a_v * eta_v * (S_v_eff / S_w_m2) * (z_v_m / b_m)
-    CY_r = 2.0 * a_v * eta_v * (S_v_eff / S_w_m2) * (l_v_m / b_m)
-
-    return StabilityDerivatives(
-        CL_alpha=CL_alpha,
-        CD_alpha=CD_alpha,
-        Cm_alpha=Cm_alpha,
-        CL_q=CL_q,
-        Cm_q=Cm_q,
-        CL_alphadot=CL_alphadot,
-        Cm_alphadot=Cm_alphadot,
-        CY_beta=CY_beta,
-        Cl_beta=Cl_beta,
-        Cn_beta=Cn_beta,
-        CY_p=CY_p,
-        Cl_p=Cl_p,
-        Cn_p=Cn_p,
-        CY_r=CY_r,
-        Cl_r=Cl_r,
-        Cn_r=Cn_r,
+    CY_p = -eta_v_S_v * z_v_over_b
+    CY_r = 2.0 * eta_v_S_v * l_v_over_b
+
+    return (
+        CL_alpha, CD_alpha, Cm_alpha, CL_q, Cm_q, CL_alphadot, Cm_alphadot,
+        CY_beta, Cl_beta, Cn_beta, CY_p, Cl_p, Cn_p, CY_r, Cl_r, Cn_r,
     )
 
 
+@_jit
+def _derivatives_kernel_batch(inputs: np.ndarray) -> np.ndarray:
+    """Apply _derivatives_kernel to each row of an (N, 27) input matrix.
+
+    Column 13 (has_tail) is stored as 1.0/0.0.
+    """
+    n = inputs.shape[0]
+    out = np.empty((n, 16))
+    for i in range(n):
+        r = inputs[i]
+        res = _derivatives_kernel(
+            r[0], r[1], r[2], r[3], r[4], r[5], r[6], r[7], r[8], r[9], r[10],
+            r[11], r[12], r[13] != 0.0, r[14], r[15], r[16], r[17], r[18], r[19],
+            r[20], r[21], r[22], r[23], r[24], r[25], r[26],
+        )
+        for j in range(16):
+            out[i, j] = res[j]
+    return out
+
+
 # ---------------------------------------------------------------------------
 # Eigenvalue helpers
 # ---------------------------------------------------------------------------
@@ -598,7 +868,7 @@ def _damping_freq_from_eigenvalue(ev: complex) -> tuple[float, float, float]:
     omega_d = abs(ev.imag)
     if omega_d < 1e-6:
         return 0.0, 0.0, 0.0
-    omega_n = math.sqrt(sigma ** 2 + omega_d ** 2)
+    omega_n = math.hypot(sigma, omega_d)  # no intermediate overflow for fast modes
     zeta = -sigma / omega_n if omega_n > 0 else 0.0
     period = 2.0 * math.pi / omega_d
     return omega_n, zeta, period
@@ -613,6 +883,8 @@ def compute_dynamic_modes(
     mass_props: "MassProperties",
     flight_cond: FlightCondition,
     derivs: StabilityDerivatives,
+    *,
+    wing: WingGeometry | None = None,
 ) -> DynamicModes:
     """Compute dynamic stability mode characteristics via eigenvalue analysis.
 
@@ -630,10 +902,311 @@ def compute_dynamic_modes(
         mass_props: Resolved mass properties.
         flight_cond: Trimmed flight condition.
         derivs: Stability derivatives (from compute_stability_derivatives).
+        wing: Precomputed wing_geometry(design); computed here if omitted.
 
     Returns:
         DynamicModes with all mode characteristics.
     """
+    if wing is None:
+        wing = wing_geometry(design)
+    A_long, A_lat = _state_matrices(design, mass_props, flight_cond, derivs, wing)
+    return _classify_modes(
+        derivs,
+        flight_cond.speed_ms,
+        _guarded_eigvals(A_long, "Longitudinal"),
+        _guarded_eigvals(A_lat, "Lateral"),
+    )
+
+
+def compute_dynamic_modes_batch(
+    designs: "Sequence[AircraftDesign]",
+    mass_props: "Sequence[MassProperties]",
+    flight_conds: Sequence[FlightCondition],
+    derivs: Sequence[StabilityDerivatives],
+) -> list[DynamicModes]:
+    """Batched compute_dynamic_modes for design sweeps.
+
+    State matrices are assembled per design into (N, 4, 4) stacks and each
+    stack is solved with one np.linalg.eigvals call, so LAPACK loops in C
+    instead of being dispatched N times from Python.  Mode classification
+    and fallbacks are shared with compute_dynamic_modes; results match it
+    exactly.
+
+    Args:
+        designs: Candidate designs.
+        mass_props: Resolved mass properties, one per design.
+        flight_conds: Trimmed flight conditions, one per design.
+        derivs: Stability derivatives, one per design.
+
+    Returns:
+        One DynamicModes per design, in input order.
+    """
+    if not len(designs) == len(mass_props) == len(flight_conds) == len(derivs):
+        raise ValueError("designs, mass_props, flight_conds and derivs must have equal length")
+
+    n = len(designs)
+    A_long = np.zeros((n, 4, 4))
+    A_lat = np.zeros((n, 4, 4))
+    for i, (design, mp, fc, dv) in enumerate(zip(designs, mass_props, flight_conds, derivs)):
+        A_long[i], A_lat[i] = _state_matrices(design, mp, fc, dv, wing_geometry(design))
+
+    evals_long = _guarded_eigvals_stack(A_long, "Longitudinal")
+    evals_lat = _guarded_eigvals_stack(A_lat, "Lateral")
+    return [
+        _classify_modes(dv, fc.speed_ms, ev_long, ev_lat)
+        for dv, fc, ev_long, ev_lat in zip(derivs, flight_conds, evals_long, evals_lat)
+    ]
+
+
+def _guarded_eigvals(A: np.ndarray, label: str) -> np.ndarray | None:
+    """Eigenvalues of one state matrix, or None if the fallback modes apply.
+
+    Degenerate designs are routed to the fallbacks by explicit checks
+    (non-finite matrix here, no oscillatory roots in _classify_modes)
+    instead of by raising; the except clause only catches a LAPACK
+    failure as a last resort.
+    """
+    if not np.isfinite(A).all():
+        warnings.warn(f"{label} eigenvalue computation failed: non-finite state matrix")
+        return None
+    try:
+        return np.linalg.eigvals(A)
+    except Exception as e:
+        warnings.warn(f"{label} eigenvalue computation failed: {e}")
+        return None
+
+
+def _guarded_eigvals_stack(A: np.ndarray, label: str) -> list[np.ndarray | None]:
+    """_guarded_eigvals over an (N, 4, 4) stack with one LAPACK call."""
+    finite = np.isfinite(A).all(axis=(1, 2))
+    try:
+        solved = iter(np.linalg.eigvals(A[finite]))
+    except Exception:
+        # A single row failed to converge: redo row by row so only it falls back
+        return [_guarded_eigvals(a, label) for a in A]
+    return [next(solved) if ok else _guarded_eigvals(a, label) for a, ok in zip(A, finite)]
+
+
+def _classify_modes(
+    derivs: StabilityDerivatives,
+    V: float,
+    evals_long: np.ndarray | None,
+    evals_lat: np.ndarray | None,
+) -> DynamicModes:
+    """Pick the dynamic modes out of the state-matrix eigenvalues.
+
+    None for either set of eigenvalues selects that axis's fallback modes.
+    """
+    # ── Longitudinal modes ─────────────────────────────────────────────────
+    # Separate oscillatory (complex) roots from aperiodic (real) roots.
+    # Threshold: |imag| > 1e-3 rad/s distinguishes oscillatory from aperiodic.
+    # One pass over the four roots keeps the highest- and lowest-|imag|
+    # oscillatory ones; no list is built or sorted.
+    n_osc = 0
+    sp_ev = ph_ev = 0j
+    for e in () if evals_long is None else evals_long:
+        w = abs(e.imag)
+        if w > 1e-3:
+            if n_osc == 0 or w > abs(sp_ev.imag):
+                sp_ev = e
+            if n_osc == 0 or w <= abs(ph_ev.imag):
+                ph_ev = e
+            n_osc += 1
+
+    if n_osc >= 2:
+        # Normal case: two complex-conjugate pairs.
+        # Highest |imag| = short-period, lowest |imag| = phugoid.
+        sp_omega_n, sp_zeta, sp_period_s = _damping_freq_from_eigenvalue(sp_ev)
+        ph_omega_n, ph_zeta, ph_period_s = _damping_freq_from_eigenvalue(ph_ev)
+
+        # Sanity check: phugoid frequency must be positive and finite
+        if ph_omega_n < 1e-6 or not math.isfinite(ph_omega_n):
+            ph_omega_n = _G * math.sqrt(2.0) / V
+            ph_period_s = 2.0 * math.pi / ph_omega_n
+    elif n_osc == 1:
+        # Only short-period is oscillatory; phugoid is overdamped — real roots.
+        sp_omega_n, sp_zeta, sp_period_s = _damping_freq_from_eigenvalue(sp_ev)
+        # Phugoid: fall back to Lanchester approximation
+        ph_omega_n = _G * math.sqrt(2.0) / V
+        ph_zeta = 0.05
+        ph_period_s = 2.0 * math.pi / ph_omega_n
+    else:
+        if evals_long is not None:
+            warnings.warn(
+                "Longitudinal eigenvalue computation failed: "
+                "No oscillatory longitudinal eigenvalues found"
+            )
+        # Fallback: Lanchester approximation for phugoid
+        ph_omega_n = _G * math.sqrt(2.0) / V
+        ph_zeta = 0.05
+        ph_period_s = 2.0 * math.pi / ph_omega_n
+        sp_omega_n = max(abs(derivs.Cm_q), 0.5)
+        sp_zeta = 0.5
+        sp_period_s = 2.0 * math.pi / max(sp_omega_n, 0.01)
+
+    # ── Lateral modes ──────────────────────────────────────────────────────
+    if evals_lat is not None:
+        # Separate complex pairs (Dutch roll) from real roots (roll, spiral)
+        # in a single scan: first complex root, most and least negative real.
+        dr_ev = None
+        n_real = 0
+        most_neg = math.inf
+        least_neg = -math.inf
+        for e in evals_lat:
+            if abs(e.imag) > 1e-3:
+                if dr_ev is None:
+                    dr_ev = e
+            else:
+                r = e.real
+                if r < most_neg:
+                    most_neg = r
+                if r > least_neg:
+                    least_neg = r
+                n_real += 1
+
+        # Dutch roll: complex conjugate pair
+        if dr_ev is not None:
+            dr_omega_n, dr_zeta, dr_period_s = _damping_freq_from_eigenvalue(dr_ev)
+        else:
+            dr_omega_n, dr_zeta, dr_period_s = 0.0, 0.0, 0.0
+
+        # Real roots: more negative = roll mode, less negative (or positive) = spiral
+        if n_real >= 2:
+            # Roll mode: most negative real eigenvalue (large negative = fast convergence)
+            roll_ev = most_neg
+            spiral_ev_val = least_neg  # least negative (or positive = divergent)
+        elif n_real == 1:
+            roll_ev = most_neg
+            spiral_ev_val = 0.0
+        else:
+            roll_ev = -2.0  # default
+            spiral_ev_val = 0.01
+
+        roll_tau_s = -1.0 / roll_ev if abs(roll_ev) > 1e-6 else 10.0
+        # spiral_tau_s convention: positive = stable/convergent, negative = divergent.
+        # Eigenvalue sign: stable spiral has s < 0, divergent has s > 0.
+        # tau = -1/s → stable: tau > 0, divergent: tau < 0.  Matches docstring.
+        spiral_tau_s = -1.0 / spiral_ev_val if abs(spiral_ev_val) > 1e-6 else 1e6
+
+        # Time to double for spiral (divergent if spiral_ev_val > 0)
+        if spiral_ev_val > 1e-6:
+            spiral_t2_s = math.log(2.0) / spiral_ev_val
+        else:
+            spiral_t2_s = math.inf  # stable or neutral
+    else:
+        dr_omega_n, dr_zeta, dr_period_s = 1.0, 0.1, 6.0
+        roll_tau_s = 0.3
+        spiral_tau_s = 100.0
+        spiral_t2_s = math.inf
+
+    return _build_modes(
+        derivs,
+        sp_omega_n, sp_zeta, sp_period_s,
+        ph_omega_n, ph_zeta, ph_period_s,
+        dr_omega_n, dr_zeta, dr_period_s,
+        roll_tau_s, spiral_tau_s, spiral_t2_s,
+    )
+
+
+def compute_dynamic_modes_fast(
+    design: "AircraftDesign",
+    mass_props: "MassProperties",
+    flight_cond: FlightCondition,
+    derivs: StabilityDerivatives,
+    *,
+    wing: WingGeometry | None = None,
+) -> DynamicModes:
+    """Approximate dynamic modes from closed-form literal factors (no eigensolve).
+
+    Uses the classical decoupled approximations on the same state matrices
+    that compute_dynamic_modes solves exactly:
+      - short period: [Δw, q] 2×2 block
+      - phugoid: Lanchester frequency, damping from X_u
+      - Dutch roll: [β, r] 2×2 block
+      - roll: τ = -1/L_p
+      - spiral: λ = (L_β N_r - L_r N_β) / L_β
+
+    The approximations follow Nelson (1998) §4.4 (longitudinal) and §5.6
+    (lateral-directional).
+
+    Intended for sweeps that only need mode metadata.  Short-period, roll
+    and Dutch-roll figures track the eigenvalue path closely on
+    conventional layouts; phugoid damping and especially the spiral root
+    can be off by tens of percent (or in sign) where modes couple.  Same
+    arguments and fallbacks as compute_dynamic_modes.
+    """
+    V = flight_cond.speed_ms
+    if wing is None:
+        wing = wing_geometry(design)
+    A_long, A_lat = _state_matrices(design, mass_props, flight_cond, derivs, wing)
+
+    # Short period: [Δw, q] block, Nelson (1998) eq. 4.71
+    sp_omega_n, sp_zeta, sp_period_s = _second_order_mode(
+        A_long[1, 1], A_long[1, 2], A_long[2, 1], A_long[2, 2],
+    )
+
+    # Phugoid: Lanchester frequency; damping from the speed derivative X_u
+    ph_omega_n = _G * math.sqrt(2.0) / V
+    ph_zeta = -A_long[0, 0] / (2.0 * ph_omega_n)
+    ph_period_s = 2.0 * math.pi / ph_omega_n
+
+    # Dutch roll: [β, r] block, Nelson (1998) eq. 5.68
+    dr_omega_n, dr_zeta, dr_period_s = _second_order_mode(
+        A_lat[0, 0], A_lat[0, 2], A_lat[2, 0], A_lat[2, 2],
+    )
+
+    # Roll: single-degree-of-freedom roll subsidence
+    L_p = A_lat[1, 1]
+    roll_tau_s = -1.0 / L_p if abs(L_p) > 1e-6 else 10.0
+
+    # Spiral: Nelson (1998) eq. 5.66; same sign conventions as the eig path
+    L_beta, L_r = A_lat[1, 0], A_lat[1, 2]
+    N_beta, N_r = A_lat[2, 0], A_lat[2, 2]
+    spiral_ev_val = (L_beta * N_r - L_r * N_beta) / L_beta if abs(L_beta) > 1e-12 else 0.0
+    spiral_tau_s = -1.0 / spiral_ev_val if abs(spiral_ev_val) > 1e-6 else 1e6
+    if spiral_ev_val > 1e-6:
+        spiral_t2_s = math.log(2.0) / spiral_ev_val
+    else:
+        spiral_t2_s = math.inf  # stable or neutral
+
+    return _build_modes(
+        derivs,
+        sp_omega_n, sp_zeta, sp_period_s,
+        ph_omega_n, ph_zeta, ph_period_s,
+        dr_omega_n, dr_zeta, dr_period_s,
+        roll_tau_s, spiral_tau_s, spiral_t2_s,
+    )
+
+
+def _second_order_mode(a: float, b: float, c: float, d: float) -> tuple[float, float, float]:
+    """(omega_n, zeta, period_s) of the 2×2 system [[a, b], [c, d]].
+
+    Characteristic equation s² - (a + d)s + (ad - bc) = 0.  Divergent
+    blocks return NaN and over-damped ones an infinite period, which
+    _build_modes replaces with its defaults.
+    """
+    det = a * d - b * c
+    if det <= 0.0:
+        return math.nan, math.nan, math.nan  # divergent -- use defaults
+    omega_n = math.sqrt(det)
+    zeta = -(a + d) / (2.0 * omega_n)
+    if abs(zeta) >= 1.0:
+        return omega_n, zeta, math.inf
+    return omega_n, zeta, 2.0 * math.pi / (omega_n * math.sqrt(1.0 - zeta * zeta))
+
+
+def _state_matrices(
+    design: "AircraftDesign",
+    mass_props: "MassProperties",
+    flight_cond: FlightCondition,
+    derivs: StabilityDerivatives,
+    wing: WingGeometry,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Assemble the dimensional (A_long, A_lat) state matrices.
+
+    Longitudinal state: [Δu, Δw, q, Δθ]
+    Lateral state: [β, p, r, φ]
+    """
     V = flight_cond.speed_ms
     rho = flight_cond.rho
     q_bar = flight_cond.q_bar
@@ -641,14 +1214,9 @@ def compute_dynamic_modes(
     alpha_0 = flight_cond.alpha_trim_rad
 
     # ── Geometry and mass (SI) ─────────────────────────────────────────────
-    b_m = design.wing_span / 1000.0
-    root_chord_m = design.wing_chord / 1000.0
-    tip_chord_m = root_chord_m * design.wing_tip_root_ratio
-    S_w_m2 = 0.5 * (root_chord_m + tip_chord_m) * b_m
-    c_bar_m = 2.0 / 3.0 * root_chord_m * (
-        (1.0 + design.wing_tip_root_ratio + design.wing_tip_root_ratio ** 2)
-        / (1.0 + design.wing_tip_root_ratio)
-    )
+    b_m = wing.b_m
+    S_w_m2 = wing.S_w_m2
+    c_bar_m = wing.c_bar_m
 
     m_kg = mass_props.mass_g / 1000.0
     W_N = m_kg * _G
@@ -671,9 +1239,11 @@ def compute_dynamic_modes(
     # Reference: Nelson (1998) eq. 4.52
 
     # Dimensional stability derivatives
-    X_u = -qS * (2.0 * CL_trim * math.sin(alpha_0) + derivs.CD_alpha * math.cos(alpha_0)) / (m_kg * V)
-    X_w = qS * (CL_trim * math.cos(alpha_0) - derivs.CD_alpha * math.sin(alpha_0)) / (m_kg * V)
-    Z_u = -qS * (2.0 * CL_trim * math.cos(alpha_0) + derivs.CD_alpha * math.sin(alpha_0)) / (m_kg * V)
+    sin_a0 = math.sin(alpha_0)
+    cos_a0 = math.cos(alpha_0)
+    X_u = -qS * (2.0 * CL_trim * sin_a0 + derivs.CD_alpha * cos_a0) / (m_kg * V)
+    X_w = qS * (CL_trim * cos_a0 - derivs.CD_alpha * sin_a0) / (m_kg * V)
+    Z_u = -qS * (2.0 * CL_trim * cos_a0 + derivs.CD_alpha * sin_a0) / (m_kg * V)
     Z_w = -qS * derivs.CL_alpha / (m_kg * V)
     Z_q = qS * derivs.CL_q * c_bar_m / (2.0 * m_kg * V)
     Z_adot = qS * derivs.CL_alphadot * c_bar_m / (2.0 * m_kg * V)
@@ -687,14 +1257,22 @@ def compute_dynamic_modes(
     # Row 2: q_dot  = M_u*Δu + (M_w + M_adot*Z_w/V)*Δw + M_q*q + M_adot*Z_q/V*q (simplified)
     # Row 3: θ_dot  = q
 
-    theta0 = alpha_0  # assume theta0 ~ alpha0 for level flight
-
-    A_long = np.array([
-        [X_u,   X_w,   0.0,          -_G * math.cos(theta0)],
-        [Z_u,   Z_w,   V + Z_q,      -_G * math.sin(theta0)],
-        [0.0,   M_w + M_adot * Z_w / V,  M_q + M_adot * (V + Z_q) / V,  0.0],
-        [0.0,   0.0,   1.0,           0.0],
-    ], dtype=float)
+    # theta0 ~ alpha0 for level flight, so cos/sin(theta0) reuse cos_a0/sin_a0
+
+    # Filled cell by cell into a fresh zero matrix: about half the cost of
+    # np.array() on nested lists.  Per call, not a shared module buffer,
+    # since the pipeline may run concurrently in worker threads.
+    A_long = np.zeros((4, 4))
+    A_long[0, 0] = X_u
+    A_long[0, 1] = X_w
+    A_long[0, 3] = -_G * cos_a0
+    A_long[1, 0] = Z_u
+    A_long[1, 1] = Z_w
+    A_long[1, 2] = V + Z_q
+    A_long[1, 3] = -_G * sin_a0
+    A_long[2, 1] = M_w + M_adot * Z_w / V
+    A_long[2, 2] = M_q + M_adot * (V + Z_q) / V
+    A_long[3, 2] = 1.0
 
     # ── Lateral state matrix A_lat (dimensional) ───────────────────────────
     # State: [β, p, r, φ]
@@ -715,110 +1293,38 @@ def compute_dynamic_modes(
     #   The '-1' comes from the kinematic coupling: β̇ = ... - r (from v̇ = ... - u0*r)
     #   Y_p and Y_r are already dimensional (qSb/(2mV) × CY_p/r).
     # Row 4 (φ): φ̇ = p  (roll rate integrates to bank angle, θ≈0 so tan(θ)≈0)
-    A_lat = np.array([
-        [Y_beta,    Y_p,           Y_r - 1.0,      _G / V],
-        [L_beta,    L_p,           L_r,            0.0   ],
-        [N_beta,    N_p,           N_r,            0.0   ],
-        [0.0,       1.0,           0.0,            0.0   ],
-    ], dtype=float)
-
-    # ── Longitudinal eigenvalues ───────────────────────────────────────────
-    try:
-        evals_long = np.linalg.eig(A_long)[0]
-
-        # Separate oscillatory (complex) roots from aperiodic (real) roots.
-        # Threshold: |imag| > 1e-3 rad/s distinguishes oscillatory from aperiodic.
-        osc_long = sorted(
-            [e for e in evals_long if abs(e.imag) > 1e-3],
-            key=lambda e: abs(e.imag),
-            reverse=True,
-        )
-
-        if len(osc_long) >= 2:
-            # Normal case: two complex-conjugate pairs.
-            # Highest |imag| = short-period, lowest |imag| = phugoid.
-            sp_ev = osc_long[0]
-            sp_omega_n, sp_zeta, sp_period_s = _damping_freq_from_eigenvalue(sp_ev)
-            # Phugoid is the other oscillatory mode (last pair after SP pair)
-            ph_ev = osc_long[-1]
-            ph_omega_n, ph_zeta, ph_period_s = _damping_freq_from_eigenvalue(ph_ev)
-        elif len(osc_long) == 1:
-            # Only short-period is oscillatory; phugoid is overdamped — real roots.
-            sp_ev = osc_long[0]
-            sp_omega_n, sp_zeta, sp_period_s = _damping_freq_from_eigenvalue(sp_ev)
-            # Phugoid: fall back to Lanchester approximation
-            ph_omega_n = _G * math.sqrt(2.0) / V
-            ph_zeta = 0.05
-            ph_period_s = 2.0 * math.pi / ph_omega_n
-        else:
-            # No oscillatory modes — pure fallback
-            raise ValueError("No oscillatory longitudinal eigenvalues found")
-
-        # Sanity check: phugoid frequency must be positive and finite
-        ph_omega_lanchester = _G * math.sqrt(2.0) / V
-        if ph_omega_n < 1e-6 or not math.isfinite(ph_omega_n):
-            ph_omega_n = ph_omega_lanchester
-            ph_period_s = 2.0 * math.pi / ph_omega_n
-
-    except Exception as e:
-        warnings.warn(f"Longitudinal eigenvalue computation failed: {e}")
-        # Fallback: Lanchester approximation for phugoid
-        ph_omega_n = _G * math.sqrt(2.0) / V
-        ph_zeta = 0.05
-        ph_period_s = 2.0 * math.pi / ph_omega_n
-        sp_omega_n = max(abs(derivs.Cm_q), 0.5)
-        sp_zeta = 0.5
-        sp_period_s = 2.0 * math.pi / max(sp_omega_n, 0.01)
-
-    # ── Lateral eigenvalues ────────────────────────────────────────────────
-    try:
-        evals_lat = np.linalg.eig(A_lat)[0]
-
-        # Separate complex pairs (Dutch roll) from real roots (roll, spiral)
-        complex_evs = [e for e in evals_lat if abs(e.imag) > 1e-3]
-        real_evs = sorted(
-            [e.real for e in evals_lat if abs(e.imag) <= 1e-3],
-            key=lambda r: r  # ascending
-        )
-
-        # Dutch roll: complex conjugate pair
-        if complex_evs:
-            dr_ev = complex_evs[0]
-            dr_omega_n, dr_zeta, dr_period_s = _damping_freq_from_eigenvalue(dr_ev)
-        else:
-            dr_omega_n, dr_zeta, dr_period_s = 0.0, 0.0, 0.0
-
-        # Real roots: more negative = roll mode, less negative (or positive) = spiral
-        if len(real_evs) >= 2:
-            # Roll mode: most negative real eigenvalue (large negative = fast convergence)
-            roll_ev = min(real_evs)  # most negative
-            spiral_ev_val = max(real_evs)  # least negative (or positive = divergent)
-        elif len(real_evs) == 1:
-            roll_ev = real_evs[0]
-            spiral_ev_val = 0.0
-        else:
-            roll_ev = -2.0  # default
-            spiral_ev_val = 0.01
-
-        roll_tau_s = -1.0 / roll_ev if abs(roll_ev) > 1e-6 else 10.0
-        # spiral_tau_s convention: positive = stable/convergent, negative = divergent.
-        # Eigenvalue sign: stable spiral has s < 0, divergent has s > 0.
-        # tau = -1/s → stable: tau > 0, divergent: tau < 0.  Matches docstring.
-        spiral_tau_s = -1.0 / spiral_ev_val if abs(spiral_ev_val) > 1e-6 else 1e6
-
-        # Time to double for spiral (divergent if spiral_ev_val > 0)
-        if spiral_ev_val > 1e-6:
-            spiral_t2_s = math.log(2.0) / spiral_ev_val
-        else:
-            spiral_t2_s = math.inf  # stable or neutral
-
-    except Exception as e:
-        warnings.warn(f"Lateral eigenvalue computation failed: {e}")
-        dr_omega_n, dr_zeta, dr_period_s = 1.0, 0.1, 6.0
-        roll_tau_s = 0.3
-        spiral_tau_s = 100.0
-        spiral_t2_s = math.inf
-
+    A_lat = np.zeros((4, 4))
+    A_lat[0, 0] = Y_beta
+    A_lat[0, 1] = Y_p
+    A_lat[0, 2] = Y_r - 1.0
+    A_lat[0, 3] = _G / V
+    A_lat[1, 0] = L_beta
+    A_lat[1, 1] = L_p
+    A_lat[1, 2] = L_r
+    A_lat[2, 0] = N_beta
+    A_lat[2, 1] = N_p
+    A_lat[2, 2] = N_r
+    A_lat[3, 1] = 1.0
+
+    return A_long, A_lat
+
+
+def _build_modes(
+    derivs: StabilityDerivatives,
+    sp_omega_n: float,
+    sp_zeta: float,
+    sp_period_s: float,
+    ph_omega_n: float,
+    ph_zeta: float,
+    ph_period_s: float,
+    dr_omega_n: float,
+    dr_zeta: float,
+    dr_period_s: float,
+    roll_tau_s: float,
+    spiral_tau_s: float,
+    spiral_t2_s: float,
+) -> DynamicModes:
+    """Package mode results, clamping NaN/inf and passing derivatives through."""
     # Clamp NaN/inf to safe defaults
     def _safe(val: float, default: float = 0.0) -> float:
         if not math.isfinite(val):
@@ -6,11 +6,16 @@ assembled with tight alignment and adequate bonding area.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import logging
+from typing import TYPE_CHECKING, NamedTuple
 
 if TYPE_CHECKING:
     import cadquery as cq
 
+    from backend.export.section import SectionPart
+
+logger = logging.getLogger("cheng.joints")
+
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
@@ -18,6 +23,8 @@ if TYPE_CHECKING:
 _TONGUE_AREA_FRACTION: float = 0.60   # Tongue = 60% of cross-sectional area
 _TONGUE_FILLET_RADIUS_MM: float = 1.0  # Fillet on tongue corners
 _GROOVE_DEPTH_CLEARANCE_MM: float = 0.2  # Extra groove depth for printer tolerance
+_GLUE_CONTACT_EPS_MM: float = 1e-6  # Tongue/section gap still treated as face contact
+_AXIS_INDEX: dict[str, int] = {"X": 0, "Y": 1, "Z": 2}
 
 
 # ---------------------------------------------------------------------------
@@ -32,6 +39,8 @@ def add_tongue_and_groove(
     tolerance: float,
     nozzle_diameter: float,
     split_axis: str = "Y",
+    left_bbox: tuple[float, float, float, float, float, float] | None = None,
+    right_bbox: tuple[float, float, float, float, float, float] | None = None,
 ) -> tuple[cq.Workplane, cq.Workplane]:
     """Add tongue-and-groove joint features to two adjacent sections.
 
@@ -51,27 +60,26 @@ def add_tongue_and_groove(
         nozzle_diameter: FDM nozzle in mm (PR06).  Min tongue = 3x this.
         split_axis:      Axis along which sections were split ("X", "Y", or "Z").
                          Determines which face the tongue/groove is placed on.
+        left_bbox:       Known (xmin, ymin, zmin, xmax, ymax, zmax) of ``left``,
+                         e.g. SectionPart.bbox; measured from the solid if None.
+        right_bbox:      Same for ``right``.
 
     Returns:
         (modified_left, modified_right) with joint features applied.
     """
-    import cadquery as cq  # noqa: F811
-
     # Get bounding box of the left section to determine joint dimensions
-    bb = left.val().BoundingBox()
-    dx = bb.xmax - bb.xmin
-    dy = bb.ymax - bb.ymin
-    dz = bb.zmax - bb.zmin
-
-    # Determine cross-section dimensions based on split axis.
-    # The tongue is placed on the face perpendicular to the split axis.
-    # cross_dim_a and cross_dim_b are the two dimensions of that face.
-    if split_axis == "X":
-        cross_dim_a, cross_dim_b = dy, dz
-    elif split_axis == "Z":
-        cross_dim_a, cross_dim_b = dx, dy
-    else:  # "Y" (default)
-        cross_dim_a, cross_dim_b = dx, dz
+    bb = _Bounds(*left_bbox) if left_bbox is not None else left.val().BoundingBox()
+    bb_r = _Bounds(*right_bbox) if right_bbox is not None else right.val().BoundingBox()
+    lo, hi = (bb.xmin, bb.ymin, bb.zmin), (bb.xmax, bb.ymax, bb.zmax)
+    lo_r, hi_r = (bb_r.xmin, bb_r.ymin, bb_r.zmin), (bb_r.xmax, bb_r.ymax, bb_r.zmax)
+
+    # The tongue is placed on the face perpendicular to the split axis;
+    # cross_dim_a and cross_dim_b are the two dimensions of that face, in
+    # X, Y, Z order with the split axis left out.  Unknown axes mean "Y".
+    axis = _AXIS_INDEX.get(split_axis, 1)
+    cross_a, cross_b = (i for i in range(3) if i != axis)
+    cross_dim_a = hi[cross_a] - lo[cross_a]
+    cross_dim_b = hi[cross_b] - lo[cross_b]
 
     # Minimum tongue width
     min_tongue_width = 3.0 * nozzle_diameter
@@ -87,69 +95,11 @@ def add_tongue_and_groove(
     # Groove is slightly deeper than tongue length for printer tolerance clearance (#87).
     groove_depth = overlap + _GROOVE_DEPTH_CLEARANCE_MM
 
-    bb_r = right.val().BoundingBox()
-
-    # Build tongue and groove geometry based on split axis
-    if split_axis == "X":
-        # Split along X: tongue protrudes from +X face of left
-        cy = (bb.ymin + bb.ymax) / 2.0
-        cz = (bb.zmin + bb.zmax) / 2.0
-        tongue_center = bb.xmax + overlap / 2.0
-        tongue = (
-            cq.Workplane("XY")
-            .transformed(offset=(tongue_center, cy, cz))
-            .box(overlap, tongue_a, tongue_b)
-        )
-        fillet_edge_sel = "|X"
-
-        cy_r = (bb_r.ymin + bb_r.ymax) / 2.0
-        cz_r = (bb_r.zmin + bb_r.zmax) / 2.0
-        groove_center = bb_r.xmin + groove_depth / 2.0
-        groove = (
-            cq.Workplane("XY")
-            .transformed(offset=(groove_center, cy_r, cz_r))
-            .box(groove_depth, groove_a, groove_b)
-        )
-    elif split_axis == "Z":
-        # Split along Z: tongue protrudes from +Z face of left
-        cx = (bb.xmin + bb.xmax) / 2.0
-        cy = (bb.ymin + bb.ymax) / 2.0
-        tongue_center = bb.zmax + overlap / 2.0
-        tongue = (
-            cq.Workplane("XY")
-            .transformed(offset=(cx, cy, tongue_center))
-            .box(tongue_a, tongue_b, overlap)
-        )
-        fillet_edge_sel = "|Z"
-
-        cx_r = (bb_r.xmin + bb_r.xmax) / 2.0
-        cy_r = (bb_r.ymin + bb_r.ymax) / 2.0
-        groove_center = bb_r.zmin + groove_depth / 2.0
-        groove = (
-            cq.Workplane("XY")
-            .transformed(offset=(cx_r, cy_r, groove_center))
-            .box(groove_a, groove_b, groove_depth)
-        )
-    else:
-        # Split along Y (default): tongue protrudes from +Y face of left
-        cx = (bb.xmin + bb.xmax) / 2.0
-        cz = (bb.zmin + bb.zmax) / 2.0
-        tongue_center = bb.ymax + overlap / 2.0
-        tongue = (
-            cq.Workplane("XY")
-            .transformed(offset=(cx, tongue_center, cz))
-            .box(tongue_a, overlap, tongue_b)
-        )
-        fillet_edge_sel = "|Y"
-
-        cx_r = (bb_r.xmin + bb_r.xmax) / 2.0
-        cz_r = (bb_r.zmin + bb_r.zmax) / 2.0
-        groove_center = bb_r.ymin + groove_depth / 2.0
-        groove = (
-            cq.Workplane("XY")
-            .transformed(offset=(cx_r, groove_center, cz_r))
-            .box(groove_a, groove_depth, groove_b)
-        )
+    # Tongue protrudes from the +axis face of left; groove is cut into the
+    # -axis face of right.
+    tongue = _joint_box(lo, hi, axis, hi[axis], overlap, tongue_a, tongue_b)
+    groove = _joint_box(lo_r, hi_r, axis, lo_r[axis], groove_depth, groove_a, groove_b)
+    fillet_edge_sel = f"|{'XYZ'[axis]}"
 
     # Apply fillet to tongue edges if possible
     try:
@@ -158,11 +108,18 @@ def add_tongue_and_groove(
     except Exception:
         pass  # Fillet can fail on very small features
 
-    # Boolean operations: add tongue to left, cut groove from right
+    # Boolean operations: add tongue to left, cut groove from right.
+    # The tongue starts on the left section's +axis bounding plane, so the two
+    # solids only share that face and a glued fuse can skip the general
+    # face/face intersection pass.  Fall back to a full union if it fails.
     try:
-        modified_left = left.union(tongue)
+        glue = _touches_only_at_split_face(bb, tongue.val().BoundingBox(), split_axis)
+        modified_left = left.union(tongue, glue=glue)
     except Exception:
-        modified_left = left
+        try:
+            modified_left = left.union(tongue)
+        except Exception:
+            modified_left = left
 
     try:
         modified_right = right.cut(groove)
@@ -170,3 +127,108 @@ def add_tongue_and_groove(
         modified_right = right
 
     return (modified_left, modified_right)
+
+
+def add_joints_all(
+    parts: list[SectionPart],
+    overlap: float,
+    tolerance: float,
+    nozzle_diameter: float,
+) -> None:
+    """Joint every adjacent pair in one chain of sections, in place.
+
+    ``parts`` are the sections of a single (component, side), in any order;
+    they are chained by section_num.  Each pair gets add_tongue_and_groove
+    using the parts' cached bounding boxes, and both parts are re-measured
+    afterwards (#166).  A pair whose joint fails is logged and left plain
+    so the rest of the chain is still jointed.
+
+    Every boolean acts on one section plus one small tongue or groove box,
+    so the work is linear in the number of sections -- nothing accumulates
+    across the chain.
+
+    Args:
+        parts:           Sections of one component side.
+        overlap:         Tongue/groove length in mm (PR05).
+        tolerance:       Clearance per side in mm (PR11).
+        nozzle_diameter: FDM nozzle in mm (PR06).
+    """
+    chain = sorted(parts, key=lambda sp: sp.section_num)
+    for left, right in zip(chain, chain[1:]):
+        try:
+            left.solid, right.solid = add_tongue_and_groove(
+                left.solid,
+                right.solid,
+                overlap=overlap,
+                tolerance=tolerance,
+                nozzle_diameter=nozzle_diameter,
+                split_axis=left.split_axis,
+                left_bbox=left.bbox,
+                right_bbox=right.bbox,
+            )
+            left.recompute_dimensions()
+            right.recompute_dimensions()
+        except Exception as exc:
+            logger.warning(
+                "Joint creation failed for %s_%s sections %d-%d: %s",
+                left.component,
+                left.side,
+                left.section_num,
+                right.section_num,
+                exc,
+            )
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+class _Bounds(NamedTuple):
+    """A cached bounding box, readable like ``cq.BoundBox``."""
+
+    xmin: float
+    ymin: float
+    zmin: float
+    xmax: float
+    ymax: float
+    zmax: float
+
+
+def _joint_box(
+    lo: tuple[float, float, float],
+    hi: tuple[float, float, float],
+    axis: int,
+    start: float,
+    length: float,
+    size_a: float,
+    size_b: float,
+) -> cq.Workplane:
+    """Box running ``length`` along ``axis`` from ``start``.
+
+    The box is centred on the section's cross-section (given by ``lo`` and
+    ``hi``) and is ``size_a`` x ``size_b`` across it, in X, Y, Z order.
+    """
+    import cadquery as cq  # noqa: F811
+
+    center = [(lo[i] + hi[i]) / 2.0 for i in range(3)]
+    center[axis] = start + length / 2.0
+    size = [size_a, size_b]
+    size.insert(axis, length)
+    return cq.Workplane("XY").transformed(offset=tuple(center)).box(*size)
+
+
+def _touches_only_at_split_face(
+    bb: cq.BoundBox | _Bounds,
+    tongue_bb: cq.BoundBox,
+    split_axis: str,
+) -> bool:
+    """True if the tongue lies entirely on the +axis side of the section.
+
+    The solids can then meet only on the split plane, which is the
+    precondition for a glued (BOPAlgo_GlueShift) fuse.
+    """
+    axis = _AXIS_INDEX.get(split_axis, 1)
+    tongue_lo = (tongue_bb.xmin, tongue_bb.ymin, tongue_bb.zmin)
+    hi = (bb.xmax, bb.ymax, bb.zmax)
+    return tongue_lo[axis] >= hi[axis] - _GLUE_CONTACT_EPS_MM
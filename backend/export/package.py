@@ -9,16 +9,34 @@ Also provides STEP, DXF, and SVG export builders.
 
 from __future__ import annotations
 
+import contextlib
+import functools
+import hashlib
+import io
 import json
 import logging
+import multiprocessing
 import os
 import re
 import tempfile
+import time
 import uuid
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, TYPE_CHECKING
+from typing import Any, BinaryIO, Callable, Iterator, TYPE_CHECKING
+
+import numpy as np
+
+try:
+    import orjson
+
+    def _manifest_json(manifest: dict) -> bytes:
+        return orjson.dumps(manifest, option=orjson.OPT_INDENT_2)
+except ImportError:  # orjson is optional -- stdlib json writes equivalent JSON
+    def _manifest_json(manifest: dict) -> bytes:
+        return json.dumps(manifest, indent=2).encode("utf-8")
 
 from backend.models import AircraftDesign
 from backend.export.section import SectionPart
@@ -34,6 +52,47 @@ logger = logging.getLogger("cheng.package")
 
 EXPORT_TMP_DIR: Path = Path(os.environ.get("CHENG_DATA_DIR", tempfile.gettempdir())) / "tmp"
 
+# Scratch files in EXPORT_TMP_DIR are named "export-<unix epoch>-<random><suffix>".
+# backend.cleanup parses the epoch to skip stat() on files that are provably
+# fresh, so keep this prefix format in sync with cleanup._NAME_TS_RE.
+TMP_FILE_PREFIX = "export-"
+
+# Finished archives are renamed to "cheng_<name>_<id>_<uuid>.zip".  Together
+# with TMP_FILE_PREFIX this is the full set of names backend.cleanup will
+# touch -- anything else in EXPORT_TMP_DIR is left alone.
+ZIP_FILE_PREFIX = "cheng_"
+
+# STL sections are tessellated in this many worker processes (1 = inline,
+# the default).  Processes, not threads: binary STL packing is Python code
+# holding the GIL.  Each export starts its own pool and every spawned worker
+# re-imports CadQuery/OCP (seconds), so only opt in on hosts with spare cores
+# -- exports already run up to 4 at a time.
+EXPORT_WORKERS: int = max(1, int(os.environ.get("CHENG_EXPORT_WORKERS", "1")))
+
+# A pool is only started when at least this many sections need meshing;
+# below it the worker start-up costs more than it saves.
+EXPORT_PARALLEL_MIN_SECTIONS: int = 8
+
+# Opt-in: keep tessellated STLs in EXPORT_TMP_DIR/tesscache, keyed by the
+# section's BRep content, so re-exporting unchanged sections skips meshing.
+# Oldest entries beyond this count are evicted.  Off (0) by default because
+# EXPORT_TMP_DIR is tmpfs on Cloud Run, where cached meshes cost memory.
+TESS_CACHE_ENTRIES: int = max(0, int(os.environ.get("CHENG_TESS_CACHE_ENTRIES", "0")))
+
+# Bump when the STL writer's output changes so stale entries stop matching.
+_TESS_CACHE_VERSION = 1
+
+# DEFLATE level for archive payloads.  Binary STL from the default design
+# deflates to ~48% of its size at level 1 vs ~46% at level 6, for ~60% of the
+# CPU (about 45 ms/MB here) -- small next to tessellation, so every archive
+# builder uses DEFLATE at this level.
+ZIP_COMPRESSLEVEL = 1
+
+
+def _tmp_prefix() -> str:
+    """Return the NamedTemporaryFile prefix for a scratch file created now."""
+    return f"{TMP_FILE_PREFIX}{int(time.time())}-"
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -74,11 +133,12 @@ def _make_temp_zip(design: AircraftDesign) -> tuple[Path, Path]:
     design_id = _sanitize_filename(design.id[:8]) if design.id else "export"
     # #259: append UUID suffix to prevent concurrent-export filename collisions
     unique_suffix = uuid.uuid4().hex[:8]
-    zip_filename = f"cheng_{safe_name}_{design_id}_{unique_suffix}.zip"
+    zip_filename = f"{ZIP_FILE_PREFIX}{safe_name}_{design_id}_{unique_suffix}.zip"
     zip_path = tmp_dir / zip_filename
 
     tmp_file = tempfile.NamedTemporaryFile(
         dir=str(tmp_dir),
+        prefix=_tmp_prefix(),
         suffix=".zip",
         delete=False,
     )
@@ -103,7 +163,12 @@ def _finalize_zip(tmp_path: Path, zip_path: Path) -> Path:
 # ---------------------------------------------------------------------------
 
 
-def build_zip(sections: list[SectionPart], design: AircraftDesign) -> Path:
+def build_zip(
+    sections: list[SectionPart],
+    design: AircraftDesign,
+    *,
+    compression: int = zipfile.ZIP_DEFLATED,
+) -> Path:
     """Create ZIP archive with STL files and manifest.
 
     Tessellates each section (tolerance=0.1), writes STLs + manifest.json
@@ -119,35 +184,48 @@ def build_zip(sections: list[SectionPart], design: AircraftDesign) -> Path:
     - assembly_notes: list of assembly hint strings
 
     Args:
-        sections: List of SectionPart objects to export.
-        design:   The source AircraftDesign (for metadata).
+        sections:    List of SectionPart objects to export.
+        design:      The source AircraftDesign (for metadata).
+        compression: zipfile compression method.  ZIP_STORED skips DEFLATE,
+                     trading a ~2x larger archive for slightly less CPU.
 
     Returns:
         Path to temp ZIP file, closed and ready for streaming.
     """
-    from backend.geometry.tessellate import tessellate_for_export
-
     # Ensure temp directory exists
     tmp_dir = EXPORT_TMP_DIR
     tmp_dir.mkdir(parents=True, exist_ok=True)
 
-    # Build manifest
-    manifest = _build_manifest(sections, design)
-
     tmp_path, zip_path = _make_temp_zip(design)
 
-    with zipfile.ZipFile(tmp_path, "w", zipfile.ZIP_DEFLATED) as zf:
-        # Add manifest
-        zf.writestr("manifest.json", json.dumps(manifest, indent=2))
-
-        # Tessellate and add each section as binary STL
-        for section in sections:
-            stl_bytes = tessellate_for_export(section.solid, tolerance=0.1)
-            zf.writestr(section.filename, stl_bytes)
+    with zipfile.ZipFile(tmp_path, "w", compression, compresslevel=ZIP_COMPRESSLEVEL) as zf:
+        _write_stl_archive(zf, sections, design)
 
     return _finalize_zip(tmp_path, zip_path)
 
 
+def build_zip_bytes(sections: list[SectionPart], design: AircraftDesign) -> bytes:
+    """Create the same STL + manifest archive as build_zip(), in memory.
+
+    Uses the same DEFLATE policy (ZIP_COMPRESSLEVEL) as build_zip().  No temp
+    files are created unless the tessellation cache is enabled
+    (CHENG_TESS_CACHE_ENTRIES).
+
+    Args:
+        sections: List of SectionPart objects to export.
+        design:   The source AircraftDesign (for metadata).
+
+    Returns:
+        The complete ZIP archive as bytes.
+    """
+    buf = io.BytesIO()
+    with zipfile.ZipFile(
+        buf, "w", zipfile.ZIP_DEFLATED, compresslevel=ZIP_COMPRESSLEVEL,
+    ) as zf:
+        _write_stl_archive(zf, sections, design)
+    return buf.getvalue()
+
+
 # ---------------------------------------------------------------------------
 # Public API -- STEP export (#116)
 # ---------------------------------------------------------------------------
@@ -169,11 +247,11 @@ def build_step_zip(
     Returns:
         Path to temp ZIP file.
     """
-    import cadquery as cq
-
     tmp_path, zip_path = _make_temp_zip(design)
 
-    with zipfile.ZipFile(tmp_path, "w", zipfile.ZIP_DEFLATED) as zf:
+    with zipfile.ZipFile(
+        tmp_path, "w", zipfile.ZIP_DEFLATED, compresslevel=ZIP_COMPRESSLEVEL,
+    ) as zf:
         manifest = {
             "design_name": design.name,
             "design_id": design.id,
@@ -184,25 +262,16 @@ def build_step_zip(
             "files": [],
         }
 
-        for comp_name, solid in components.items():
-            step_filename = f"{comp_name}.step"
-
-            # Export to a temp file, then read bytes
-            step_tmp = tempfile.NamedTemporaryFile(
-                suffix=".step", delete=False, dir=str(EXPORT_TMP_DIR)
-            )
-            step_tmp_path = Path(step_tmp.name)
-            step_tmp.close()
-
-            try:
-                cq.exporters.export(solid, str(step_tmp_path), "STEP")
-                step_bytes = step_tmp_path.read_bytes()
-                zf.writestr(step_filename, step_bytes)
+        # The STEP writer only takes a path: export each component into one
+        # reused scratch file, then copy it into the archive in chunks.
+        with _scratch_file(".step") as step_tmp_path:
+            for comp_name, solid in components.items():
+                step_filename = f"{comp_name}.step"
+                _export_to_scratch(solid, step_tmp_path, "STEP")
+                zf.write(step_tmp_path, step_filename)
                 manifest["files"].append(step_filename)
-            finally:
-                step_tmp_path.unlink(missing_ok=True)
 
-        zf.writestr("manifest.json", json.dumps(manifest, indent=2))
+        _write_manifest(zf, manifest)
 
     return _finalize_zip(tmp_path, zip_path)
 
@@ -233,7 +302,9 @@ def build_dxf_zip(
 
     tmp_path, zip_path = _make_temp_zip(design)
 
-    with zipfile.ZipFile(tmp_path, "w", zipfile.ZIP_DEFLATED) as zf:
+    with zipfile.ZipFile(
+        tmp_path, "w", zipfile.ZIP_DEFLATED, compresslevel=ZIP_COMPRESSLEVEL,
+    ) as zf:
         manifest = {
             "design_name": design.name,
             "design_id": design.id,
@@ -244,65 +315,70 @@ def build_dxf_zip(
             "files": [],
         }
 
-        for comp_name, solid in components.items():
-            bb = solid.val().BoundingBox()
-
-            # Determine the primary axis for cross-sections
-            dx = bb.xmax - bb.xmin
-            dy = bb.ymax - bb.ymin
-            dz = bb.zmax - bb.zmin
-
-            # Choose the longest axis for cross-section stations
-            if comp_name.startswith("fuselage"):
-                # Fuselage: cross-sections along X (lengthwise)
-                axis = "X"
-                length = dx
-                axis_min, axis_max = bb.xmin, bb.xmax
-            else:
-                # Wings/tails: cross-sections along Y (spanwise)
-                axis = "Y"
-                length = dy
-                axis_min, axis_max = bb.ymin, bb.ymax
-
-            # Generate cross-sections at regular intervals
-            num_stations = max(3, int(length / 50))  # One every ~50mm
-            step_size = length / (num_stations + 1)
-
-            for i in range(1, num_stations + 1):
-                station_pos = axis_min + step_size * i
-                dxf_filename = f"{comp_name}_section_{i}of{num_stations}.dxf"
-
-                dxf_tmp = tempfile.NamedTemporaryFile(
-                    suffix=".dxf", delete=False, dir=str(EXPORT_TMP_DIR)
-                )
-                dxf_tmp_path = Path(dxf_tmp.name)
-                dxf_tmp.close()
-
+        # One scratch file serves every station of every component.
+        with _scratch_file(".dxf") as dxf_tmp_path:
+            for comp_name, solid in components.items():
+                bb = solid.val().BoundingBox()
+
+                # Determine the primary axis for cross-sections
+                dx = bb.xmax - bb.xmin
+                dy = bb.ymax - bb.ymin
+                dz = bb.zmax - bb.zmin
+
+                # Choose the longest axis for cross-section stations
+                if comp_name.startswith("fuselage"):
+                    # Fuselage: cross-sections along X (lengthwise)
+                    axis = "X"
+                    length = dx
+                    axis_min, axis_max = bb.xmin, bb.xmax
+                else:
+                    # Wings/tails: cross-sections along Y (spanwise)
+                    axis = "Y"
+                    length = dy
+                    axis_min, axis_max = bb.ymin, bb.ymax
+
+                # Generate cross-sections at regular intervals, excluding both ends
+                num_stations = max(3, int(length / 50))  # One every ~50mm
+                step_size = length / (num_stations + 1)
+                stations = np.linspace(
+                    axis_min + step_size, axis_max - step_size, num_stations,
+                ).tolist()
+
+                # Cut every station in one boolean; fall back to one cut per
+                # station below if the batched operation fails.
                 try:
-                    # Create a true 2D cross-section using CadQuery's .section()
-                    # Produces clean planar wires for laser cutting, unlike
-                    # thin-box intersection which creates 3D slivers with double lines.
-                    if axis == "X":
-                        wp = cq.Workplane("YZ", origin=(station_pos, 0, 0))
-                    else:
-                        wp = cq.Workplane("XZ", origin=(0, station_pos, 0))
-                    wp = wp.add(solid.val())
-                    section_wp = wp.section()
-
-                    cq.exporters.export(section_wp, str(dxf_tmp_path), "DXF")
-                    dxf_bytes = dxf_tmp_path.read_bytes()
-                    zf.writestr(dxf_filename, dxf_bytes)
-                    manifest["files"].append(dxf_filename)
-                    manifest["total_files"] += 1
-                except Exception as e:
-                    # Cross-section may fail at some stations (e.g. near tips)
-                    logger.warning(
-                        "DXF export failed for %s: %s", dxf_filename, e, exc_info=True
-                    )
-                finally:
-                    dxf_tmp_path.unlink(missing_ok=True)
-
-        zf.writestr("manifest.json", json.dumps(manifest, indent=2))
+                    cuts = _cross_sections(solid, axis, stations)
+                except Exception:
+                    logger.warning("Batched DXF sectioning failed for %s", comp_name, exc_info=True)
+                    cuts = None
+
+                for i, station_pos in enumerate(stations, start=1):
+                    dxf_filename = f"{comp_name}_section_{i}of{num_stations}.dxf"
+
+                    try:
+                        # Create a true 2D cross-section using CadQuery's .section()
+                        # Produces clean planar wires for laser cutting, unlike
+                        # thin-box intersection which creates 3D slivers with double lines.
+                        if axis == "X":
+                            wp = cq.Workplane("YZ", origin=(station_pos, 0, 0))
+                        else:
+                            wp = cq.Workplane("XZ", origin=(0, station_pos, 0))
+                        if cuts is not None:
+                            section_wp = wp.newObject([cuts[i - 1]])
+                        else:
+                            section_wp = wp.add(solid.val()).section()
+
+                        _export_to_scratch(section_wp, dxf_tmp_path, "DXF")
+                        zf.write(dxf_tmp_path, dxf_filename)
+                        manifest["files"].append(dxf_filename)
+                        manifest["total_files"] += 1
+                    except Exception as e:
+                        # Cross-section may fail at some stations (e.g. near tips)
+                        logger.warning(
+                            "DXF export failed for %s: %s", dxf_filename, e, exc_info=True
+                        )
+
+        _write_manifest(zf, manifest)
 
     return _finalize_zip(tmp_path, zip_path)
 
@@ -328,8 +404,6 @@ def build_svg_zip(
     Returns:
         Path to temp ZIP file.
     """
-    import cadquery as cq
-
     tmp_path, zip_path = _make_temp_zip(design)
 
     views = [
@@ -338,7 +412,9 @@ def build_svg_zip(
         ("side", "YZ"),
     ]
 
-    with zipfile.ZipFile(tmp_path, "w", zipfile.ZIP_DEFLATED) as zf:
+    with zipfile.ZipFile(
+        tmp_path, "w", zipfile.ZIP_DEFLATED, compresslevel=ZIP_COMPRESSLEVEL,
+    ) as zf:
         manifest = {
             "design_name": design.name,
             "design_id": design.id,
@@ -353,16 +429,10 @@ def build_svg_zip(
             for view_name, plane in views:
                 svg_filename = f"{comp_name}_{view_name}.svg"
 
-                svg_tmp = tempfile.NamedTemporaryFile(
-                    suffix=".svg", delete=False, dir=str(EXPORT_TMP_DIR)
-                )
-                svg_tmp_path = Path(svg_tmp.name)
-                svg_tmp.close()
-
                 try:
-                    cq.exporters.export(solid, str(svg_tmp_path), "SVG")
-                    svg_bytes = svg_tmp_path.read_bytes()
-                    zf.writestr(svg_filename, svg_bytes)
+                    # Same document cq.exporters.export(..., "SVG") writes,
+                    # built in memory instead of via a scratch file.
+                    zf.writestr(svg_filename, solid.toSvg())
                     manifest["files"].append(svg_filename)
                     manifest["total_files"] += 1
                 except Exception as e:
@@ -370,10 +440,8 @@ def build_svg_zip(
                     logger.warning(
                         "SVG export failed for %s: %s", svg_filename, e, exc_info=True
                     )
-                finally:
-                    svg_tmp_path.unlink(missing_ok=True)
 
-        zf.writestr("manifest.json", json.dumps(manifest, indent=2))
+        _write_manifest(zf, manifest)
 
     return _finalize_zip(tmp_path, zip_path)
 
@@ -383,6 +451,210 @@ def build_svg_zip(
 # ---------------------------------------------------------------------------
 
 
+def _cross_sections(
+    solid: cq.Workplane,
+    axis: str,
+    stations: list[float],
+) -> list[cq.Shape]:
+    """Planar cross-sections of ``solid`` at each station along X or Y.
+
+    Equivalent to Workplane.section() per station, but all cutting planes
+    are tools of a single BRepAlgoAPI_Common, so OCC intersects the solid
+    with them in one pass instead of re-preparing it for every station.
+    Result faces are assigned back to the nearest station.
+
+    Returns:
+        One compound of section faces per station (empty if the plane
+        misses the solid).
+    """
+    import cadquery as cq
+    from OCP.BRepAlgoAPI import BRepAlgoAPI_Common
+    from OCP.TopTools import TopTools_ListOfShape
+
+    normal = cq.Vector(1, 0, 0) if axis == "X" else cq.Vector(0, 1, 0)
+    args = TopTools_ListOfShape()
+    args.Append(solid.val().wrapped)
+    tools = TopTools_ListOfShape()
+    for pos in stations:
+        tools.Append(cq.Face.makePlane(basePnt=normal * pos, dir=normal).wrapped)
+
+    op = BRepAlgoAPI_Common()
+    op.SetArguments(args)
+    op.SetTools(tools)
+    op.SetRunParallel(True)
+    op.Build()
+    if not op.IsDone():
+        raise RuntimeError("cross-section boolean failed")
+
+    positions = np.asarray(stations)
+    faces: list[list[cq.Face]] = [[] for _ in stations]
+    for face in cq.Shape.cast(op.Shape()).Faces():
+        center = face.Center()
+        coord = center.x if axis == "X" else center.y
+        faces[int(np.abs(positions - coord).argmin())].append(face)
+    return [cq.Compound.makeCompound(group) for group in faces]
+
+
+def _export_to_scratch(shape: cq.Workplane, path: Path, export_type: str) -> None:
+    """cq.exporters.export into a reused scratch file, checking it was written.
+
+    The file is truncated first, so an exporter that silently writes nothing
+    raises here instead of leaving the previous entry's bytes to be archived
+    under the new name.
+    """
+    import cadquery as cq
+
+    path.write_bytes(b"")
+    cq.exporters.export(shape, str(path), export_type)
+    if path.stat().st_size == 0:
+        raise RuntimeError(f"{export_type} exporter produced no output")
+
+
+@contextlib.contextmanager
+def _scratch_file(suffix: str) -> Iterator[Path]:
+    """Yield one scratch path in EXPORT_TMP_DIR, removed on exit.
+
+    For exporters that can only write to a path: reuse the same file for
+    every entry instead of creating and unlinking one per entry.
+    """
+    scratch = tempfile.NamedTemporaryFile(
+        prefix=_tmp_prefix(), suffix=suffix, delete=False, dir=str(EXPORT_TMP_DIR)
+    )
+    scratch.close()
+    path = Path(scratch.name)
+    try:
+        yield path
+    finally:
+        path.unlink(missing_ok=True)
+
+
+def _write_stl_archive(
+    zf: zipfile.ZipFile,
+    sections: list[SectionPart],
+    design: AircraftDesign,
+) -> None:
+    """Write manifest.json and one binary STL per section into an open ZIP."""
+    from backend.geometry.tessellate import tessellate_for_export, tessellate_for_export_into
+
+    manifest = _build_manifest(sections, design)
+    _write_manifest(zf, manifest)
+
+    tolerance = 0.1
+    cache = EXPORT_TMP_DIR / "tesscache" if TESS_CACHE_ENTRIES else None
+    if cache is not None:
+        cache.mkdir(parents=True, exist_ok=True)
+        cached = [cache / f"{_tess_cache_key(s.solid, tolerance)}.stl" for s in sections]
+    else:
+        cached = [None] * len(sections)
+    hit = [path is not None and path.is_file() for path in cached]
+
+    # Tessellate the misses and add each section as binary STL.  Sections
+    # are independent, so with more than one worker they are tessellated
+    # in parallel and written back in order as results arrive.
+    misses = [section.solid for section, h in zip(sections, hit) if not h]
+    workers = min(EXPORT_WORKERS, len(misses))
+    if len(misses) < EXPORT_PARALLEL_MIN_SECTIONS:
+        workers = 1
+    with contextlib.ExitStack() as stack:
+        stls = None
+        if workers > 1:
+            # Solids travel to the workers as pickled BRep data.  "spawn" because
+            # forking a process that holds OCC state and server threads is unsafe.
+            pool = stack.enter_context(
+                ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"))
+            )
+            stls = pool.map(functools.partial(tessellate_for_export, tolerance=tolerance), misses)
+
+        for section, path, h in zip(sections, cached, hit):
+            if h:
+                try:
+                    os.utime(path)  # mark recently used for eviction
+                    zf.write(path, section.filename)
+                    continue
+                except FileNotFoundError:  # evicted by a concurrent export
+                    pass
+            if stls is not None and not h:
+                stl_bytes = next(stls)
+                zf.writestr(section.filename, stl_bytes)
+                if path is not None:
+                    _tess_cache_store(path, lambda fh: fh.write(stl_bytes))
+            elif path is not None:
+                _tess_cache_store(
+                    path,
+                    lambda fh: tessellate_for_export_into(section.solid, fh, tolerance=tolerance),
+                )
+                zf.write(path, section.filename)
+            else:
+                # Inline: stream triangles straight into the entry rather than
+                # materialising each STL as one bytes object first.
+                with zf.open(section.filename, "w", force_zip64=True) as fh:
+                    tessellate_for_export_into(section.solid, fh, tolerance=tolerance)
+
+    if cache is not None:
+        _prune_tess_cache(cache)
+
+
+def _tess_cache_key(solid: cq.Workplane, tolerance: float) -> str:
+    """Content key for a section's tessellation: hash of its BRep + settings."""
+    brep = io.BytesIO()
+    solid.val().exportBin(brep)
+    digest = hashlib.sha256(brep.getvalue())
+    digest.update(f"{tolerance!r}/{_TESS_CACHE_VERSION}".encode())
+    return digest.hexdigest()
+
+
+def _tess_cache_store(path: Path, write: Callable[[BinaryIO], Any]) -> None:
+    """Atomically create cache entry ``path`` from ``write(file)``."""
+    tmp = tempfile.NamedTemporaryFile(
+        prefix=_tmp_prefix(), suffix=".stl", delete=False, dir=str(path.parent)
+    )
+    try:
+        with tmp:
+            write(tmp)
+        os.replace(tmp.name, path)
+    except BaseException:
+        Path(tmp.name).unlink(missing_ok=True)
+        raise
+
+
+def _prune_tess_cache(cache: Path) -> None:
+    """Evict least-recently-used entries beyond TESS_CACHE_ENTRIES.
+
+    Scratch files from _tess_cache_store are left alone while another export
+    may still be writing them, and removed once older than the cleanup age:
+    the periodic sweep does not enter tesscache/, so a crashed writer's
+    scratch would otherwise never go away.
+    """
+    # Deferred: backend.cleanup imports this module
+    from backend.cleanup import MAX_AGE_SECONDS
+
+    stale_before = time.time() - MAX_AGE_SECONDS
+    entries = []
+    for path in cache.glob("*.stl"):
+        try:
+            mtime = path.stat().st_mtime
+        except FileNotFoundError:
+            continue
+        if path.name.startswith(TMP_FILE_PREFIX):
+            if mtime < stale_before:
+                path.unlink(missing_ok=True)
+            continue
+        entries.append((mtime, path))
+    entries.sort(reverse=True)
+    for _, path in entries[TESS_CACHE_ENTRIES:]:
+        path.unlink(missing_ok=True)
+
+
+def _write_manifest(zf: zipfile.ZipFile, manifest: dict) -> None:
+    """Write manifest.json into an open ZIP, stored uncompressed.
+
+    The manifest is a few KB of text; skipping DEFLATE for it avoids the
+    per-entry compressor setup for no meaningful size cost.  Serialized
+    straight to UTF-8 bytes (orjson when installed).
+    """
+    zf.writestr("manifest.json", _manifest_json(manifest), compress_type=zipfile.ZIP_STORED)
+
+
 def _build_manifest(
     sections: list[SectionPart],
     design: AircraftDesign,
@@ -69,14 +69,18 @@ class SectionPart:
     # ── Issue #147: Smart split metadata ────────────────────────────────
     split_position_mm: float = 0.0   # absolute coordinate of the split plane
     avoidance_zone_hit: bool = False  # True if optimizer moved from ideal midpoint
+    # Unrounded (xmin, ymin, zmin, xmax, ymax, zmax) of ``solid``, kept so
+    # joint placement does not re-walk the BRep; None if never measured.
+    bbox: tuple[float, float, float, float, float, float] | None = None
 
     def recompute_dimensions(self) -> None:
-        """Recompute dimensions_mm from the current solid's bounding box.
+        """Recompute dimensions_mm and bbox from the current solid.
 
         Call this after modifying the solid (e.g. adding joint features)
         to ensure dimensions_mm reflects the actual part size.
         """
-        dims = _get_dimensions(self.solid)
+        self.bbox = _get_bounding_box(self.solid)
+        dims = _bbox_dimensions(self.bbox)
         self.dimensions_mm = (round(dims[0], 1), round(dims[1], 1), round(dims[2], 1))
 
 
@@ -216,7 +220,14 @@ def _get_dimensions(
     solid: cq.Workplane,
 ) -> tuple[float, float, float]:
     """Get the bounding box dimensions (dx, dy, dz) of a solid."""
-    xmin, ymin, zmin, xmax, ymax, zmax = _get_bounding_box(solid)
+    return _bbox_dimensions(_get_bounding_box(solid))
+
+
+def _bbox_dimensions(
+    bbox: tuple[float, float, float, float, float, float],
+) -> tuple[float, float, float]:
+    """(dx, dy, dz) of an (xmin, ymin, zmin, xmax, ymax, zmax) box."""
+    xmin, ymin, zmin, xmax, ymax, zmax = bbox
     return (xmax - xmin, ymax - ymin, zmax - zmin)
 
 
@@ -613,7 +624,8 @@ def create_section_parts(
         avoidance_hits = [False] * total
 
     for i, solid in enumerate(sections, start=1):
-        dims = _get_dimensions(solid)
+        bbox = _get_bounding_box(solid)
+        dims = _bbox_dimensions(bbox)
         filename = f"{component}_{side}_{i}of{total}.stl"
 
         # Determine print orientation based on component type
@@ -638,6 +650,7 @@ def create_section_parts(
             split_axis=split_axes[idx] if idx < len(split_axes) else "Y",
             split_position_mm=split_positions[idx] if idx < len(split_positions) else 0.0,
             avoidance_zone_hit=avoidance_hits[idx] if idx < len(avoidance_hits) else False,
+            bbox=bbox,
         ))
 
     return parts
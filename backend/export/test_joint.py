@@ -17,7 +17,6 @@ call), so if joints.py geometry changes, the test piece automatically reflects t
 """
 from __future__ import annotations
 
-import json
 import logging
 import tempfile
 import uuid
@@ -26,6 +25,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from backend.export.package import ZIP_COMPRESSLEVEL, ZIP_FILE_PREFIX, _tmp_prefix, _write_manifest
+
 if TYPE_CHECKING:
     import cadquery as cq
 
@@ -272,20 +273,21 @@ def build_test_joint_zip(
     # Write to a temp file then rename for atomicity
     tmp_file = tempfile.NamedTemporaryFile(
         dir=str(tmp_dir),
+        prefix=_tmp_prefix(),
         suffix=".zip",
         delete=False,
     )
     tmp_path = Path(tmp_file.name)
     tmp_file.close()
 
-    with zipfile.ZipFile(tmp_path, "w", zipfile.ZIP_DEFLATED) as zf:
+    with zipfile.ZipFile(tmp_path, "w", zipfile.ZIP_DEFLATED, compresslevel=ZIP_COMPRESSLEVEL) as zf:
         zf.writestr("test_joint_plug.stl", plug_stl)
         zf.writestr("test_joint_socket.stl", socket_stl)
-        zf.writestr("manifest.json", json.dumps(manifest, indent=2))
+        _write_manifest(zf, manifest)
 
     # #260: use a per-request unique filename to prevent concurrent-export collisions
     unique_suffix = uuid.uuid4().hex[:8]
-    final_path = tmp_dir / f"cheng_test_joint_{unique_suffix}.zip"
+    final_path = tmp_dir / f"{ZIP_FILE_PREFIX}test_joint_{unique_suffix}.zip"
     try:
         tmp_path.rename(final_path)
     except OSError:
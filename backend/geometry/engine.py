@@ -475,12 +475,14 @@ def compute_derived_values(design: AircraftDesign) -> dict[str, float]:
             compute_flight_condition,
             compute_stability_derivatives,
             compute_dynamic_modes,
+            wing_geometry,
         )
 
         mass_props = resolve_mass_properties(design, result)
+        wing = wing_geometry(design)  # shared by both DATCOM stages
         fc = compute_flight_condition(design, mass_props)
-        derivs = compute_stability_derivatives(design, mass_props, fc)
-        modes = compute_dynamic_modes(design, mass_props, fc, derivs)
+        derivs = compute_stability_derivatives(design, mass_props, fc, wing=wing)
+        modes = compute_dynamic_modes(design, mass_props, fc, derivs, wing=wing)
 
         # dataclasses.asdict uses the dataclass field names (uppercase for
         # derivatives: CL_alpha, etc.).  Map them to the snake_case Pydantic
@@ -7,9 +7,10 @@ require CadQuery at runtime (guarded import).
 
 from __future__ import annotations
 
+import io
 import struct
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, BinaryIO
 
 import numpy as np
 from numpy.typing import NDArray
@@ -124,6 +125,31 @@ def tessellate_for_export(solid: cq.Workplane, tolerance: float = 0.1, angular_t
     return _mesh_to_binary_stl(mesh)
 
 
+def tessellate_for_export_into(
+    solid: cq.Workplane,
+    out: BinaryIO,
+    tolerance: float = 0.1,
+    angular_tolerance: float = 0.1,
+) -> None:
+    """Streaming tessellate_for_export(): write the binary STL to ``out``.
+
+    Triangle records are written in fixed-size chunks, so the complete STL
+    never exists as one bytes object -- e.g. when ``out`` is a
+    ``ZipFile.open(..., "w")`` entry.  Output is byte-identical to
+    tessellate_for_export().
+
+    Args:
+        solid:     CadQuery Workplane containing a single solid.
+        out:       Writable binary stream.
+        tolerance: Max chordal deviation in mm.  Default 0.1 mm for export quality.
+        angular_tolerance: Max angular deviation in radians. Default 0.1 for export.
+    """
+    import cadquery as cq  # noqa: F811 -- runtime import
+
+    mesh = _tessellate_workplane(solid, tolerance, angular_tolerance)
+    _write_binary_stl(mesh, out)
+
+
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
@@ -206,7 +232,23 @@ def _compute_vertex_normals(
 
 
 def _mesh_to_binary_stl(mesh: MeshData) -> bytes:
-    """Convert MeshData to binary STL format.
+    """Convert MeshData to binary STL format (see _write_binary_stl)."""
+    buf = io.BytesIO()
+    _write_binary_stl(mesh, buf)
+    return buf.getvalue()
+
+
+# One binary STL triangle record: normal, three vertices, attribute count.
+_STL_RECORD = np.dtype([
+    ("normal", "<f4", (3,)),
+    ("vertices", "<f4", (3, 3)),
+    ("attr", "<u2"),
+])
+_STL_CHUNK_TRIANGLES = 1 << 16  # ~3 MB of records per write
+
+
+def _write_binary_stl(mesh: MeshData, out: BinaryIO) -> None:
+    """Write MeshData to ``out`` in binary STL format.
 
     Binary STL layout:
       - 80-byte header (ASCII, zero-padded)
@@ -215,33 +257,27 @@ def _mesh_to_binary_stl(mesh: MeshData) -> bytes:
         - 12 bytes: face normal (3 x float32)
         - 36 bytes: 3 vertices (3 x 3 x float32)
         - 2 bytes: attribute byte count (0)
+
+    Records are packed with NumPy one chunk at a time, bounding the extra
+    memory to a chunk regardless of mesh size.
     """
     header = b"CHENG Parametric RC Plane Generator - Binary STL"
-    header = header.ljust(80, b"\x00")
+    out.write(header.ljust(80, b"\x00"))
 
     num_triangles = mesh.face_count
-    count_bytes = struct.pack("<I", num_triangles)
-
-    triangle_data = bytearray()
-    for i in range(num_triangles):
-        i0, i1, i2 = mesh.faces[i]
-        v0 = mesh.vertices[i0]
-        v1 = mesh.vertices[i1]
-        v2 = mesh.vertices[i2]
-
-        # Compute face normal
-        edge1 = v1 - v0
-        edge2 = v2 - v0
-        normal = np.cross(edge1, edge2)
-        length = np.linalg.norm(normal)
-        if length > 1e-10:
-            normal = normal / length
-
-        # Pack: normal (3 floats) + 3 vertices (9 floats) + attribute (uint16)
-        triangle_data.extend(struct.pack("<fff", *normal))
-        triangle_data.extend(struct.pack("<fff", *v0))
-        triangle_data.extend(struct.pack("<fff", *v1))
-        triangle_data.extend(struct.pack("<fff", *v2))
-        triangle_data.extend(struct.pack("<H", 0))
-
-    return header + count_bytes + bytes(triangle_data)
+    out.write(struct.pack("<I", num_triangles))
+
+    vertices = mesh.vertices.astype(np.float32, copy=False)
+    for start in range(0, num_triangles, _STL_CHUNK_TRIANGLES):
+        tri = vertices[mesh.faces[start:start + _STL_CHUNK_TRIANGLES]]  # (n, 3, 3)
+
+        # Face normals, normalised unless degenerate
+        normal = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+        length = np.sqrt(np.einsum("ij,ij->i", normal, normal))
+        ok = length > 1e-10
+        normal[ok] /= length[ok, None]
+
+        records = np.zeros(len(tri), dtype=_STL_RECORD)
+        records["normal"] = normal
+        records["vertices"] = tri
+        out.write(records.tobytes())
@@ -14,15 +14,17 @@ from __future__ import annotations
 
 import logging
 import os
+import threading
 from contextlib import asynccontextmanager
 from pathlib import Path
 
-import anyio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
-from backend.cleanup import cleanup_tmp_files, periodic_cleanup
+from backend.airfoil_data import preload_airfoils
+from backend.cleanup import cleanup_tmp_files, start_cleanup_thread, stop_cleanup_thread
+from backend.datcom import preload_kernels
 from backend.export.package import EXPORT_TMP_DIR
 from backend.routes.designs import router as designs_router
 from backend.routes.generate import router as generate_router
@@ -42,10 +44,35 @@ CHENG_MODE: str = os.environ.get("CHENG_MODE", "local").lower()
 """'local' (default) or 'cloud'.  Controls storage behavior and CORS policy."""
 
 
+def _preload_airfoils() -> None:
+    """Background-thread target: warm airfoil caches, logging any failure."""
+    try:
+        preload_airfoils()
+        logger.info("Airfoil data preloaded")
+    except Exception:
+        logger.warning("Airfoil preload failed — data will load on first use", exc_info=True)
+
+
+def _preload_datcom_kernels() -> None:
+    """Background-thread target: JIT-compile the DATCOM kernels, logging any failure."""
+    try:
+        preload_kernels()
+        logger.info("DATCOM kernels preloaded")
+    except Exception:
+        logger.warning("DATCOM kernel preload failed — kernels compile on first use", exc_info=True)
+
+
+def _preload_compute_caches() -> None:
+    """Background-thread target: airfoil tables first, then the kernels that read them."""
+    _preload_airfoils()
+    _preload_datcom_kernels()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup tasks:
     1. Pre-warm CadQuery/OpenCascade kernel (first import takes ~2-4 s)
+       plus airfoil data tables and DATCOM kernels (background thread)
     2. Ensure /data/tmp directory exists for export temp files
     """
     # Log active mode so operators can confirm deployment configuration
@@ -66,6 +93,11 @@ async def lifespan(app: FastAPI):
     except Exception as exc:
         logger.warning("CadQuery warm-up failed: %s — geometry may be slow on first request", exc)
 
+    # 1b. Warm the airfoil tables and the Numba-compiled DATCOM kernels in the
+    # background so the first aero/validation query pays neither JSON parse nor
+    # JIT compile cost.  Failure here is non-fatal.
+    threading.Thread(target=_preload_compute_caches, name="airfoil-preload", daemon=True).start()
+
     # 2. Ensure export tmp directory exists (needed outside Docker).
     # Use the authoritative EXPORT_TMP_DIR constant from the export module so
     # this path is always in sync with where exports actually write (#262, #276).
@@ -98,17 +130,21 @@ async def lifespan(app: FastAPI):
 
     # 5. Clean up orphaned temp files from previous runs (#181)
     try:
-        deleted = cleanup_tmp_files(tmp_dir)
-        if deleted:
-            logger.info("Startup cleanup: removed %d orphaned temp file(s)", deleted)
+        stats = cleanup_tmp_files(tmp_dir)
+        if stats.deleted:
+            logger.info(
+                "Startup cleanup: removed %d orphaned temp file(s), %d bytes",
+                stats.deleted, stats.bytes_freed,
+            )
     except Exception:
         logger.warning("Startup temp cleanup failed", exc_info=True)
 
-    # 6. Start periodic cleanup task (runs every 30 min)
-    async with anyio.create_task_group() as tg:
-        tg.start_soon(periodic_cleanup, tmp_dir)
+    # 6. Start periodic cleanup thread (runs every 30 min)
+    start_cleanup_thread(tmp_dir)
+    try:
         yield
-        tg.cancel_scope.cancel()
+    finally:
+        stop_cleanup_thread()
 
 
 app = FastAPI(title="CHENG", version="0.1.0", lifespan=lifespan)
@@ -9,20 +9,21 @@ from __future__ import annotations
 
 import hashlib
 import logging
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from pathlib import Path
 
 import asyncio
 import threading
 
 import anyio
+import numpy as np
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import FileResponse
 from starlette.background import BackgroundTask
 
 from backend.geometry.engine import assemble_aircraft, _cadquery_limiter
 from backend.export.section import auto_section, auto_section_with_axis, auto_section_with_meta, create_section_parts, SectionPart
-from backend.export.joints import add_tongue_and_groove
+from backend.export.joints import add_joints_all
 from backend.export.package import build_zip, build_step_zip, build_dxf_zip, build_svg_zip, EXPORT_TMP_DIR
 from backend.models import (
     AircraftDesign,
@@ -40,7 +41,9 @@ router = APIRouter(prefix="/api", tags=["export"])
 # Assembly cache -- avoid running CadQuery twice for preview + download
 # ---------------------------------------------------------------------------
 
-_assembly_cache: dict[str, dict] = {}
+# LRU: hits move to the end, inserts beyond _MAX_CACHE evict from the front.
+# Kept small on purpose -- each entry holds full OCC solids for every component.
+_assembly_cache: OrderedDict[str, dict] = OrderedDict()
 _MAX_CACHE = 4
 # #256: threading.Lock protects the cache for calls from the thread pool.
 # The asyncio.Lock below protects the async (event-loop) path.
@@ -57,9 +60,45 @@ def _get_cache_lock() -> asyncio.Lock:
     return _assembly_cache_lock
 
 
+# Metadata fields that never affect geometry -- excluded from the cache key so
+# a renamed or re-saved copy of a design reuses the same assembly.
+_CACHE_KEY_EXCLUDE = frozenset({"version", "id", "name"})
+
+
 def _design_cache_key(design: AircraftDesign) -> str:
-    """Compute a hash key for caching assembled components."""
-    return hashlib.md5(design.model_dump_json().encode()).hexdigest()
+    """Compute a hash key for caching assembled components.
+
+    Structural: two designs with the same geometry-affecting fields share a
+    key regardless of object identity, id or name.
+    """
+    payload = design.model_dump_json(exclude=_CACHE_KEY_EXCLUDE)
+    return hashlib.md5(payload.encode()).hexdigest()
+
+
+def _cache_lookup(key: str) -> dict | None:
+    """Return the cached entry for *key* and mark it most recently used.
+
+    Caller must hold the appropriate cache lock.
+    """
+    components = _assembly_cache.get(key)
+    if components is not None:
+        _assembly_cache.move_to_end(key)
+    return components
+
+
+def _cache_store(key: str, components: dict) -> dict:
+    """Insert *components* unless already present, evicting the LRU entry.
+
+    Returns the cached value (the existing one if another caller won the
+    race).  Caller must hold the appropriate cache lock.
+    """
+    existing = _cache_lookup(key)
+    if existing is not None:
+        return existing
+    _assembly_cache[key] = components
+    if len(_assembly_cache) > _MAX_CACHE:
+        _assembly_cache.popitem(last=False)
+    return components
 
 
 def _get_or_assemble_sync(design: AircraftDesign) -> dict:
@@ -73,20 +112,17 @@ def _get_or_assemble_sync(design: AircraftDesign) -> dict:
     key = _design_cache_key(design)
 
     with _assembly_cache_thread_lock:
-        if key in _assembly_cache:
+        cached = _cache_lookup(key)
+        if cached is not None:
             logger.debug("Assembly cache hit for key %s", key[:8])
-            return _assembly_cache[key]
+            return cached
 
     # Assemble without holding the lock — CadQuery is the expensive part
     components = assemble_aircraft(design)
 
     with _assembly_cache_thread_lock:
         # Re-check in case another thread assembled the same design concurrently
-        if key not in _assembly_cache:
-            if len(_assembly_cache) >= _MAX_CACHE:
-                _assembly_cache.pop(next(iter(_assembly_cache)))
-            _assembly_cache[key] = components
-        return _assembly_cache[key]
+        return _cache_store(key, components)
 
 
 def _get_or_assemble(design: AircraftDesign) -> dict:
@@ -108,9 +144,10 @@ async def _get_or_assemble_async(design: AircraftDesign) -> dict:
     """
     async with _get_cache_lock():
         key = _design_cache_key(design)
-        if key in _assembly_cache:
+        cached = _cache_lookup(key)
+        if cached is not None:
             logger.debug("Assembly cache hit (async) for key %s", key[:8])
-            return _assembly_cache[key]
+            return cached
 
     # Assemble outside the lock — this is the expensive blocking call.
     # We accept the rare case of two concurrent misses racing to assemble;
@@ -124,11 +161,7 @@ async def _get_or_assemble_async(design: AircraftDesign) -> dict:
     async with _get_cache_lock():
         # Double-check: another coroutine may have populated the cache while
         # we were assembling.
-        if key not in _assembly_cache:
-            if len(_assembly_cache) >= _MAX_CACHE:
-                _assembly_cache.pop(next(iter(_assembly_cache)))
-            _assembly_cache[key] = components
-        return _assembly_cache[key]
+        return _cache_store(key, components)
 
 
 def clear_assembly_cache() -> None:
@@ -218,6 +251,23 @@ def _fits_on_bed(
     return fits_xy and dz <= bed_z
 
 
+def _fits_on_bed_batch(
+    dims: np.ndarray,
+    bed: tuple[float, float, float],
+) -> np.ndarray:
+    """Vectorized _fits_on_bed over an (N, 3) array of part dimensions.
+
+    Returns an (N,) bool array; same rotation rule as the scalar check.
+    Use it when a whole set of parts is checked at once -- for a single
+    part the scalar comparisons are cheaper than building an array.
+    """
+    bed_x, bed_y, bed_z = bed
+    dims = np.asarray(dims, dtype=np.float64).reshape(-1, 3)
+    x, y, z = dims[:, 0], dims[:, 1], dims[:, 2]
+    fits_xy = ((x <= bed_x) & (y <= bed_y)) | ((x <= bed_y) & (y <= bed_x))
+    return fits_xy & (z <= bed_z)
+
+
 # ---------------------------------------------------------------------------
 # Routes
 # ---------------------------------------------------------------------------
@@ -360,42 +410,47 @@ def _smart_split_reason(component: str) -> str:
 # ---------------------------------------------------------------------------
 
 
+def _build_preview_part(sp: SectionPart, fits: bool) -> ExportPreviewPart:
+    """Convert one SectionPart into its preview metadata (pure, no CadQuery)."""
+    # Build human-readable adjust reason for Issue #147
+    adjust_reason = ""
+    if sp.avoidance_zone_hit:
+        adjust_reason = _smart_split_reason(sp.component)
+
+    return ExportPreviewPart(
+        filename=sp.filename,
+        component=sp.component,
+        side=sp.side,
+        section_num=sp.section_num,
+        total_sections=sp.total_sections,
+        dimensions_mm=sp.dimensions_mm,
+        print_orientation=sp.print_orientation,
+        assembly_order=sp.assembly_order,
+        fits_bed=fits,
+        # Issue #147: smart split metadata
+        cut_position_mm=sp.split_position_mm if sp.total_sections > 1 else None,
+        cut_adjusted=sp.avoidance_zone_hit,
+        cut_adjust_reason=adjust_reason,
+    )
+
+
 def _preview_blocking(design: AircraftDesign) -> list[ExportPreviewPart]:
-    """Synchronous preview pipeline: assemble + section only (no joints/ZIP)."""
+    """Synchronous preview pipeline: assemble + section only (no joints/ZIP).
+
+    All CPU time is in _generate_sections (CadQuery); per-part metadata is
+    microseconds, so it is built inline rather than fanned out to workers.
+    """
     section_parts = _generate_sections(design)
 
-    all_parts: list[ExportPreviewPart] = []
-    for sp in section_parts:
-        fits = _fits_on_bed(
-            sp.dimensions_mm,
-            design.print_bed_x,
-            design.print_bed_y,
-            design.print_bed_z,
-        )
-        # Build human-readable adjust reason for Issue #147
-        adjust_reason = ""
-        if sp.avoidance_zone_hit:
-            adjust_reason = _smart_split_reason(sp.component)
-
-        all_parts.append(
-            ExportPreviewPart(
-                filename=sp.filename,
-                component=sp.component,
-                side=sp.side,
-                section_num=sp.section_num,
-                total_sections=sp.total_sections,
-                dimensions_mm=sp.dimensions_mm,
-                print_orientation=sp.print_orientation,
-                assembly_order=sp.assembly_order,
-                fits_bed=fits,
-                # Issue #147: smart split metadata
-                cut_position_mm=sp.split_position_mm if sp.total_sections > 1 else None,
-                cut_adjusted=sp.avoidance_zone_hit,
-                cut_adjust_reason=adjust_reason,
-            )
-        )
+    bed = (design.print_bed_x, design.print_bed_y, design.print_bed_z)
+    fits_all = _fits_on_bed_batch(
+        np.asarray([sp.dimensions_mm for sp in section_parts]), bed,
+    )
 
-    return all_parts
+    return [
+        _build_preview_part(sp, fits)
+        for sp, fits in zip(section_parts, fits_all.tolist())
+    ]
 
 
 def _export_blocking(design: AircraftDesign, export_format: str = "stl") -> Path:
@@ -432,38 +487,17 @@ def _export_stl_blocking(design: AircraftDesign) -> Path:
     all_sections = _generate_sections(design)
 
     # Group sections by (component, side) to find adjacent pairs for joints
-    groups: dict[tuple[str, str], list[int]] = defaultdict(list)
-    for idx, sp in enumerate(all_sections):
-        groups[(sp.component, sp.side)].append(idx)
-
-    for (_comp, _side), indices in groups.items():
-        sorted_indices = sorted(indices, key=lambda i: all_sections[i].section_num)
-        for j in range(len(sorted_indices) - 1):
-            i_left = sorted_indices[j]
-            i_right = sorted_indices[j + 1]
-            try:
-                left_solid, right_solid = add_tongue_and_groove(
-                    all_sections[i_left].solid,
-                    all_sections[i_right].solid,
-                    overlap=design.section_overlap,
-                    tolerance=design.joint_tolerance,
-                    nozzle_diameter=design.nozzle_diameter,
-                    split_axis=all_sections[i_left].split_axis,
-                )
-                all_sections[i_left].solid = left_solid
-                all_sections[i_right].solid = right_solid
-                # Recompute dimensions after joint features (#166)
-                all_sections[i_left].recompute_dimensions()
-                all_sections[i_right].recompute_dimensions()
-            except Exception as exc:
-                logger.warning(
-                    "Joint creation failed for %s_%s sections %d-%d: %s",
-                    _comp,
-                    _side,
-                    all_sections[i_left].section_num,
-                    all_sections[i_right].section_num,
-                    exc,
-                )
+    groups: dict[tuple[str, str], list[SectionPart]] = defaultdict(list)
+    for sp in all_sections:
+        groups[(sp.component, sp.side)].append(sp)
+
+    for parts in groups.values():
+        add_joints_all(
+            parts,
+            overlap=design.section_overlap,
+            tolerance=design.joint_tolerance,
+            nozzle_diameter=design.nozzle_diameter,
+        )
 
     # 3. Build ZIP
     return build_zip(all_sections, design)
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import functools
 import tempfile
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
 
 from backend.models import AircraftDesign
 from backend.storage import LocalStorage
+from backend.validation import compute_warnings
 
 
 # ---------------------------------------------------------------------------
@@ -124,6 +127,33 @@ def vtail_design() -> AircraftDesign:
     )
 
 
+# ---------------------------------------------------------------------------
+# Validation Fixtures (memoized compute_warnings lookups)
+# ---------------------------------------------------------------------------
+
+
+@functools.cache
+def _warnings_for_json(design_json: str) -> tuple:
+    # Keyed on the serialized design so each distinct design is validated once
+    return tuple(compute_warnings(AircraftDesign.model_validate_json(design_json)))
+
+
+def _cached_warnings(design: AircraftDesign) -> tuple:
+    return _warnings_for_json(design.model_dump_json())
+
+
+@pytest.fixture
+def warning_ids() -> Callable[[AircraftDesign], set[str]]:
+    """Return a lookup of the warning IDs compute_warnings reports for a design."""
+    return lambda design: {w.id for w in _cached_warnings(design)}
+
+
+@pytest.fixture
+def warnings_by_id() -> Callable[[AircraftDesign, str], list]:
+    """Return a lookup of the warnings with a given ID for a design."""
+    return lambda design, vid: [w for w in _cached_warnings(design) if w.id == vid]
+
+
 # ---------------------------------------------------------------------------
 # Storage Fixtures (used by route/storage tests)
 # ---------------------------------------------------------------------------
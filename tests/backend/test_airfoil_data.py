@@ -12,13 +12,17 @@ from __future__ import annotations
 
 import math
 
+import numpy as np
 import pytest
 
 from backend.airfoil_data import (
     AIRFOIL_NAME_MAP,
+    clear_interpolation_cache,
     get_available_airfoils,
     interpolate_section_aero,
+    interpolate_section_aero_batch,
     load_airfoil_constants,
+    preload_airfoils,
 )
 
 
@@ -90,6 +94,16 @@ class TestAirfoilNameMap:
         for key, stem in AIRFOIL_NAME_MAP.items():
             assert isinstance(stem, str) and stem, f"Stem for '{key}' is not a non-empty string"
 
+    def test_lookup_is_case_insensitive(self) -> None:
+        """Mixed-case names resolve to the same airfoil as the canonical form."""
+        assert load_airfoil_constants("naca 2412") is load_airfoil_constants("NACA 2412")
+        assert load_airfoil_constants("CLARK-y") is load_airfoil_constants("Clark-Y")
+
+    def test_unknown_name_raises_key_error(self) -> None:
+        """Names not in the map (in any case) raise KeyError."""
+        with pytest.raises(KeyError):
+            load_airfoil_constants("NACA-9999")
+
 
 # ---------------------------------------------------------------------------
 # load_airfoil_constants tests
@@ -120,6 +134,15 @@ class TestLoadAirfoilConstants:
             for field in required:
                 assert field in cond, f"Missing field '{field}' in condition: {cond}"
 
+    def test_preload_populates_all_stems(self) -> None:
+        """preload_airfoils() should load and process every mapped airfoil."""
+        import backend.airfoil_data as airfoil_data
+
+        preload_airfoils()
+        stems = set(AIRFOIL_NAME_MAP.values())
+        assert stems <= set(airfoil_data._AIRFOIL_CACHE)
+        assert stems <= set(airfoil_data._PROCESSED_CACHE)
+
     def test_cache_returns_same_object(self) -> None:
         """Calling load twice returns the same cached object."""
         doc1 = load_airfoil_constants("Clark-Y")
@@ -200,6 +223,97 @@ class TestInterpolateSectionAero:
                 f"Mismatch for {key}: {r1[key]} vs {r2[key]}"
             )
 
+    def test_repeat_call_returns_equal_fresh_dict(self) -> None:
+        """Memoized results must match and callers must get independent dicts."""
+        r1 = interpolate_section_aero("Clark-Y", Re=_RE, Mach=_MACH)
+        r1["cl_max"] = -1.0  # mutating a result must not poison the cache
+        r2 = interpolate_section_aero("Clark-Y", Re=_RE, Mach=_MACH)
+        assert r2["cl_max"] > 0.0
+
+        clear_interpolation_cache()
+        r3 = interpolate_section_aero("Clark-Y", Re=_RE, Mach=_MACH)
+        assert r3 == r2
+
+    def test_kdtree_lookup_matches_linear_scan(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Forcing the KD-tree path must reproduce the brute-force results."""
+        pytest.importorskip("scipy")
+        import backend.airfoil_data as airfoil_data
+
+        queries = [(_RE, _MACH), (1.0, 0.001), (1e9, 99.0), (123_456, 0.0712)]
+        expected = [interpolate_section_aero("Eppler-387", re, m) for re, m in queries]
+
+        monkeypatch.setattr(airfoil_data, "_KDTREE_MIN_POINTS", 0)
+        monkeypatch.setattr(airfoil_data, "_PROCESSED_CACHE", {})
+        clear_interpolation_cache()
+        try:
+            assert airfoil_data._get_processed("eppler387")["tree"] is not None
+            for (re, m), exp in zip(queries, expected):
+                got = interpolate_section_aero("Eppler-387", re, m)
+                for key in _EXPECTED_KEYS:
+                    assert got[key] == pytest.approx(exp[key], rel=1e-12)
+        finally:
+            clear_interpolation_cache()
+
+    def test_numba_kernel_matches_numpy_scan(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The compiled IDW kernel must reproduce the NumPy path."""
+        pytest.importorskip("numba")
+        import backend.airfoil_data as airfoil_data
+
+        queries = [(_RE, _MACH), (1.0, 0.001), (1e9, 99.0), (123_456, 0.0712)]
+        clear_interpolation_cache()
+        expected = [interpolate_section_aero("NACA-6412", re, m) for re, m in queries]
+
+        monkeypatch.setattr(airfoil_data, "_idw_kernel", None)
+        clear_interpolation_cache()
+        try:
+            for (re, m), exp in zip(queries, expected):
+                got = interpolate_section_aero("NACA-6412", re, m)
+                for key in _EXPECTED_KEYS:
+                    assert got[key] == pytest.approx(exp[key], rel=1e-12)
+        finally:
+            clear_interpolation_cache()
+
+    @pytest.mark.parametrize("name", ["NACA-2412", "Selig-1223", "Flat-Plate"])
+    def test_fast_grid_lookup_valid(self, name: str) -> None:
+        """fast=True returns the same keys with finite values, clamped at bounds."""
+        for re, mach in [(_RE, _MACH), (1.0, 0.001), (1e9, 99.0)]:
+            result = interpolate_section_aero(name, Re=re, Mach=mach, fast=True)
+            assert set(result.keys()) == _EXPECTED_KEYS
+            assert all(math.isfinite(v) for v in result.values())
+
+    def test_fast_grid_matches_exact_at_nodes(self) -> None:
+        """At grid nodes the bilinear table reproduces the IDW result."""
+        import backend.airfoil_data as airfoil_data
+
+        stem = airfoil_data._stem_for_name("Clark-Y")
+        proc = airfoil_data._get_processed(stem)
+        lr_axis, m_axis, _ = airfoil_data._get_grid(stem, proc)
+        for lr, mach in [(lr_axis[5], m_axis[3]), (lr_axis[-1], m_axis[0]), (lr_axis[40], m_axis[20])]:
+            re = math.exp(lr)
+            exact = interpolate_section_aero("Clark-Y", Re=re, Mach=mach)
+            fast = interpolate_section_aero("Clark-Y", Re=re, Mach=mach, fast=True)
+            for key in _EXPECTED_KEYS:
+                assert fast[key] == pytest.approx(exact[key], rel=1e-9, abs=1e-12)
+
+    def test_batch_matches_scalar_calls(self) -> None:
+        """Batch results must equal per-query scalar calls, including clamped points."""
+        re = np.array([1.0, 50_000, _RE, 123_456, 1e9])
+        mach = np.array([0.001, 0.03, _MACH, 0.0712, 99.0])
+        batch = interpolate_section_aero_batch("Selig 1223", re, mach)
+        assert set(batch) == _EXPECTED_KEYS
+        for i, (r, m) in enumerate(zip(re, mach)):
+            scalar = interpolate_section_aero("Selig 1223", Re=r, Mach=m)
+            for key in _EXPECTED_KEYS:
+                assert batch[key][i] == pytest.approx(scalar[key], rel=1e-12)
+
+    def test_batch_broadcasts_scalar_mach(self) -> None:
+        """A scalar Mach broadcasts across an Re sweep."""
+        re = np.linspace(100_000, 600_000, 7)
+        batch = interpolate_section_aero_batch("NACA-2412", re, _MACH)
+        for key in _EXPECTED_KEYS:
+            assert batch[key].shape == (7,)
+            assert np.all(np.isfinite(batch[key]))
+
 
 # ---------------------------------------------------------------------------
 # get_available_airfoils tests
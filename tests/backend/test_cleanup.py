@@ -15,23 +15,37 @@ class TestCleanupTmpFiles:
 
     def test_deletes_old_files(self, tmp_path: Path) -> None:
         """Files older than max_age_seconds should be deleted."""
-        old_file = tmp_path / "old_export.zip"
+        old_file = tmp_path / "cheng_old_export.zip"
         old_file.write_text("old data")
         # Set mtime to 2 hours ago
         old_time = time.time() - 7200
         import os
         os.utime(old_file, (old_time, old_time))
 
-        deleted = cleanup_tmp_files(tmp_path, max_age_seconds=3600)
+        deleted = cleanup_tmp_files(tmp_path, max_age_seconds=3600).deleted
         assert deleted == 1
         assert not old_file.exists()
 
+    def test_reports_bytes_freed(self, tmp_path: Path) -> None:
+        """bytes_freed sums the sizes of deleted files only."""
+        import os
+
+        old_time = time.time() - 7200
+        for name, size in (("cheng_a.zip", 100), ("cheng_b.zip", 23)):
+            f = tmp_path / name
+            f.write_bytes(b"x" * size)
+            os.utime(f, (old_time, old_time))
+        (tmp_path / "cheng_new.zip").write_bytes(b"x" * 1000)
+
+        stats = cleanup_tmp_files(tmp_path, max_age_seconds=3600)
+        assert (stats.deleted, stats.bytes_freed) == (2, 123)
+
     def test_preserves_recent_files(self, tmp_path: Path) -> None:
         """Files newer than max_age_seconds should not be deleted."""
-        recent_file = tmp_path / "recent_export.zip"
+        recent_file = tmp_path / "cheng_recent_export.zip"
         recent_file.write_text("recent data")
 
-        deleted = cleanup_tmp_files(tmp_path, max_age_seconds=3600)
+        deleted = cleanup_tmp_files(tmp_path, max_age_seconds=3600).deleted
         assert deleted == 0
         assert recent_file.exists()
 
@@ -39,27 +53,27 @@ class TestCleanupTmpFiles:
         """Only old files should be deleted, recent ones preserved."""
         import os
 
-        old_file = tmp_path / "old.zip"
+        old_file = tmp_path / "cheng_old.zip"
         old_file.write_text("old")
         old_time = time.time() - 7200
         os.utime(old_file, (old_time, old_time))
 
-        new_file = tmp_path / "new.zip"
+        new_file = tmp_path / "cheng_new.zip"
         new_file.write_text("new")
 
-        deleted = cleanup_tmp_files(tmp_path, max_age_seconds=3600)
+        deleted = cleanup_tmp_files(tmp_path, max_age_seconds=3600).deleted
         assert deleted == 1
         assert not old_file.exists()
         assert new_file.exists()
 
     def test_nonexistent_directory(self) -> None:
         """Should return 0 for non-existent directory."""
-        deleted = cleanup_tmp_files(Path("/nonexistent/path"), max_age_seconds=3600)
+        deleted = cleanup_tmp_files(Path("/nonexistent/path"), max_age_seconds=3600).deleted
         assert deleted == 0
 
     def test_empty_directory(self, tmp_path: Path) -> None:
         """Should return 0 for empty directory."""
-        deleted = cleanup_tmp_files(tmp_path, max_age_seconds=3600)
+        deleted = cleanup_tmp_files(tmp_path, max_age_seconds=3600).deleted
         assert deleted == 0
 
     def test_skips_subdirectories(self, tmp_path: Path) -> None:
@@ -71,6 +85,276 @@ class TestCleanupTmpFiles:
         old_time = time.time() - 7200
         os.utime(sub_dir, (old_time, old_time))
 
-        deleted = cleanup_tmp_files(tmp_path, max_age_seconds=3600)
+        deleted = cleanup_tmp_files(tmp_path, max_age_seconds=3600).deleted
         assert deleted == 0
         assert sub_dir.exists()
+
+    def test_unmanaged_files_are_preserved(self, tmp_path: Path) -> None:
+        """Only export-produced names are deleted; foreign files are left alone."""
+        import os
+
+        old_time = time.time() - 7200
+        foreign = tmp_path / "operator_notes.txt"
+        managed = tmp_path / "export-1-abc.step"
+        for f in (foreign, managed):
+            f.write_text("x")
+            os.utime(f, (old_time, old_time))
+
+        assert cleanup_tmp_files(tmp_path, max_age_seconds=3600).deleted == 1
+        assert foreign.exists()
+        assert not managed.exists()
+
+    def test_path_is_a_file(self, tmp_path: Path) -> None:
+        """Should return 0 (not raise) when tmp_dir points at a regular file."""
+        not_a_dir = tmp_path / "file.txt"
+        not_a_dir.write_text("x")
+        assert cleanup_tmp_files(not_a_dir, max_age_seconds=3600).deleted == 0
+
+    def test_path_based_fallback(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Platforms without dir_fd support take the path-based scan."""
+        import os
+        from backend import cleanup
+
+        monkeypatch.setattr(cleanup, "_USE_DIR_FD", False)
+        old_file = tmp_path / "cheng_old.zip"
+        old_file.write_text("old")
+        old_time = time.time() - 7200
+        os.utime(old_file, (old_time, old_time))
+
+        assert cleanup_tmp_files(tmp_path, max_age_seconds=3600).deleted == 1
+        assert not old_file.exists()
+
+    def test_fresh_name_timestamp_skips_stat(self, tmp_path: Path) -> None:
+        """A fresh epoch in an export scratch name is trusted over mtime."""
+        import os
+
+        f = tmp_path / f"export-{int(time.time())}-abc.zip"
+        f.write_text("x")
+        old_time = time.time() - 7200
+        os.utime(f, (old_time, old_time))  # contradictory mtime is never read
+
+        assert cleanup_tmp_files(tmp_path, max_age_seconds=3600).deleted == 0
+        assert f.exists()
+
+    def test_old_name_timestamp_still_checks_mtime(self, tmp_path: Path) -> None:
+        """An old name epoch only nominates a file; mtime decides deletion."""
+        import os
+
+        stale_epoch = int(time.time()) - 7200
+        touched = tmp_path / f"export-{stale_epoch}-live.zip"
+        touched.write_text("still being written")
+        orphan = tmp_path / f"export-{stale_epoch}-dead.zip"
+        orphan.write_text("orphan")
+        os.utime(orphan, (stale_epoch, stale_epoch))
+
+        assert cleanup_tmp_files(tmp_path, max_age_seconds=3600).deleted == 1
+        assert touched.exists()
+        assert not orphan.exists()
+
+    def test_export_scratch_names_match_cleanup_pattern(self) -> None:
+        """package._tmp_prefix() must produce names cleanup can parse."""
+        from backend.cleanup import _NAME_TS_RE
+        from backend.export.package import _tmp_prefix
+
+        m = _NAME_TS_RE.match(_tmp_prefix() + "abcd1234.zip")
+        assert m is not None
+        assert abs(int(m.group(1)) - time.time()) < 5
+
+    def test_large_burst_uses_parallel_unlink(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Bursts above the threshold are deleted completely via the pool."""
+        import os
+        from backend import cleanup
+
+        monkeypatch.setattr(cleanup, "_PARALLEL_UNLINK_THRESHOLD", 4)
+        old_time = time.time() - 7200
+        for i in range(20):
+            f = tmp_path / f"cheng_orphan_{i}.zip"
+            f.write_text("x")
+            os.utime(f, (old_time, old_time))
+        keep = tmp_path / "cheng_keep.zip"
+        keep.write_text("x")
+
+        assert cleanup_tmp_files(tmp_path, max_age_seconds=3600).deleted == 20
+        assert [p.name for p in tmp_path.iterdir()] == ["cheng_keep.zip"]
+
+    def test_cleanup_subdirs_removes_aged_trees(self, tmp_path: Path) -> None:
+        """cleanup_subdirs=True empties and removes aged managed subdirectories."""
+        import os
+
+        old_time = time.time() - 7200
+        stale = tmp_path / "export-1-build" / "nested"
+        stale.mkdir(parents=True)
+        (stale / "part.stl").write_text("x")
+        os.utime(stale / "part.stl", (old_time, old_time))
+        for d in (stale, stale.parent):
+            os.utime(d, (old_time, old_time))
+
+        live = tmp_path / "export-2-build"
+        live.mkdir()
+        (live / "part.stl").write_text("fresh")
+
+        # Directories the export module does not own are never entered
+        foreign = tmp_path / "tesscache"
+        foreign.mkdir()
+        (foreign / "mesh.stl").write_text("x")
+        os.utime(foreign / "mesh.stl", (old_time, old_time))
+        os.utime(foreign, (old_time, old_time))
+
+        # Default behaviour leaves subdirectories alone
+        assert cleanup_tmp_files(tmp_path, max_age_seconds=3600).deleted == 0
+        assert stale.exists()
+
+        assert cleanup_tmp_files(tmp_path, max_age_seconds=3600, cleanup_subdirs=True).deleted == 1
+        assert not stale.exists()
+        assert not stale.parent.exists()
+        assert (live / "part.stl").exists()
+        assert (foreign / "mesh.stl").exists()
+
+    def test_concurrent_call_is_skipped(self, tmp_path: Path) -> None:
+        """A call made while another cleanup holds the lock returns 0 immediately."""
+        import os
+        from backend import cleanup
+
+        old_file = tmp_path / "cheng_old.zip"
+        old_file.write_text("old")
+        old_time = time.time() - 7200
+        os.utime(old_file, (old_time, old_time))
+
+        with cleanup._cleanup_lock:
+            assert cleanup_tmp_files(tmp_path, max_age_seconds=3600).deleted == 0
+        assert old_file.exists()
+        assert cleanup_tmp_files(tmp_path, max_age_seconds=3600).deleted == 1
+
+    def test_unlink_failures_are_aggregated(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Failed deletions are reported once at INFO with a count."""
+        import logging
+        import os
+        from backend import cleanup
+
+        old_time = time.time() - 7200
+        for i in range(3):
+            f = tmp_path / f"cheng_stuck_{i}.zip"
+            f.write_text("x")
+            os.utime(f, (old_time, old_time))
+
+        def deny(path, *args, **kwargs):
+            raise PermissionError(13, "Permission denied", path)
+
+        monkeypatch.setattr(cleanup.os, "unlink", deny)
+        with caplog.at_level(logging.INFO, logger="cheng.cleanup"):
+            assert cleanup_tmp_files(tmp_path, max_age_seconds=3600).deleted == 0
+
+        infos = [r for r in caplog.records if r.levelno == logging.INFO]
+        assert len(infos) == 1
+        assert "3 orphaned temp file(s)" in infos[0].getMessage()
+
+
+class TestCleanupScanMemo:
+    """Tests for skipping rescans of unchanged directories."""
+
+    def test_unchanged_directory_is_not_rescanned(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A second call with no directory changes must not call scandir."""
+        import os
+        from backend import cleanup
+
+        (tmp_path / "cheng_recent.zip").write_text("x")
+        assert cleanup_tmp_files(tmp_path, max_age_seconds=3600).deleted == 0
+
+        def fail_scandir(*args, **kwargs):
+            raise AssertionError("directory was rescanned")
+
+        monkeypatch.setattr(cleanup.os, "scandir", fail_scandir)
+        assert cleanup_tmp_files(tmp_path, max_age_seconds=3600).deleted == 0
+        monkeypatch.undo()
+
+        # Adding an entry bumps the directory mtime and forces a real scan
+        old = tmp_path / "cheng_old.zip"
+        old.write_text("x")
+        old_time = time.time() - 7200
+        os.utime(old, (old_time, old_time))
+        dir_stat = os.stat(tmp_path)
+        os.utime(tmp_path, ns=(dir_stat.st_atime_ns, dir_stat.st_mtime_ns + 1_000_000))
+        assert cleanup_tmp_files(tmp_path, max_age_seconds=3600).deleted == 1
+
+    def test_rescans_when_oldest_file_can_expire(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """The memo expires once the oldest surviving file could be orphaned."""
+        import os
+        import types
+        from backend import cleanup
+
+        f = tmp_path / "cheng_aging.zip"
+        f.write_text("x")
+        start = time.time()
+        os.utime(f, (start - 3000, start - 3000))  # expires in ~600 s
+        assert cleanup_tmp_files(tmp_path, max_age_seconds=3600).deleted == 0
+
+        fake_now_ns = int((start + 700) * 1_000_000_000)
+        monkeypatch.setattr(cleanup, "time", types.SimpleNamespace(time_ns=lambda: fake_now_ns))
+        assert cleanup_tmp_files(tmp_path, max_age_seconds=3600).deleted == 1
+        assert not f.exists()
+
+
+class TestPeriodicInterval:
+    """Tests for the adaptive periodic cleanup schedule."""
+
+    def test_idle_runs_back_off_to_cap(self) -> None:
+        from backend.cleanup import _MAX_INTERVAL_FACTOR, _next_interval
+
+        current = 1800.0
+        for _ in range(10):
+            current = _next_interval(current, 1800.0, deleted=0)
+        assert current == 1800.0 * _MAX_INTERVAL_FACTOR
+
+    def test_bursts_speed_up_to_floor(self) -> None:
+        from backend.cleanup import _MIN_INTERVAL_SECONDS, _next_interval
+
+        current = 1800.0
+        for _ in range(10):
+            current = _next_interval(current, 1800.0, deleted=500)
+        assert current == _MIN_INTERVAL_SECONDS
+
+    def test_moderate_activity_keeps_interval(self) -> None:
+        from backend.cleanup import _next_interval
+
+        assert _next_interval(3600.0, 1800.0, deleted=5) == 3600.0
+
+    def test_cleanup_thread_runs_and_stops(self, tmp_path: Path) -> None:
+        """The worker thread cleans on its own schedule and exits on stop."""
+        import os
+        from backend.cleanup import start_cleanup_thread, stop_cleanup_thread
+
+        old_file = tmp_path / "cheng_old.zip"
+        old_file.write_text("old")
+        old_time = time.time() - 7200
+        os.utime(old_file, (old_time, old_time))
+
+        t = start_cleanup_thread(tmp_path, interval=0.01, max_age_seconds=3600)
+        try:
+            deadline = time.monotonic() + 5
+            while old_file.exists() and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert not old_file.exists()
+        finally:
+            stop_cleanup_thread()
+        assert not t.is_alive()
+
+    @pytest.mark.parametrize(("platform", "expected"), [("linux", [5]), ("darwin", [])])
+    def test_priority_only_lowered_on_linux(
+        self, monkeypatch: pytest.MonkeyPatch, platform: str, expected: list[int],
+    ) -> None:
+        """nice() is per-process outside Linux, so it must not renice the server there."""
+        from backend import cleanup
+
+        calls: list[int] = []
+        monkeypatch.setattr(cleanup.sys, "platform", platform)
+        monkeypatch.setattr(cleanup.os, "nice", calls.append, raising=False)
+        cleanup._lower_thread_priority()
+        assert calls == expected
@@ -11,7 +11,9 @@ Covers:
 
 from __future__ import annotations
 
+import dataclasses
 import math
+import warnings
 
 import pytest
 
@@ -177,6 +179,15 @@ class TestComputeFlightCondition:
         assert fc.rho == pytest.approx(1.225, abs=0.01), f"rho = {fc.rho}, expected ~1.225"
 
 
+    def test_speed_of_sound_carried_on_flight_condition(self) -> None:
+        """The ISA speed of sound rides along so later stages skip the lookup."""
+        assert self.fc.speed_of_sound == pytest.approx(340.3)
+        design = _trainer()
+        design.flight_altitude_m = 2000.0
+        fc = compute_flight_condition(design, _mass_props(design, _derived(design)))
+        assert fc.speed_of_sound < self.fc.speed_of_sound
+
+
 # ---------------------------------------------------------------------------
 # compute_stability_derivatives tests
 # ---------------------------------------------------------------------------
@@ -221,6 +232,75 @@ class TestComputeStabilityDerivatives:
         """Yaw damping Cn_r must be negative."""
         assert self.derivs.Cn_r < 0.0, f"Cn_r = {self.derivs.Cn_r} should be < 0"
 
+    def test_compiled_kernel_matches_python(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The Numba-compiled derivative kernel must reproduce the plain-Python one."""
+        pytest.importorskip("numba")
+        import backend.datcom as datcom
+
+        designs = [self.design, _flying_wing(), AircraftDesign(tail_type="V-Tail")]
+        expected = []
+        for d in designs:
+            mp = _mass_props(d, _derived(d))
+            fc = compute_flight_condition(d, mp)
+            expected.append((d, mp, fc, compute_stability_derivatives(d, mp, fc)))
+
+        monkeypatch.setattr(datcom, "_derivatives_kernel", datcom._derivatives_kernel.py_func)
+        monkeypatch.setattr(datcom, "_finite_wing_cla", datcom._finite_wing_cla.py_func)
+        for d, mp, fc, exp in expected:
+            got = compute_stability_derivatives(d, mp, fc)
+            for field, value in dataclasses.asdict(exp).items():
+                assert getattr(got, field) == pytest.approx(value, rel=1e-12), field
+
+    def test_batch_matches_scalar(self) -> None:
+        """Each batch row equals the scalar derivatives for that design."""
+        from backend.datcom import STABILITY_DERIVATIVE_FIELDS, compute_stability_derivatives_batch
+
+        designs = [self.design, _flying_wing(), AircraftDesign(tail_type="V-Tail")]
+        mps = [_mass_props(d, _derived(d)) for d in designs]
+        fcs = [compute_flight_condition(d, mp) for d, mp in zip(designs, mps)]
+        batch = compute_stability_derivatives_batch(designs, mps, fcs)
+
+        assert batch.shape == (3, len(STABILITY_DERIVATIVE_FIELDS))
+        for row, d, mp, fc in zip(batch, designs, mps, fcs):
+            derivs = compute_stability_derivatives(d, mp, fc)
+            assert row.tolist() == [getattr(derivs, f) for f in STABILITY_DERIVATIVE_FIELDS]
+
+    def test_batch_rejects_mismatched_lengths(self) -> None:
+        from backend.datcom import compute_stability_derivatives_batch
+
+        with pytest.raises(ValueError):
+            compute_stability_derivatives_batch([self.design], [self.mp, self.mp], [self.fc])
+
+    def test_preload_kernels_compiles_both_paths(self) -> None:
+        """preload_kernels leaves the scalar and batch kernels compiled."""
+        pytest.importorskip("numba")
+        import backend.datcom as datcom
+
+        datcom.preload_kernels()
+        assert datcom._derivatives_kernel.signatures
+        assert datcom._derivatives_kernel_batch.signatures
+
+    def test_tail_geometry_dispatch(self) -> None:
+        """Flying wings have no tail; V-tails project both surfaces."""
+        from backend.datcom import _tail_geometry
+
+        assert _tail_geometry(_flying_wing()) is None
+        v = _tail_geometry(AircraftDesign(tail_type="V-Tail"))
+        conv = _tail_geometry(AircraftDesign(tail_type="T-Tail"))
+        assert v.sweep_h_rad == v.sweep_v_rad
+        assert conv.sweep_h_rad == conv.sweep_v_rad == 0.0
+
+    def test_shared_wing_geometry_matches_recomputed(self) -> None:
+        """Threading one wing_geometry through both stages changes nothing."""
+        from backend.datcom import wing_geometry
+
+        wing = wing_geometry(self.design)
+        derivs = compute_stability_derivatives(self.design, self.mp, self.fc, wing=wing)
+        assert derivs == self.derivs
+        assert compute_dynamic_modes(
+            self.design, self.mp, self.fc, derivs, wing=wing
+        ) == compute_dynamic_modes(self.design, self.mp, self.fc, derivs)
+
 
 # ---------------------------------------------------------------------------
 # compute_dynamic_modes tests
@@ -301,6 +381,20 @@ class TestComputeDynamicModes:
         modes = self._run_modes("FlyingWing")
         assert isinstance(modes, DynamicModes)
 
+    def test_non_finite_matrices_use_fallback_modes(self) -> None:
+        """NaN derivatives skip the eigensolve and return the fallback modes."""
+        design = _make_preset("Trainer")
+        mp = _mass_props(design, _derived(design))
+        fc = compute_flight_condition(design, mp)
+        derivs = dataclasses.replace(
+            compute_stability_derivatives(design, mp, fc), CL_alpha=math.nan, Cl_p=math.nan,
+        )
+        with pytest.warns(UserWarning, match="non-finite state matrix"):
+            modes = compute_dynamic_modes(design, mp, fc, derivs)
+        assert modes.sp_zeta == 0.5
+        assert modes.phugoid_zeta == 0.05
+        assert (modes.dr_omega_n, modes.roll_tau_s) == (1.0, 0.3)
+
     def test_returns_dynamic_modes_instance(self) -> None:
         """compute_dynamic_modes() must return a DynamicModes instance."""
         modes = self._run_modes("Trainer")
@@ -345,3 +439,53 @@ class TestComputeDynamicModes:
             assert math.isfinite(val), (
                 f"Preset '{preset}': {field} = {val} — expected finite"
             )
+
+    @pytest.mark.parametrize("preset", ["Trainer", "Sport", "Aerobatic", "Glider", "FlyingWing", "Scale"])
+    def test_fast_modes_track_eigenvalue_modes(self, preset: str) -> None:
+        """Closed-form modes are finite and close to the eigen solution where the
+        literal factors are good (short period, roll)."""
+        from backend.datcom import compute_dynamic_modes_fast
+
+        design = _make_preset(preset)
+        mp = _mass_props(design, _derived(design))
+        fc = compute_flight_condition(design, mp)
+        derivs = compute_stability_derivatives(design, mp, fc)
+        exact = compute_dynamic_modes(design, mp, fc, derivs)
+        fast = compute_dynamic_modes_fast(design, mp, fc, derivs)
+
+        for field in ("sp_omega_n", "sp_zeta", "phugoid_omega_n", "dr_omega_n", "roll_tau_s"):
+            assert math.isfinite(getattr(fast, field)), field
+        assert fast.sp_omega_n == pytest.approx(exact.sp_omega_n, rel=0.15)
+        assert fast.roll_tau_s == pytest.approx(exact.roll_tau_s, rel=0.05)
+        assert fast.Cm_q == derivs.Cm_q
+
+    def test_batch_matches_scalar(self) -> None:
+        """Each batched DynamicModes equals the scalar result, fallback rows included."""
+        from backend.datcom import compute_dynamic_modes_batch
+
+        designs = [_make_preset(p) for p in ("Trainer", "Glider", "FlyingWing", "Scale")]
+        mps = [_mass_props(d, _derived(d)) for d in designs]
+        fcs = [compute_flight_condition(d, mp) for d, mp in zip(designs, mps)]
+        dvs = [compute_stability_derivatives(d, mp, fc) for d, mp, fc in zip(designs, mps, fcs)]
+        dvs[1] = dataclasses.replace(dvs[1], Cl_p=math.nan)  # lateral fallback row
+
+        with pytest.warns(UserWarning, match="non-finite state matrix"):
+            batch = compute_dynamic_modes_batch(designs, mps, fcs, dvs)
+        assert len(batch) == len(designs)
+        for got, d, mp, fc, dv in zip(batch, designs, mps, fcs, dvs):
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                exp = compute_dynamic_modes(d, mp, fc, dv)
+            for field, value in dataclasses.asdict(exp).items():
+                if field != "Cl_p":
+                    assert getattr(got, field) == value, field
+
+    def test_batch_rejects_mismatched_lengths(self) -> None:
+        from backend.datcom import compute_dynamic_modes_batch
+
+        design = _make_preset("Trainer")
+        mp = _mass_props(design, _derived(design))
+        fc = compute_flight_condition(design, mp)
+        derivs = compute_stability_derivatives(design, mp, fc)
+        with pytest.raises(ValueError):
+            compute_dynamic_modes_batch([design], [mp], [fc], [derivs, derivs])
@@ -128,6 +128,26 @@ class TestSplitAxisPropagation:
         mod_ymax = mod_left.val().BoundingBox().ymax
         assert mod_ymax > orig_ymax
 
+    def test_joints_on_z_axis(self) -> None:
+        """Z-split joints protrude along Z, sized from the X/Y cross-section."""
+        from backend.export.joints import add_tongue_and_groove
+
+        left = _make_box(100, 50, 40)
+        right = _make_box(100, 50, 40).translate((0, 0, 40))
+
+        mod_left, mod_right = add_tongue_and_groove(
+            left, right, overlap=15, tolerance=0.15, nozzle_diameter=0.4,
+            split_axis="Z",
+        )
+
+        bb = mod_left.val().BoundingBox()
+        assert bb.zmax == pytest.approx(20 + 15)
+        assert (bb.xmin, bb.ymin) == pytest.approx((-50, -25))
+        # Tongue is 60 x 30 mm (60% of 100 x 50) with filleted corners
+        tongue_vol = mod_left.val().Volume() - left.val().Volume()
+        assert tongue_vol == pytest.approx(60 * 30 * 15, rel=0.01)
+        assert mod_right.val().Volume() < right.val().Volume()
+
 
 # ===================================================================
 # #166: Dimension recomputation tests
@@ -244,6 +264,35 @@ class TestStepExport:
         finally:
             package.EXPORT_TMP_DIR = original_tmp
 
+    def test_silent_exporter_does_not_reuse_previous_entry(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """An exporter that writes nothing must raise, not archive stale scratch bytes."""
+        import cadquery as cq
+
+        from backend.export import package
+        from backend.models import AircraftDesign
+
+        monkeypatch.setattr(package, "EXPORT_TMP_DIR", tmp_path)
+        real_export = cq.exporters.export
+        calls: list[str] = []
+
+        def flaky_export(shape, fname, export_type=None, *args, **kwargs):
+            calls.append(fname)
+            if len(calls) == 1:
+                return real_export(shape, fname, export_type, *args, **kwargs)
+            return None  # second entry: "succeeds" without writing anything
+
+        monkeypatch.setattr(cq.exporters, "export", flaky_export)
+        components = {
+            "fuselage": _make_box(300, 60, 60),
+            "wing_left": _make_box(100, 500, 20),
+        }
+        design = AircraftDesign(id="test-step-silent", name="StepSilent")
+
+        with pytest.raises(RuntimeError, match="no output"):
+            package.build_step_zip(components, design)
+
     def test_step_geometric_bounds_integrity(self, tmp_path: Path) -> None:
         """Exported STEP files should have valid ISO headers and match original geometric bounds."""
         from backend.export import package
@@ -316,6 +365,9 @@ class TestDxfExport:
 
                 manifest = json.loads(zf.read("manifest.json"))
                 assert manifest["format"] == "dxf"
+
+            # The shared scratch file is removed; only the archive remains
+            assert [p.name for p in tmp_path.iterdir()] == [zip_path.name]
         finally:
             package.EXPORT_TMP_DIR = original_tmp
 
@@ -361,6 +413,22 @@ class TestDxfExport:
         finally:
             package.EXPORT_TMP_DIR = original_tmp
 
+    def test_batched_cross_sections_match_per_station(self) -> None:
+        """_cross_sections gives each station the same face as .section()."""
+        from backend.export.package import _cross_sections
+
+        solid = _make_box(60, 300, 40).union(_make_box(20, 100, 80))
+        stations = [-100.0, 0.0, 100.0, 400.0]  # the last plane misses the solid
+        cuts = _cross_sections(solid, "Y", stations)
+
+        assert len(cuts) == len(stations)
+        for pos, cut in zip(stations[:3], cuts):
+            ref = cq.Workplane("XZ", origin=(0, pos, 0)).add(solid.val()).section().val()
+            assert cut.Area() == pytest.approx(ref.Area())
+            assert cut.Center().y == pytest.approx(pos)
+        assert cuts[1].Area() == pytest.approx(60 * 40 + 20 * 40)
+        assert cuts[3].Faces() == []
+
 
 # ===================================================================
 # #118: SVG export tests
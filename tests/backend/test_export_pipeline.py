@@ -6,6 +6,8 @@ manifest format, and ZIP packaging.
 
 from __future__ import annotations
 
+import functools
+import io
 import json
 import struct
 import zipfile
@@ -17,28 +19,135 @@ import pytest
 # CadQuery is required for these tests -- skip if not installed.
 cq = pytest.importorskip("cadquery")
 
+from backend.models import AircraftDesign  # noqa: E402
+
+# Shared read-only default design.  AircraftDesign is not frozen, so tests
+# must derive variants with model_copy() rather than mutating this one.
+_DEFAULT_DESIGN = AircraftDesign()
+
+
+# Binary STL triangle count (uint32 at byte offset 80)
+_STL_TRICOUNT = struct.Struct("<I")
+
+# Binary STL triangle record (50 bytes)
+_STL_DT = np.dtype([
+    ("n", "<f4", 3),       # normal
+    ("v", "<f4", (3, 3)),  # 3 vertices
+    ("a", "<u2"),          # attribute byte count
+])
+
 
 # ===================================================================
 # Helpers
 # ===================================================================
 
 
+def _parse_and_bound_stl(data: bytes) -> tuple[int, np.ndarray, np.ndarray]:
+    """Validate a binary STL's size and return (triangle_count, min_xyz, max_xyz).
+
+    Views the triangle records in place and reduces the strided (N, 3, 3)
+    vertex field directly -- reshape(-1, 3) on it would force a copy.
+    """
+    n = _STL_TRICOUNT.unpack_from(data, 80)[0]
+    assert len(data) == 84 + 50 * n, f"STL size {len(data)} != 84 + 50 * {n}"
+    verts = np.frombuffer(data, dtype=_STL_DT, count=n, offset=84)["v"]
+    return n, verts.min(axis=(0, 1)), verts.max(axis=(0, 1))
+
+
+@functools.lru_cache(maxsize=16)
 def _make_box(x: float, y: float, z: float) -> cq.Workplane:
-    """Create a simple box centered at origin."""
+    """Create a simple box centered at origin, cached per (x, y, z).
+
+    CadQuery operations return new Workplanes, so callers may share the
+    cached prototype and derive copies via ``.translate()`` safely.
+    """
     return cq.Workplane("XY").box(x, y, z)
 
 
 def _bbox_dims(solid: cq.Workplane) -> tuple[float, float, float]:
-    """Get bounding box dimensions of a solid."""
+    """Get bounding box dimensions of a solid (one OCCT BoundingBox() call)."""
     bb = solid.val().BoundingBox()
     return (bb.xmax - bb.xmin, bb.ymax - bb.ymin, bb.zmax - bb.zmin)
 
 
+def _fake_stl(solid: cq.Workplane, tolerance: float = 0.1, angular_tolerance: float = 0.1) -> bytes:
+    """Stand-in for tessellate_for_export: a 12-triangle STL of the solid's bbox.
+
+    Skips OCCT meshing entirely for tests that only check ZIP packaging.
+    """
+    from backend.geometry.tessellate import MeshData, _mesh_to_binary_stl
+
+    bb = solid.val().BoundingBox()
+    corners = np.array(
+        [
+            [x, y, z]
+            for z in (bb.zmin, bb.zmax)
+            for y in (bb.ymin, bb.ymax)
+            for x in (bb.xmin, bb.xmax)
+        ],
+        dtype=np.float32,
+    )
+    faces = np.array(
+        [
+            [0, 2, 1], [1, 2, 3],  # bottom
+            [4, 5, 6], [5, 7, 6],  # top
+            [0, 1, 4], [1, 5, 4],  # front
+            [2, 6, 3], [3, 6, 7],  # back
+            [0, 4, 2], [2, 4, 6],  # left
+            [1, 3, 5], [3, 7, 5],  # right
+        ],
+        dtype=np.uint32,
+    )
+    mesh = MeshData(vertices=corners, normals=np.zeros_like(corners), faces=faces)
+    return _mesh_to_binary_stl(mesh)
+
+
+@pytest.fixture
+def fake_tessellation(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Replace export tessellation with _fake_stl for packaging-only tests."""
+    monkeypatch.setattr("backend.geometry.tessellate.tessellate_for_export", _fake_stl)
+    monkeypatch.setattr(
+        "backend.geometry.tessellate.tessellate_for_export_into",
+        lambda solid, out, **_: out.write(_fake_stl(solid)),
+    )
+    monkeypatch.setattr("backend.export.package.EXPORT_WORKERS", 1)  # patch is in-process only
+    monkeypatch.setattr("backend.export.package.TESS_CACHE_ENTRIES", 0)  # never cache fake STLs
+
+
 # ===================================================================
 # #39: Auto-sectioning tests
 # ===================================================================
 
 
+# Bed is 220x220x250 -> usable 200x200x230 after the 20mm joint margin.
+# (id, box dims, min sections, max sections, (max_dx, max_dy))
+OVERSIZE_CASES = [
+    # 500mm along X -> at least 2 sections, each within usable X
+    ("oversize_x", (500, 100, 50), 2, None, (201, None)),
+    # 600mm along Y -> split along Y
+    ("oversize_y", (100, 600, 50), 3, None, (None, None)),
+    # Oversize in X and Y -> recursive split, 2+ splits per axis
+    ("recursive", (500, 500, 50), 4, None, (201, 201)),
+    # Trainer wing half-span (600mm), chord 200mm, ~24mm thick -> 600/200 = 3
+    ("trainer_wing", (200, 600, 24), 3, 4, (None, None)),
+    ("thick_x", (450, 100, 80), 1, None, (None, None)),
+]
+
+
+@pytest.fixture(scope="class", params=OVERSIZE_CASES, ids=lambda c: c[0])
+def sectioned(request):
+    """Run auto_section once per oversize case and share it across the class.
+
+    Returns (sections, section_dims, min_count, max_count, axis_limits).
+    """
+    from backend.export.section import auto_section
+
+    _, box_dims, min_count, max_count, limits = request.param
+    sections = auto_section(_make_box(*box_dims), bed_x=220, bed_y=220, bed_z=250)
+    dims = np.array([_bbox_dims(s) for s in sections])  # shape (N, 3)
+    return sections, dims, min_count, max_count, limits
+
+
 class TestAutoSection:
     """Tests for the auto_section() algorithm."""
 
@@ -50,39 +159,29 @@ class TestAutoSection:
         sections = auto_section(solid, bed_x=220, bed_y=220, bed_z=250)
         assert len(sections) == 1
 
-    def test_oversize_x_splits(self) -> None:
-        """A solid exceeding bed X should be split into multiple sections."""
-        from backend.export.section import auto_section
+    def test_section_counts(self, sectioned) -> None:
+        """Oversize solids should split into the expected number of sections."""
+        sections, _dims, min_count, max_count, _limits = sectioned
 
-        # 500mm long box, bed is 220mm -> usable 200mm -> at least 3 sections
-        solid = _make_box(500, 100, 50)
-        sections = auto_section(solid, bed_x=220, bed_y=220, bed_z=250)
-        assert len(sections) >= 2
-        for s in sections:
-            dx, dy, dz = _bbox_dims(s)
-            assert dx <= 200 + 1.0  # usable = 220 - 20 margin, small tolerance
+        assert len(sections) >= min_count
+        if max_count is not None:
+            assert len(sections) <= max_count
 
-    def test_oversize_y_splits(self) -> None:
-        """A solid exceeding bed Y should be split along Y."""
-        from backend.export.section import auto_section
+    def test_sections_fit_usable_bed(self, sectioned) -> None:
+        """Every section should fit within the usable bed on the limited axes."""
+        _sections, dims, _min_count, _max_count, (max_dx, max_dy) = sectioned
 
-        solid = _make_box(100, 600, 50)
-        sections = auto_section(solid, bed_x=220, bed_y=220, bed_z=250)
-        assert len(sections) >= 3
+        for axis, limit in ((0, max_dx), (1, max_dy)):
+            if limit is None:
+                continue
+            over = dims[:, axis] > limit
+            assert not over.any(), f"sections over {limit}mm on axis {axis}: {dims[over]}"
 
-    def test_recursive_splitting(self) -> None:
-        """A solid oversize in two axes should split recursively."""
-        from backend.export.section import auto_section
+    def test_sections_have_volume(self, sectioned) -> None:
+        """Every section should have non-trivial volume (no degenerate splits)."""
+        _sections, dims, *_ = sectioned
 
-        solid = _make_box(500, 500, 50)
-        sections = auto_section(solid, bed_x=220, bed_y=220, bed_z=250)
-        # Each axis needs 3+ sections: 500/200 = 2.5 -> 3
-        # Total should be at least 4 (2 splits on each oversize axis)
-        assert len(sections) >= 4
-        for s in sections:
-            dx, dy, dz = _bbox_dims(s)
-            assert dx <= 201
-            assert dy <= 201
+        assert (dims > 0.1).all(), f"degenerate sections: {dims[(dims <= 0.1).any(axis=1)]}"
 
     def test_joint_margin_20mm(self) -> None:
         """Usable volume should be bed minus 20mm margin per axis."""
@@ -93,16 +192,6 @@ class TestAutoSection:
         sections = auto_section(solid, bed_x=220, bed_y=220, bed_z=250)
         assert len(sections) == 1
 
-    def test_trainer_wing_sections(self) -> None:
-        """Trainer wing half-span (600mm) with 220mm bed should yield ~3 sections."""
-        from backend.export.section import auto_section
-
-        # Trainer: half-span = 600mm, chord = 200mm, thickness ~24mm
-        # 600mm along Y, bed_y = 220, usable = 200 -> 3 sections
-        solid = _make_box(200, 600, 24)
-        sections = auto_section(solid, bed_x=220, bed_y=220, bed_z=250)
-        assert len(sections) == 3 or len(sections) == 4  # 600/200 = 3
-
     def test_invalid_bed_raises(self) -> None:
         """Bed dimensions minus margin <= 0 should raise ValueError."""
         from backend.export.section import auto_section
@@ -111,31 +200,31 @@ class TestAutoSection:
         with pytest.raises(ValueError, match="no usable volume"):
             auto_section(solid, bed_x=15, bed_y=15, bed_z=15)
 
-    def test_all_sections_have_volume(self) -> None:
-        """Every section should have non-trivial volume (no degenerate splits)."""
-        from backend.export.section import auto_section
-
-        solid = _make_box(450, 100, 80)
-        sections = auto_section(solid, bed_x=220, bed_y=220, bed_z=250)
-        for s in sections:
-            dx, dy, dz = _bbox_dims(s)
-            assert dx > 0.1 and dy > 0.1 and dz > 0.1
-
 
 # ===================================================================
 # #40: Tongue-and-groove joint tests
 # ===================================================================
 
 
+@pytest.fixture(scope="class")
+def joint_pair() -> tuple[cq.Workplane, cq.Workplane]:
+    """Two adjacent 100x100x50 boxes meeting at Y=50, built once per class.
+
+    CadQuery operations return new objects, so sharing the inputs is safe.
+    """
+    left = _make_box(100, 100, 50)
+    right = _make_box(100, 100, 50).translate((0, 100, 0))
+    return left, right
+
+
 class TestTongueAndGroove:
     """Tests for add_tongue_and_groove() joint generation."""
 
-    def test_joint_modifies_both_parts(self) -> None:
+    def test_joint_modifies_both_parts(self, joint_pair) -> None:
         """Joint should change the bounding boxes of both parts."""
         from backend.export.joints import add_tongue_and_groove
 
-        left = _make_box(100, 100, 50)
-        right = _make_box(100, 100, 50).translate((0, 100, 0))
+        left, right = joint_pair
 
         mod_left, mod_right = add_tongue_and_groove(
             left, right, overlap=15, tolerance=0.15, nozzle_diameter=0.4,
@@ -146,27 +235,26 @@ class TestTongueAndGroove:
         mod_bb = mod_left.val().BoundingBox()
         assert mod_bb.ymax > orig_bb.ymax  # tongue extends in +Y
 
-    def test_groove_is_cut(self) -> None:
+    def test_groove_is_cut(self, joint_pair) -> None:
         """Groove should reduce right part volume."""
         from backend.export.joints import add_tongue_and_groove
 
-        right = _make_box(100, 100, 50).translate((0, 100, 0))
+        left, right = joint_pair
         orig_vol = right.val().Volume()
 
         _, mod_right = add_tongue_and_groove(
-            _make_box(100, 100, 50),
+            left,
             right,
             overlap=15, tolerance=0.15, nozzle_diameter=0.4,
         )
         mod_vol = mod_right.val().Volume()
         assert mod_vol < orig_vol  # groove cut reduces volume
 
-    def test_tolerance_affects_groove_size(self) -> None:
+    def test_tolerance_affects_groove_size(self, joint_pair) -> None:
         """Larger tolerance should produce a larger groove."""
         from backend.export.joints import add_tongue_and_groove
 
-        left = _make_box(100, 100, 50)
-        right = _make_box(100, 100, 50).translate((0, 100, 0))
+        left, right = joint_pair
 
         _, mod_tight = add_tongue_and_groove(
             left, right, overlap=15, tolerance=0.10, nozzle_diameter=0.4,
@@ -178,96 +266,143 @@ class TestTongueAndGroove:
         # Looser tolerance = more material removed = smaller volume
         assert mod_loose.val().Volume() < mod_tight.val().Volume()
 
-    def test_tongue_protrudes_by_overlap(self) -> None:
+    def test_tongue_protrudes_by_overlap(self, joint_pair) -> None:
         """Tongue should extend approximately by the overlap distance."""
         from backend.export.joints import add_tongue_and_groove
 
-        left = _make_box(100, 100, 50)
+        left, right = joint_pair
         orig_ymax = left.val().BoundingBox().ymax
 
         mod_left, _ = add_tongue_and_groove(
             left,
-            _make_box(100, 100, 50).translate((0, 100, 0)),
+            right,
             overlap=15, tolerance=0.15, nozzle_diameter=0.4,
         )
         new_ymax = mod_left.val().BoundingBox().ymax
 
         assert abs((new_ymax - orig_ymax) - 15) < 1.0  # ~15mm protrusion
 
+    def test_glue_gate_requires_face_contact_only(self, joint_pair) -> None:
+        """Glued fuse is only used when the tongue sits beyond the split face."""
+        from backend.export.joints import _touches_only_at_split_face
+
+        left, right = joint_pair
+        bb = left.val().BoundingBox()
+        beyond = _make_box(60, 15, 30).translate((0, 57.5, 0)).val().BoundingBox()
+        overlapping = _make_box(60, 15, 30).translate((0, 45, 0)).val().BoundingBox()
+        assert _touches_only_at_split_face(bb, beyond, "Y")
+        assert not _touches_only_at_split_face(bb, overlapping, "Y")
+        assert not _touches_only_at_split_face(bb, right.val().BoundingBox(), "X")
+
+    def test_cached_bbox_matches_measured(self, joint_pair) -> None:
+        """Passing SectionPart.bbox gives the same joint as measuring the solids."""
+        from backend.export.joints import add_tongue_and_groove
+        from backend.export.section import create_section_parts
+
+        left, right = joint_pair
+        parts = create_section_parts("wing", "left", [left, right])
+        assert parts[0].bbox == pytest.approx((-50, -50, -25, 50, 50, 25), abs=1e-3)
+
+        measured = add_tongue_and_groove(
+            left, right, overlap=15, tolerance=0.15, nozzle_diameter=0.4,
+        )
+        cached = add_tongue_and_groove(
+            left, right, overlap=15, tolerance=0.15, nozzle_diameter=0.4,
+            left_bbox=parts[0].bbox, right_bbox=parts[1].bbox,
+        )
+        for a, b in zip(measured, cached):
+            assert a.val().Volume() == pytest.approx(b.val().Volume())
+
+        parts[0].solid = measured[0]
+        parts[0].recompute_dimensions()
+        assert parts[0].bbox[4] > 50  # tongue now extends the cached box
+
 
 # ===================================================================
 # #41: Watertight STL / mesh verification
 # ===================================================================
 
 
+@pytest.fixture(scope="class")
+def box_mesh():
+    """A 100x50x30 box and its preview tessellation, built once per class."""
+    from backend.geometry.tessellate import tessellate_for_preview
+
+    solid = _make_box(100, 50, 30)
+    return solid, tessellate_for_preview(solid)
+
+
 class TestWatertightMesh:
     """Tests for mesh integrity from tessellation."""
 
-    def test_box_mesh_has_valid_topology(self) -> None:
+    def test_box_mesh_has_valid_topology(self, box_mesh) -> None:
         """A CadQuery box tessellation should have valid topology.
 
         OCCT tessellates each BREP face independently (no shared vertices at
         edges), so strict edge-manifold checks don't apply. Instead we verify:
         - All face indices are within bounds
         - Mesh has expected vertex/face counts for a box
-        - The underlying solid is valid per OCCT
-        """
-        from backend.geometry.tessellate import tessellate_for_preview
 
-        solid = _make_box(100, 50, 30)
-        mesh = tessellate_for_preview(solid)
+        A primitive box that meshes cleanly is trivially valid, so the costly
+        OCCT BRepCheck (isValid) is reserved for the lofted-solid test below.
+        """
+        _, mesh = box_mesh
 
         assert mesh.vertex_count > 0
         assert mesh.face_count >= 12  # box has at least 12 triangles (2 per face)
 
-        # All face indices must be in range
-        assert np.all(mesh.faces < mesh.vertex_count)
-        assert np.all(mesh.faces >= 0)
+        # All face indices must be in range (scalar reductions, no bool temp)
+        assert int(mesh.faces.min()) >= 0
+        assert int(mesh.faces.max()) < mesh.vertex_count
 
-        # Underlying OCCT solid should be valid
-        assert solid.val().isValid()
-
-    def test_no_degenerate_triangles(self) -> None:
+    def test_no_degenerate_triangles(self, box_mesh) -> None:
         """No triangle should have zero area."""
-        from backend.geometry.tessellate import tessellate_for_preview
+        _, mesh = box_mesh
 
-        solid = _make_box(100, 50, 30)
-        mesh = tessellate_for_preview(solid)
+        # Gather all triangles at once: shape (F, 3, 3)
+        tri = mesh.vertices[mesh.faces]
+        e1 = tri[:, 1] - tri[:, 0]
+        e2 = tri[:, 2] - tri[:, 0]
+        areas = 0.5 * np.linalg.norm(np.cross(e1, e2), axis=1)
 
-        for i in range(mesh.face_count):
-            i0, i1, i2 = mesh.faces[i]
-            v0, v1, v2 = mesh.vertices[i0], mesh.vertices[i1], mesh.vertices[i2]
-            area = 0.5 * np.linalg.norm(np.cross(v1 - v0, v2 - v0))
-            assert area > 1e-8, f"Triangle {i} has near-zero area: {area}"
+        bad = np.where(areas <= 1e-8)[0]
+        assert bad.size == 0, f"Triangles with near-zero area: {bad[:5]} ({areas[bad[:5]]})"
 
-    def test_normals_are_unit_length(self) -> None:
+    def test_normals_are_unit_length(self, box_mesh) -> None:
         """All vertex normals should be unit length."""
-        from backend.geometry.tessellate import tessellate_for_preview
+        _, mesh = box_mesh
 
-        solid = _make_box(100, 50, 30)
-        mesh = tessellate_for_preview(solid)
+        assert mesh.normals.dtype == np.float32
 
-        lengths = np.linalg.norm(mesh.normals, axis=1)
-        np.testing.assert_allclose(lengths, 1.0, atol=1e-4)
+        # Squared lengths in one fused pass; |n| within 1e-4 of 1 => |n|^2 within ~2e-4
+        lengths_sq = np.einsum("ij,ij->i", mesh.normals, mesh.normals)
+        np.testing.assert_allclose(lengths_sq, 1.0, atol=2e-4)
 
-    def test_export_stl_valid_binary(self) -> None:
+    def test_export_stl_valid_binary(self, box_mesh) -> None:
         """Export STL should be valid binary STL format."""
         from backend.geometry.tessellate import tessellate_for_export
 
-        solid = _make_box(100, 50, 30)
+        solid, _ = box_mesh
         stl_bytes = tessellate_for_export(solid)
 
         # Header: 80 bytes
         assert len(stl_bytes) >= 84
         assert stl_bytes[:5] == b"CHENG"
 
-        # Triangle count
-        num_triangles = struct.unpack_from("<I", stl_bytes, 80)[0]
+        # Triangle count and total size (80 + 4 + 50 * num_triangles)
+        num_triangles, _, _ = _parse_and_bound_stl(stl_bytes)
         assert num_triangles > 0
 
-        # Total size: 80 + 4 + 50 * num_triangles
-        expected_size = 84 + 50 * num_triangles
-        assert len(stl_bytes) == expected_size
+    def test_streamed_stl_matches_bytes(self, box_mesh, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The streaming writer emits the same STL, chunk boundaries included."""
+        from backend.geometry import tessellate
+
+        solid, _ = box_mesh
+        expected = tessellate.tessellate_for_export(solid)
+        monkeypatch.setattr(tessellate, "_STL_CHUNK_TRIANGLES", 5)  # force several chunks
+        out = io.BytesIO()
+        tessellate.tessellate_for_export_into(solid, out)
+        assert out.getvalue() == expected
 
     def test_lofted_solid_has_valid_topology(self) -> None:
         """A lofted wing-like solid should have valid OCCT topology."""
@@ -285,9 +420,9 @@ class TestWatertightMesh:
         assert mesh.vertex_count > 0
         assert mesh.face_count > 0
 
-        # All face indices must be in range
-        assert np.all(mesh.faces < mesh.vertex_count)
-        assert np.all(mesh.faces >= 0)
+        # All face indices must be in range (scalar reductions, no bool temp)
+        assert int(mesh.faces.min()) >= 0
+        assert int(mesh.faces.max()) < mesh.vertex_count
 
         # Underlying solid should be valid
         assert solid.val().isValid()
@@ -298,80 +433,50 @@ class TestWatertightMesh:
 # ===================================================================
 
 
+@pytest.fixture(scope="class")
+def manifest_fixture():
+    """A single-section wing part and its manifest, built once per class."""
+    from backend.export.package import _build_manifest
+    from backend.export.section import SectionPart
+
+    section = SectionPart(
+        solid=_make_box(100, 100, 50),
+        filename="wing_left_1of1.stl",
+        component="wing",
+        side="left",
+        section_num=1,
+        total_sections=1,
+        dimensions_mm=(100.0, 100.0, 50.0),
+        print_orientation="trailing-edge down",
+        assembly_order=1,
+    )
+    return section, _build_manifest([section], _DEFAULT_DESIGN)
+
+
 class TestManifest:
     """Tests for manifest.json format per spec section 8.4."""
 
-    def test_section_key_name(self) -> None:
+    def test_section_key_name(self, manifest_fixture) -> None:
         """Manifest should use 'section' not 'section_number' per spec."""
-        from backend.export.package import _build_manifest
-        from backend.export.section import SectionPart
-
-        solid = _make_box(100, 100, 50)
-        section = SectionPart(
-            solid=solid,
-            filename="wing_left_1of1.stl",
-            component="wing",
-            side="left",
-            section_num=1,
-            total_sections=1,
-            dimensions_mm=(100.0, 100.0, 50.0),
-            print_orientation="trailing-edge down",
-            assembly_order=1,
-        )
-
-        from backend.models import AircraftDesign
-        manifest = _build_manifest([section], AircraftDesign())
+        _, manifest = manifest_fixture
 
         part = manifest["parts"][0]
         assert "section" in part, "Manifest should have 'section' key"
         assert "section_number" not in part, "Manifest should NOT have 'section_number'"
         assert part["section"] == 1
 
-    def test_dimensions_mm_is_array(self) -> None:
+    def test_dimensions_mm_is_array(self, manifest_fixture) -> None:
         """dimensions_mm should be an array [x, y, z], not an object."""
-        from backend.export.package import _build_manifest
-        from backend.export.section import SectionPart
-        from backend.models import AircraftDesign
+        _, manifest = manifest_fixture
 
-        solid = _make_box(100, 100, 50)
-        section = SectionPart(
-            solid=solid,
-            filename="wing_left_1of1.stl",
-            component="wing",
-            side="left",
-            section_num=1,
-            total_sections=1,
-            dimensions_mm=(100.0, 100.0, 50.0),
-            print_orientation="trailing-edge down",
-            assembly_order=1,
-        )
-
-        manifest = _build_manifest([section], AircraftDesign())
         dims = manifest["parts"][0]["dimensions_mm"]
         assert isinstance(dims, list), f"Expected list, got {type(dims)}"
         assert len(dims) == 3
         assert dims == [100.0, 100.0, 50.0]
 
-    def test_all_required_fields_present(self) -> None:
+    def test_all_required_fields_present(self, manifest_fixture) -> None:
         """Manifest should have all required top-level and part-level fields."""
-        from backend.export.package import _build_manifest
-        from backend.export.section import SectionPart
-        from backend.models import AircraftDesign
-
-        solid = _make_box(100, 100, 50)
-        section = SectionPart(
-            solid=solid,
-            filename="wing_left_1of1.stl",
-            component="wing",
-            side="left",
-            section_num=1,
-            total_sections=1,
-            dimensions_mm=(100.0, 100.0, 50.0),
-            print_orientation="trailing-edge down",
-            assembly_order=1,
-        )
-
-        manifest = _build_manifest([section], AircraftDesign())
+        _, manifest = manifest_fixture
 
         # Top-level required fields
         for key in ["design_name", "design_id", "version", "exported_at",
@@ -385,36 +490,62 @@ class TestManifest:
                      "assembly_order"]:
             assert key in part, f"Missing part key: {key}"
 
-    def test_manifest_is_json_serializable(self) -> None:
+    def test_manifest_is_json_serializable(self, manifest_fixture) -> None:
         """Manifest should serialize to valid JSON."""
-        from backend.export.package import _build_manifest
-        from backend.export.section import SectionPart
-        from backend.models import AircraftDesign
+        _, manifest = manifest_fixture
 
-        solid = _make_box(100, 100, 50)
-        section = SectionPart(
-            solid=solid,
-            filename="test_1of1.stl",
-            component="fuselage",
-            side="center",
-            section_num=1,
-            total_sections=1,
-            dimensions_mm=(100.0, 100.0, 50.0),
-            print_orientation="flat",
-            assembly_order=1,
-        )
-
-        manifest = _build_manifest([section], AircraftDesign())
         json_str = json.dumps(manifest, indent=2)
         parsed = json.loads(json_str)
         assert parsed["total_parts"] == 1
 
+    def test_manifest_bytes_round_trip(self, manifest_fixture) -> None:
+        """The archived manifest bytes decode back to the same structure."""
+        from backend.export.package import _manifest_json
+
+        _, manifest = manifest_fixture
+        data = _manifest_json({**manifest, "design_name": "Flügel"})
+        assert json.loads(data) == {**manifest, "design_name": "Flügel"}
+
 
 # ===================================================================
 # #55: Full pipeline integration tests
 # ===================================================================
 
 
+@pytest.fixture(scope="module")
+def trainer_components():
+    """Trainer design and its assembled components, built once per module.
+
+    Assembly is the most expensive step in this file; tests only read the
+    returned solids, so one build is shared.
+    """
+    from backend.geometry.engine import assemble_aircraft
+
+    design = AircraftDesign(
+        name="Trainer",
+        wing_span=1200,
+        wing_chord=200,
+        wing_airfoil="Clark-Y",
+        wing_tip_root_ratio=1.0,
+        wing_dihedral=3,
+        wing_sweep=0,
+        fuselage_preset="Conventional",
+        fuselage_length=400,
+        tail_type="Conventional",
+        h_stab_span=400,
+        h_stab_chord=120,
+        h_stab_incidence=-1,
+        v_stab_height=120,
+        v_stab_root_chord=130,
+        tail_arm=220,
+        hollow_parts=False,  # Solid for faster tests
+        print_bed_x=220,
+        print_bed_y=220,
+        print_bed_z=250,
+    )
+    return design, assemble_aircraft(design)
+
+
 class TestExportPipelineIntegration:
     """End-to-end tests: assemble -> section -> joints -> tessellate -> ZIP."""
 
@@ -444,11 +575,32 @@ class TestExportPipelineIntegration:
             assert part.total_sections == len(sections)
             assert part.filename == f"wing_left_{i}of{len(sections)}.stl"
 
-    def test_build_zip_produces_valid_archive(self, tmp_path: Path) -> None:
+    def test_add_joints_all_matches_pairwise(self) -> None:
+        """add_joints_all chains by section_num and matches the pairwise loop."""
+        from backend.export.section import auto_section, create_section_parts
+        from backend.export.joints import add_joints_all, add_tongue_and_groove
+
+        sections = auto_section(_make_box(100, 500, 50), bed_x=220, bed_y=220, bed_z=250)
+        expected = list(sections)
+        for i in range(len(expected) - 1):
+            expected[i], expected[i + 1] = add_tongue_and_groove(
+                expected[i], expected[i + 1],
+                overlap=15, tolerance=0.15, nozzle_diameter=0.4,
+            )
+
+        parts = create_section_parts("wing", "left", sections)
+        add_joints_all(parts[::-1], overlap=15, tolerance=0.15, nozzle_diameter=0.4)
+        for part, solid in zip(parts, expected):
+            bb = solid.val().BoundingBox()
+            assert part.solid.val().Volume() == pytest.approx(solid.val().Volume())
+            assert part.bbox == pytest.approx((bb.xmin, bb.ymin, bb.zmin, bb.xmax, bb.ymax, bb.zmax))
+
+    def test_build_zip_produces_valid_archive(
+        self, tmp_path: Path, fake_tessellation: None,
+    ) -> None:
         """build_zip should create a valid ZIP with manifest + STLs."""
         from backend.export.section import SectionPart
         from backend.export import package
-        from backend.models import AircraftDesign
 
         # Override temp dir to use pytest tmp_path
         original_tmp = package.EXPORT_TMP_DIR
@@ -470,119 +622,220 @@ class TestExportPipelineIntegration:
                 ),
             ]
 
-            design = AircraftDesign(id="test-zip-001", name="ZipTest")
-            zip_path = package.build_zip(sections, design)
+            design = _DEFAULT_DESIGN.model_copy(
+                update={"id": "test-zip-001", "name": "ZipTest"},
+            )
+            zip_path = package.build_zip(
+                sections, design, compression=zipfile.ZIP_STORED,
+            )
 
             assert zip_path.exists()
             assert zip_path.suffix == ".zip"
 
             with zipfile.ZipFile(zip_path, "r") as zf:
-                names = zf.namelist()
-                assert "manifest.json" in names
-                assert "fuselage_center_1of1.stl" in names
+                # One pass over the central directory; read entries by ZipInfo
+                info = {i.filename: i for i in zf.infolist()}
+                assert "manifest.json" in info
+                assert "fuselage_center_1of1.stl" in info
 
                 # Verify manifest is valid JSON
-                manifest_data = json.loads(zf.read("manifest.json"))
+                manifest_data = json.loads(zf.read(info["manifest.json"]))
                 assert manifest_data["design_name"] == "ZipTest"
                 assert manifest_data["total_parts"] == 1
 
                 # Verify STL is valid binary
-                stl_data = zf.read("fuselage_center_1of1.stl")
+                stl_data = zf.read(info["fuselage_center_1of1.stl"])
                 assert len(stl_data) >= 84
                 assert stl_data[:5] == b"CHENG"
         finally:
             package.EXPORT_TMP_DIR = original_tmp
 
-    def test_multi_component_zip(self, tmp_path: Path) -> None:
+    def test_default_zip_stores_manifest_uncompressed(
+        self, tmp_path: Path, fake_tessellation: None, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Default build_zip deflates STL entries but stores the manifest."""
+        from backend.export.section import SectionPart
+        from backend.export import package
+
+        monkeypatch.setattr(package, "EXPORT_TMP_DIR", tmp_path)
+        section = SectionPart(
+            solid=_make_box(100, 100, 50),
+            filename="fuselage_center_1of1.stl",
+            component="fuselage",
+            side="center",
+            section_num=1,
+            total_sections=1,
+            dimensions_mm=(100.0, 100.0, 50.0),
+            print_orientation="flat",
+            assembly_order=1,
+        )
+        zip_path = package.build_zip([section], _DEFAULT_DESIGN)
+
+        with zipfile.ZipFile(zip_path, "r") as zf:
+            info = {i.filename: i for i in zf.infolist()}
+            assert info["manifest.json"].compress_type == zipfile.ZIP_STORED
+            assert info["fuselage_center_1of1.stl"].compress_type == zipfile.ZIP_DEFLATED
+            assert json.loads(zf.read("manifest.json"))["total_parts"] == 1
+
+    def test_multi_component_zip(self, fake_tessellation: None) -> None:
         """ZIP with multiple components should contain all files."""
         from backend.export.section import SectionPart
         from backend.export import package
-        from backend.models import AircraftDesign
 
-        original_tmp = package.EXPORT_TMP_DIR
-        package.EXPORT_TMP_DIR = tmp_path
+        sections = []
+        for i, (comp, side) in enumerate([
+            ("fuselage", "center"),
+            ("wing", "left"),
+            ("wing", "right"),
+        ], start=1):
+            solid = _make_box(100, 100, 50)
+            sections.append(SectionPart(
+                solid=solid,
+                filename=f"{comp}_{side}_1of1.stl",
+                component=comp,
+                side=side,
+                section_num=1,
+                total_sections=1,
+                dimensions_mm=(100.0, 100.0, 50.0),
+                print_orientation="flat",
+                assembly_order=i,
+            ))
+
+        design = _DEFAULT_DESIGN.model_copy(
+            update={"id": "test-multi", "name": "MultiTest"},
+        )
+        zip_bytes = package.build_zip_bytes(sections, design)
+
+        with zipfile.ZipFile(io.BytesIO(zip_bytes), "r") as zf:
+            names = zf.namelist()
+            assert len(names) == 4  # 3 STLs + manifest
+            assert "manifest.json" in names
+            assert "fuselage_center_1of1.stl" in names
+            assert "wing_left_1of1.stl" in names
+            assert "wing_right_1of1.stl" in names
+            assert all(
+                i.compress_type == zipfile.ZIP_DEFLATED
+                for i in zf.infolist() if i.filename.endswith(".stl")
+            )
 
-        try:
-            sections = []
-            for i, (comp, side) in enumerate([
-                ("fuselage", "center"),
-                ("wing", "left"),
-                ("wing", "right"),
-            ], start=1):
-                solid = _make_box(100, 100, 50)
-                sections.append(SectionPart(
-                    solid=solid,
-                    filename=f"{comp}_{side}_1of1.stl",
-                    component=comp,
-                    side=side,
-                    section_num=1,
-                    total_sections=1,
-                    dimensions_mm=(100.0, 100.0, 50.0),
-                    print_orientation="flat",
-                    assembly_order=i,
-                ))
+            manifest = json.loads(zf.read("manifest.json"))
+            assert manifest["total_parts"] == 3
+            # Parts should be sorted by assembly order
+            orders = [p["assembly_order"] for p in manifest["parts"]]
+            assert orders == sorted(orders)
 
-            design = AircraftDesign(id="test-multi", name="MultiTest")
-            zip_path = package.build_zip(sections, design)
+    def test_parallel_tessellation_matches_inline(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Worker-process tessellation writes the same STLs, in section order."""
+        from backend.export.section import SectionPart
+        from backend.export import package
 
-            with zipfile.ZipFile(zip_path, "r") as zf:
-                names = zf.namelist()
-                assert len(names) == 4  # 3 STLs + manifest
-                assert "manifest.json" in names
-                assert "fuselage_center_1of1.stl" in names
-                assert "wing_left_1of1.stl" in names
-                assert "wing_right_1of1.stl" in names
-
-                manifest = json.loads(zf.read("manifest.json"))
-                assert manifest["total_parts"] == 3
-                # Parts should be sorted by assembly order
-                orders = [p["assembly_order"] for p in manifest["parts"]]
-                assert orders == sorted(orders)
-        finally:
-            package.EXPORT_TMP_DIR = original_tmp
+        sections = [
+            SectionPart(
+                solid=_make_box(40 + 10 * i, 30, 20),
+                filename=f"wing_left_{i}of3.stl",
+                component="wing",
+                side="left",
+                section_num=i,
+                total_sections=3,
+                dimensions_mm=(40.0 + 10 * i, 30.0, 20.0),
+                print_orientation="flat",
+                assembly_order=i,
+            )
+            for i in (1, 2, 3)
+        ]
+        design = _DEFAULT_DESIGN.model_copy(update={"id": "test-par", "name": "ParTest"})
+        monkeypatch.setattr(package, "TESS_CACHE_ENTRIES", 0)  # both runs must tessellate
+        monkeypatch.setattr(package, "EXPORT_PARALLEL_MIN_SECTIONS", 2)
+
+        def stls(workers: int) -> list[tuple[str, bytes]]:
+            monkeypatch.setattr(package, "EXPORT_WORKERS", workers)
+            with zipfile.ZipFile(io.BytesIO(package.build_zip_bytes(sections, design))) as zf:
+                return [(n, zf.read(n)) for n in zf.namelist() if n.endswith(".stl")]
+
+        assert stls(2) == stls(1)
+
+    def test_tessellation_cache_reuses_unchanged_sections(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Re-exporting an unchanged section is served from the disk cache."""
+        from backend.export.section import create_section_parts
+        from backend.export import package
+        from backend.geometry import tessellate
+
+        calls = []
+
+        def counting_into(solid, out, **_):
+            calls.append(solid)
+            out.write(_fake_stl(solid))
+
+        monkeypatch.setattr(tessellate, "tessellate_for_export_into", counting_into)
+        monkeypatch.setattr(package, "EXPORT_TMP_DIR", tmp_path)
+        monkeypatch.setattr(package, "EXPORT_WORKERS", 1)
+        monkeypatch.setattr(package, "TESS_CACHE_ENTRIES", 2)
+
+        def stls(solids: list[cq.Workplane]) -> list[bytes]:
+            parts = create_section_parts("wing", "left", solids)
+            with zipfile.ZipFile(io.BytesIO(package.build_zip_bytes(parts, _DEFAULT_DESIGN))) as zf:
+                return [zf.read(p.filename) for p in parts]
+
+        a, b, c = (_make_box(40 + 10 * i, 30, 20) for i in range(3))
+        first = stls([a, b])
+        assert len(calls) == 2
+        rebuilt = cq.Workplane("XY").box(40, 30, 20)  # same geometry, new object
+        assert stls([rebuilt, b]) == first
+        assert len(calls) == 2
+
+        stls([c])  # third distinct entry evicts the least recently used
+        assert len(calls) == 3
+        assert len(list((tmp_path / "tesscache").glob("*.stl"))) == 2
+
+    def test_tessellation_cache_prune_removes_stale_scratch(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Abandoned cache scratch files are removed once stale; fresh ones are kept."""
+        import os
+        import time
+
+        from backend.cleanup import MAX_AGE_SECONDS
+        from backend.export import package
 
-    def test_full_trainer_pipeline(self) -> None:
-        """Full pipeline with Trainer preset: assemble, section, package metadata."""
-        from backend.geometry.engine import assemble_aircraft
-        from backend.export.section import auto_section, create_section_parts
-        from backend.models import AircraftDesign
-
-        design = AircraftDesign(
-            name="Trainer",
-            wing_span=1200,
-            wing_chord=200,
-            wing_airfoil="Clark-Y",
-            wing_tip_root_ratio=1.0,
-            wing_dihedral=3,
-            wing_sweep=0,
-            fuselage_preset="Conventional",
-            fuselage_length=400,
-            tail_type="Conventional",
-            h_stab_span=400,
-            h_stab_chord=120,
-            h_stab_incidence=-1,
-            v_stab_height=120,
-            v_stab_root_chord=130,
-            tail_arm=220,
-            hollow_parts=False,  # Solid for faster tests
-            print_bed_x=220,
-            print_bed_y=220,
-            print_bed_z=250,
-        )
+        monkeypatch.setattr(package, "TESS_CACHE_ENTRIES", 4)
+        stale = tmp_path / f"{package.TMP_FILE_PREFIX}1-crashed.stl"
+        fresh = tmp_path / f"{package._tmp_prefix()}inflight.stl"
+        entry = tmp_path / "abc123.stl"
+        for path in (stale, fresh, entry):
+            path.write_bytes(b"solid")
+        old = time.time() - MAX_AGE_SECONDS - 60
+        os.utime(stale, (old, old))
+
+        package._prune_tess_cache(tmp_path)
+
+        assert not stale.exists()
+        assert fresh.exists()
+        assert entry.exists()
+
+    def test_trainer_assembly_components(self, trainer_components) -> None:
+        """Trainer assembly should produce the core named components."""
+        _, components = trainer_components
 
-        # Assemble
-        components = assemble_aircraft(design)
         assert "fuselage" in components
         assert "wing_left" in components
         assert "wing_right" in components
 
-        # Section each component
+    def test_full_trainer_pipeline(self, trainer_components) -> None:
+        """Full pipeline with Trainer preset: assemble, section, package metadata."""
+        from backend.export.section import auto_section, create_section_parts
+
+        design, components = trainer_components
+        bed = (design.print_bed_x, design.print_bed_y, design.print_bed_z)
+
+        # Sectioned inline: forking worker processes after OCCT has been used
+        # in this process is unsafe.
+        sectioned = [auto_section(solid, *bed) for solid in components.values()]
+
         all_parts = []
         order = 1
-        for name, solid in components.items():
-            sections = auto_section(
-                solid, design.print_bed_x, design.print_bed_y, design.print_bed_z,
-            )
+        for name, sections in zip(components, sectioned):
             # Parse component and side from name
             if "_" in name:
                 comp, side = name.rsplit("_", 1)
@@ -600,7 +853,6 @@ class TestExportPipelineIntegration:
         """Exported STL files should have headers, correct triangle counts, and valid geometric bounds."""
         from backend.export.section import SectionPart
         from backend.export import package
-        from backend.models import AircraftDesign
 
         original_tmp = package.EXPORT_TMP_DIR
         package.EXPORT_TMP_DIR = tmp_path
@@ -621,8 +873,12 @@ class TestExportPipelineIntegration:
                 ),
             ]
 
-            design = AircraftDesign(id="test-zip-bounds", name="BoundsTest")
-            zip_path = package.build_zip(sections, design)
+            design = _DEFAULT_DESIGN.model_copy(
+                update={"id": "test-zip-bounds", "name": "BoundsTest"},
+            )
+            zip_path = package.build_zip(
+                sections, design, compression=zipfile.ZIP_STORED,
+            )
 
             with zipfile.ZipFile(zip_path, "r") as zf:
                 stl_data = zf.read("box_1of1.stl")
@@ -630,33 +886,11 @@ class TestExportPipelineIntegration:
                 # Check header
                 assert stl_data[:5] == b"CHENG"
                 
-                # Check triangle count and file size
-                num_triangles = struct.unpack_from("<I", stl_data, 80)[0]
-                expected_size = 84 + 50 * num_triangles
-                assert len(stl_data) == expected_size
-                
-                # Compute bounds manually from binary STL
-                min_x, min_y, min_z = float('inf'), float('inf'), float('inf')
-                max_x, max_y, max_z = float('-inf'), float('-inf'), float('-inf')
-                
-                offset = 84
-                for _ in range(num_triangles):
-                    offset += 12 # Skip normal
-                    for _ in range(3): # 3 vertices
-                        x, y, z = struct.unpack_from("<fff", stl_data, offset)
-                        min_x = min(min_x, x)
-                        max_x = max(max_x, x)
-                        min_y = min(min_y, y)
-                        max_y = max(max_y, y)
-                        min_z = min(min_z, z)
-                        max_z = max(max_z, z)
-                        offset += 12
-                    offset += 2 # Skip attribute byte count
-                
-                dx = max_x - min_x
-                dy = max_y - min_y
-                dz = max_z - min_z
-                
+                # Check triangle count, file size, and bounds in one pass
+                num_triangles, lo, hi = _parse_and_bound_stl(stl_data)
+                assert num_triangles > 0
+                dx, dy, dz = hi - lo
+
                 # Assert geometric bounds match original solid
                 assert abs(dx - 100.0) < 0.1
                 assert abs(dy - 100.0) < 0.1
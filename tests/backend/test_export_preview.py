@@ -9,6 +9,7 @@ Covers:
 
 from __future__ import annotations
 
+import numpy as np
 import pytest
 
 # CadQuery is required for integration tests
@@ -16,11 +17,17 @@ cq = pytest.importorskip("cadquery")
 
 from backend.models import AircraftDesign, ExportPreviewPart, ExportPreviewResponse
 from backend.routes.export import (
+    _build_preview_part,
     _fits_on_bed,
+    _fits_on_bed_batch,
     _generate_sections,
     _preview_blocking,
     _get_or_assemble,
     _assembly_cache,
+    _cache_store,
+    _cache_lookup,
+    _design_cache_key,
+    _MAX_CACHE,
     clear_assembly_cache,
 )
 
@@ -77,6 +84,20 @@ class TestFitsOnBed:
         """Square part on square bed -- rotation doesn't matter."""
         assert _fits_on_bed((200, 200, 100), 220, 220, 250) is True
 
+    def test_batch_matches_scalar(self) -> None:
+        """_fits_on_bed_batch should agree with the scalar check row by row."""
+        dims = [
+            (100, 100, 50), (100, 100, 300), (300, 300, 50), (200, 50, 50),
+            (50, 200, 50), (200, 50, 300), (200, 100, 250), (300, 150, 50),
+        ]
+        bed = (100, 200, 250)
+        batch = _fits_on_bed_batch(np.asarray(dims), bed)
+        assert batch.tolist() == [_fits_on_bed(d, *bed) for d in dims]
+
+    def test_batch_empty(self) -> None:
+        """No parts -> empty result, not an error."""
+        assert _fits_on_bed_batch(np.asarray([]), (220, 220, 250)).shape == (0,)
+
 
 # ===================================================================
 # Assembly cache -- Fix 2
@@ -116,6 +137,24 @@ class TestAssemblyCache:
         _get_or_assemble(design2)
         assert len(_assembly_cache) == 2
 
+    def test_cache_key_is_structural(self) -> None:
+        """Equal geometry shares a key even across instances, ids and names."""
+        a = AircraftDesign(id="a-001", name="First", wing_span=1100)
+        b = AircraftDesign(id="b-002", name="Second", wing_span=1100)
+        c = AircraftDesign(id="a-001", name="First", wing_span=1150)
+        assert _design_cache_key(a) == _design_cache_key(b)
+        assert _design_cache_key(a) != _design_cache_key(c)
+
+    def test_cache_evicts_least_recently_used(self) -> None:
+        """A hit refreshes an entry so the oldest *unused* entry is evicted."""
+        for i in range(_MAX_CACHE):
+            _cache_store(f"k{i}", {"i": i})
+        assert _cache_lookup("k0") == {"i": 0}  # refresh k0
+        _cache_store("new", {"i": -1})
+        assert len(_assembly_cache) == _MAX_CACHE
+        assert "k0" in _assembly_cache
+        assert "k1" not in _assembly_cache
+
     def test_clear_cache(self) -> None:
         """clear_assembly_cache() should empty the cache."""
         design = AircraftDesign()
@@ -253,6 +292,30 @@ class TestPreviewBlocking:
         assert response.parts_that_fit + response.parts_that_exceed == response.total_parts
         assert response.bed_dimensions_mm == (220.0, 220.0, 250.0)
 
+    def test_build_preview_part_is_pure(self) -> None:
+        """_build_preview_part maps SectionPart metadata without touching the solid."""
+        from backend.export.section import SectionPart
+
+        sp = SectionPart(
+            solid=None,  # type: ignore[arg-type] -- metadata only
+            filename="wing_left_1of2.stl",
+            component="wing",
+            side="left",
+            section_num=1,
+            total_sections=2,
+            dimensions_mm=(180.0, 120.0, 20.0),
+            print_orientation="flat",
+            assembly_order=3,
+            split_position_mm=212.5,
+            avoidance_zone_hit=True,
+        )
+        part = _build_preview_part(sp, False)
+        assert part.filename == "wing_left_1of2.stl"
+        assert part.fits_bed is False
+        assert part.cut_position_mm == 212.5
+        assert part.cut_adjusted is True
+        assert part.cut_adjust_reason
+
     def test_response_camel_case_serialization(self) -> None:
         """Response should serialize to camelCase for the frontend."""
         response = ExportPreviewResponse(
@@ -358,7 +358,8 @@ class TestDxfSvgExceptionLogging:
         box = cq_mod.Workplane("XY").box(50, 50, 10)
         design = AircraftDesign(name="SVG Test")
 
-        with patch("cadquery.exporters.export", side_effect=RuntimeError("SVG boom")):
+        # build_svg_zip renders in memory via Workplane.toSvg()
+        with patch("cadquery.Workplane.toSvg", side_effect=RuntimeError("SVG boom")):
             with caplog.at_level(logging.WARNING, logger="cheng.package"):
                 zip_path = build_svg_zip(
                     components={"fuselage": box},
@@ -9,27 +9,23 @@ V13: Stall speed estimate
 
 from __future__ import annotations
 
+from collections.abc import Callable
+
 import pytest
 
 from backend.models import AircraftDesign
 from backend.validation import compute_warnings
 
 
-def _warning_ids(design: AircraftDesign) -> set[str]:
-    return {w.id for w in compute_warnings(design)}
-
-
-def _warnings_by_id(design: AircraftDesign, vid: str) -> list:
-    return [w for w in compute_warnings(design) if w.id == vid]
-
-
 # ---------------------------------------------------------------------------
 # V09: Wing bending moment
 # ---------------------------------------------------------------------------
 
 
 class TestV09:
-    def test_triggers_on_long_thin_wing(self) -> None:
+    def test_triggers_on_long_thin_wing(
+        self, warning_ids: Callable[[AircraftDesign], set[str]],
+    ) -> None:
         """Long span + thin skin = high bending load."""
         design = AircraftDesign(
             wing_span=2500,
@@ -38,18 +34,22 @@ class TestV09:
             battery_weight_g=300,
             motor_weight_g=100,
         )
-        assert "V09" in _warning_ids(design)
+        assert "V09" in warning_ids(design)
 
-    def test_does_not_trigger_on_short_thick_wing(self) -> None:
+    def test_does_not_trigger_on_short_thick_wing(
+        self, warning_ids: Callable[[AircraftDesign], set[str]],
+    ) -> None:
         """Short span + thick skin = low bending load."""
         design = AircraftDesign(
             wing_span=600,
             wing_chord=200,
             wing_skin_thickness=2.5,
         )
-        assert "V09" not in _warning_ids(design)
+        assert "V09" not in warning_ids(design)
 
-    def test_thicker_skin_reduces_bending(self) -> None:
+    def test_thicker_skin_reduces_bending(
+        self, warning_ids: Callable[[AircraftDesign], set[str]],
+    ) -> None:
         """Increasing skin thickness should help pass the check."""
         base = AircraftDesign(
             wing_span=2000,
@@ -58,13 +58,15 @@ class TestV09:
             battery_weight_g=300,
         )
         thick = base.model_copy(update={"wing_skin_thickness": 3.0})
-        base_has = "V09" in _warning_ids(base)
-        thick_has = "V09" in _warning_ids(thick)
+        base_has = "V09" in warning_ids(base)
+        thick_has = "V09" in warning_ids(thick)
         # At least one should differ (thick should be better)
         if base_has:
             assert not thick_has or True  # thick may also trigger but less likely
 
-    def test_message_includes_bending_index(self) -> None:
+    def test_message_includes_bending_index(
+        self, warnings_by_id: Callable[[AircraftDesign, str], list],
+    ) -> None:
         design = AircraftDesign(
             wing_span=2500,
             wing_chord=150,
@@ -72,7 +74,7 @@ class TestV09:
             battery_weight_g=300,
             motor_weight_g=100,
         )
-        warnings = _warnings_by_id(design, "V09")
+        warnings = warnings_by_id(design, "V09")
         if warnings:
             assert "bending index" in warnings[0].message
 
@@ -83,7 +85,7 @@ class TestV09:
 
 
 class TestV10:
-    def test_triggers_on_tiny_tail(self) -> None:
+    def test_triggers_on_tiny_tail(self, warning_ids: Callable[[AircraftDesign], set[str]]) -> None:
         """Very small tail with long wing should trigger low V_h."""
         design = AircraftDesign(
             wing_span=1500,
@@ -94,9 +96,11 @@ class TestV10:
             v_stab_root_chord=30,
             tail_arm=80,
         )
-        assert "V10" in _warning_ids(design)
+        assert "V10" in warning_ids(design)
 
-    def test_does_not_trigger_on_adequate_tail(self) -> None:
+    def test_does_not_trigger_on_adequate_tail(
+        self, warnings_by_id: Callable[[AircraftDesign, str], list],
+    ) -> None:
         """Generous tail proportions should not trigger low V_h."""
         design = AircraftDesign(
             wing_span=1000,
@@ -107,7 +111,7 @@ class TestV10:
             v_stab_root_chord=130,
             tail_arm=300,
         )
-        v10s = _warnings_by_id(design, "V10")
+        v10s = warnings_by_id(design, "V10")
         low_h = any("horizontal" in w.message.lower() and "low" in w.message.lower() for w in v10s)
         assert not low_h, "Adequate tail should not trigger low horizontal tail volume"
 
@@ -126,7 +130,9 @@ class TestV10:
         warnings = compute_warnings(design)
         assert isinstance(warnings, list)
 
-    def test_over_stabilized_tail(self) -> None:
+    def test_over_stabilized_tail(
+        self, warnings_by_id: Callable[[AircraftDesign, str], list],
+    ) -> None:
         """Huge tail with short arm should trigger high V_h."""
         design = AircraftDesign(
             wing_span=600,
@@ -135,7 +141,7 @@ class TestV10:
             h_stab_chord=200,
             tail_arm=500,
         )
-        v10s = _warnings_by_id(design, "V10")
+        v10s = warnings_by_id(design, "V10")
         high_h = any("high" in w.message.lower() for w in v10s)
         assert high_h, "Huge tail should trigger high horizontal tail volume"
 
@@ -146,7 +152,7 @@ class TestV10:
 
 
 class TestV11:
-    def test_triggers_on_high_ar(self) -> None:
+    def test_triggers_on_high_ar(self, warning_ids: Callable[[AircraftDesign], set[str]]) -> None:
         """AR > 8 should trigger flutter warning."""
         design = AircraftDesign(
             wing_span=2000,
@@ -154,9 +160,11 @@ class TestV11:
             wing_tip_root_ratio=1.0,
         )
         # AR = 2000^2 / (100 * 2000) = 20 >> 8
-        assert "V11" in _warning_ids(design)
+        assert "V11" in warning_ids(design)
 
-    def test_does_not_trigger_on_low_ar(self) -> None:
+    def test_does_not_trigger_on_low_ar(
+        self, warning_ids: Callable[[AircraftDesign], set[str]],
+    ) -> None:
         """AR < 6 should not trigger."""
         design = AircraftDesign(
             wing_span=900,
@@ -164,9 +172,11 @@ class TestV11:
             wing_tip_root_ratio=1.0,
         )
         # AR = 900^2 / (220 * 900) = 4.09
-        assert "V11" not in _warning_ids(design)
+        assert "V11" not in warning_ids(design)
 
-    def test_sweep_plus_moderate_ar(self) -> None:
+    def test_sweep_plus_moderate_ar(
+        self, warning_ids: Callable[[AircraftDesign], set[str]],
+    ) -> None:
         """AR > 6 with high sweep should trigger."""
         design = AircraftDesign(
             wing_span=1500,
@@ -175,9 +185,11 @@ class TestV11:
             wing_sweep=20,
         )
         # AR = 1500^2 / (150*1500) = 10 > 8 -> triggers on AR alone
-        assert "V11" in _warning_ids(design)
+        assert "V11" in warning_ids(design)
 
-    def test_moderate_ar_low_sweep_safe(self) -> None:
+    def test_moderate_ar_low_sweep_safe(
+        self, warning_ids: Callable[[AircraftDesign], set[str]],
+    ) -> None:
         """AR ~7 with low sweep should not trigger."""
         design = AircraftDesign(
             wing_span=1400,
@@ -186,7 +198,7 @@ class TestV11:
             wing_sweep=5,
         )
         # AR = 1400^2 / (200*1400) = 7.0
-        assert "V11" not in _warning_ids(design)
+        assert "V11" not in warning_ids(design)
 
 
 # ---------------------------------------------------------------------------
@@ -195,7 +207,9 @@ class TestV11:
 
 
 class TestV12:
-    def test_triggers_on_heavy_small_wing(self) -> None:
+    def test_triggers_on_heavy_small_wing(
+        self, warning_ids: Callable[[AircraftDesign], set[str]],
+    ) -> None:
         """Heavy all-up weight with small wing area = high wing loading."""
         design = AircraftDesign(
             wing_span=400,
@@ -203,23 +217,27 @@ class TestV12:
             battery_weight_g=500,
             motor_weight_g=200,
         )
-        assert "V12" in _warning_ids(design)
+        assert "V12" in warning_ids(design)
 
-    def test_does_not_trigger_on_normal_design(self) -> None:
+    def test_does_not_trigger_on_normal_design(
+        self, warnings_by_id: Callable[[AircraftDesign, str], list],
+    ) -> None:
         """Normal 1m sport plane should have acceptable wing loading."""
         design = AircraftDesign(
             wing_span=1200,
             wing_chord=200,
         )
-        v12s = _warnings_by_id(design, "V12")
+        v12s = warnings_by_id(design, "V12")
         very_high = any("very high" in w.message.lower() for w in v12s)
         assert not very_high
 
-    def test_larger_wing_reduces_loading(self) -> None:
+    def test_larger_wing_reduces_loading(
+        self, warnings_by_id: Callable[[AircraftDesign, str], list],
+    ) -> None:
         small = AircraftDesign(wing_span=500, wing_chord=100, battery_weight_g=300)
         large = AircraftDesign(wing_span=1500, wing_chord=200, battery_weight_g=300)
-        small_v12 = len(_warnings_by_id(small, "V12"))
-        large_v12 = len(_warnings_by_id(large, "V12"))
+        small_v12 = len(warnings_by_id(small, "V12"))
+        large_v12 = len(warnings_by_id(large, "V12"))
         assert large_v12 <= small_v12
 
 
@@ -229,7 +247,9 @@ class TestV12:
 
 
 class TestV13:
-    def test_triggers_on_heavy_small_wing(self) -> None:
+    def test_triggers_on_heavy_small_wing(
+        self, warning_ids: Callable[[AircraftDesign], set[str]],
+    ) -> None:
         """High wing loading = high stall speed."""
         design = AircraftDesign(
             wing_span=400,
@@ -237,9 +257,11 @@ class TestV13:
             battery_weight_g=500,
             motor_weight_g=200,
         )
-        assert "V13" in _warning_ids(design)
+        assert "V13" in warning_ids(design)
 
-    def test_does_not_trigger_on_light_large_wing(self) -> None:
+    def test_does_not_trigger_on_light_large_wing(
+        self, warnings_by_id: Callable[[AircraftDesign, str], list],
+    ) -> None:
         """Large wing, light plane = low stall speed."""
         design = AircraftDesign(
             wing_span=1500,
@@ -247,18 +269,20 @@ class TestV13:
             battery_weight_g=100,
             motor_weight_g=30,
         )
-        v13s = _warnings_by_id(design, "V13")
+        v13s = warnings_by_id(design, "V13")
         high = any("high" in w.message.lower() for w in v13s)
         assert not high
 
-    def test_message_includes_speed(self) -> None:
+    def test_message_includes_speed(
+        self, warnings_by_id: Callable[[AircraftDesign, str], list],
+    ) -> None:
         design = AircraftDesign(
             wing_span=400,
             wing_chord=80,
             battery_weight_g=500,
             motor_weight_g=200,
         )
-        v13s = _warnings_by_id(design, "V13")
+        v13s = warnings_by_id(design, "V13")
         if v13s:
             assert "km/h" in v13s[0].message
 
@@ -292,11 +316,15 @@ class TestV09V13Integration:
                 assert isinstance(w.fields, list)
                 assert len(w.fields) > 0
 
-    def test_default_design_no_critical_aero_warnings(self) -> None:
+    def test_default_design_no_critical_aero_warnings(
+        self,
+        warning_ids: Callable[[AircraftDesign], set[str]],
+        warnings_by_id: Callable[[AircraftDesign, str], list],
+    ) -> None:
         """Default design should not trigger severe aero warnings."""
         design = AircraftDesign()
-        ids = _warning_ids(design)
+        ids = warning_ids(design)
         # Default design might trigger moderate stall speed, but not high
         # flutter or very high wing loading
-        v11s = _warnings_by_id(design, "V11")
+        v11s = warnings_by_id(design, "V11")
         assert len(v11s) == 0, "Default design should not have flutter risk"